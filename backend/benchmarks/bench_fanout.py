@@ -0,0 +1,119 @@
+"""Fan-out cost of the notification hub behind /api/realtime/stream.
+
+Opens --connections subscriptions (each drained by its own task, as an SSE
+response would be) and measures:
+  * memory per connection
+  * broadcast: one event published for every connected user
+  * hot user: one event delivered to --hot-connections sessions of a single user
+Latency is publish-to-dequeue inside the event loop, i.e. the cost the hub adds
+before the ASGI server writes the frame.
+
+Usage:
+    python benchmarks/bench_fanout.py [--connections 10000] [--rounds 20] [--hot-connections 1000]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from contextlib import ExitStack
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from thriveremote.notifications import NotificationHub, make_notification  # noqa: E402
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def drain(subscription, received, expected, done):
+    while True:
+        await subscription.queue.get()
+        received.append(time.perf_counter())
+        if len(received) >= expected[0]:
+            done.set()
+
+async def run_round(hub, user_ids, expected_deliveries, received, expected, done):
+    received.clear()
+    done.clear()
+    expected[0] = expected_deliveries
+    notification = make_notification("bench", "info", "Benchmark", "fan-out round")
+    started = time.perf_counter()
+    for user_id in user_ids:
+        hub.notify(user_id, notification)
+    published = time.perf_counter()
+    await done.wait()
+    latencies = [(stamp - started) * 1000 for stamp in received]
+    return (published - started) * 1000, latencies
+
+async def measure(hub, user_ids, connections_per_user, rounds):
+    received, expected, done = [], [0], asyncio.Event()
+    with ExitStack() as stack:
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        subscriptions = [
+            stack.enter_context(hub.subscribe(user_id))
+            for user_id in user_ids for _ in range(connections_per_user)
+        ]
+        tasks = [asyncio.create_task(drain(sub, received, expected, done)) for sub in subscriptions]
+        await asyncio.sleep(0)
+        per_connection = (tracemalloc.get_traced_memory()[0] - before) / len(subscriptions)
+        tracemalloc.stop()
+
+        publish_ms, round_ms, latencies = [], [], []
+        for _ in range(rounds):
+            publish, round_latencies = await run_round(
+                hub, user_ids, len(subscriptions), received, expected, done
+            )
+            publish_ms.append(publish)
+            round_ms.append(max(round_latencies))
+            latencies.extend(round_latencies)
+
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return {
+        "connections": len(subscriptions),
+        "bytes_per_connection": round(per_connection),
+        "publish_ms": round(statistics.median(publish_ms), 2),
+        "round_ms": round(statistics.median(round_ms), 2),
+        "deliveries_per_s": round(len(subscriptions) / (statistics.median(round_ms) / 1000)),
+        "latency_p50_ms": round(percentile(latencies, 50), 2),
+        "latency_p99_ms": round(percentile(latencies, 99), 2)
+    }
+
+async def main_async(args):
+    idle = NotificationHub()
+    started = time.perf_counter()
+    for i in range(args.connections):
+        idle.notify(f"idle-{i}", make_notification("bench", "info", "Benchmark", "nobody listening"))
+    idle_us = (time.perf_counter() - started) * 1e6 / args.connections
+
+    broadcast = await measure(
+        NotificationHub(), [f"user-{i}" for i in range(args.connections)], 1, args.rounds
+    )
+    hot = await measure(NotificationHub(), ["hot-user"], args.hot_connections, args.rounds)
+
+    print(f"publish with no subscribers: {idle_us:.2f} us/event (no queries, no encoding)")
+    print(f"{'scenario':<12}{'conns':>8}{'B/conn':>8}{'publish ms':>12}{'round ms':>10}"
+          f"{'deliv/s':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    for name, result in (("broadcast", broadcast), ("hot user", hot)):
+        print(
+            f"{name:<12}{result['connections']:>8}{result['bytes_per_connection']:>8}{result['publish_ms']:>12}"
+            f"{result['round_ms']:>10}{result['deliveries_per_s']:>10}{result['latency_p50_ms']:>9}"
+            f"{result['latency_p99_ms']:>9}"
+        )
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connections", type=int, default=10000)
+    parser.add_argument("--hot-connections", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+if __name__ == "__main__":
+    main()
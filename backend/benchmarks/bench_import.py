@@ -0,0 +1,120 @@
+"""Measure import-time cost and per-worker memory of the API modules.
+
+Each target is imported in a fresh interpreter under `python -X importtime`.
+The benchmark reports wall time, import cost per top-level package, RSS after
+import, and the private memory a forked worker ends up with once it has
+touched the inherited heap (gc.collect() walks every object and breaks
+copy-on-write sharing, as a long-running worker eventually does).
+
+Usage:
+    python benchmarks/bench_import.py [--target server] [--target thriveremote.app]
+                                      [--baseline-rev HEAD~1] [--top 8]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r'''
+import gc, json, os, sys, time
+sys.path.insert(0, {path!r})
+
+def memory_kb(field):
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            for line in f:
+                if line.startswith(field + ":"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+start = time.perf_counter()
+module = __import__({module!r}, fromlist=["_"])
+if {build!r} and hasattr(module, "create_app") and not hasattr(module, "app"):
+    module.create_app()
+import_ms = (time.perf_counter() - start) * 1000
+result = {{"import_ms": round(import_ms, 1), "rss_kb": memory_kb("Rss"), "modules": len(sys.modules)}}
+
+read_fd, write_fd = os.pipe()
+pid = os.fork() if hasattr(os, "fork") else -1
+if pid == 0:
+    os.close(read_fd)
+    gc.collect()
+    os.write(write_fd, str(memory_kb("Private_Dirty")).encode())
+    os._exit(0)
+if pid > 0:
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    result["fork_private_kb"] = int(os.read(read_fd, 64) or 0)
+print("RESULT " + json.dumps(result), flush=True)
+'''
+
+def parse_importtime(stderr: str):
+    """Self import time in ms summed per top-level package"""
+    totals = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # "import time: <self us> | <cumulative us> | <two spaces per nesting level><name>"
+        self_us, _, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".", 1)[0]
+        totals[package] = totals.get(package, 0) + int(self_us) / 1000
+    return totals
+
+def run_probe(module: str, path: str, build: bool):
+    env = dict(os.environ)
+    # Resolve lazily opened resources to nothing reachable so imports never block on I/O
+    env.setdefault("MONGO_URL", "mongodb://127.0.0.1:1/?serverSelectionTimeoutMS=100")
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE.format(path=path, module=module, build=build)],
+        capture_output=True, text=True, env=env, cwd=path
+    )
+    result_line = next((line for line in proc.stdout.splitlines() if line.startswith("RESULT ")), None)
+    if result_line is None:
+        raise RuntimeError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+    result = json.loads(result_line[len("RESULT "):])
+    result["packages"] = parse_importtime(proc.stderr)
+    return result
+
+def checkout_baseline(rev: str) -> str:
+    """Materialize backend/ at a git revision in a temp dir"""
+    target = tempfile.mkdtemp(prefix="bench_import_")
+    archive = subprocess.run(
+        ["git", "archive", rev, "backend"], cwd=os.path.dirname(BACKEND_DIR), capture_output=True, check=True
+    ).stdout
+    subprocess.run(["tar", "-x", "-C", target], input=archive, check=True)
+    return os.path.join(target, "backend")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", action="append", help="module to import (default: server)")
+    parser.add_argument("--baseline-rev", help="also measure `server` at this git revision")
+    parser.add_argument("--no-build", action="store_true", help="import only, do not call create_app()")
+    parser.add_argument("--top", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    runs = [(target, BACKEND_DIR) for target in (args.target or ["server"])]
+    if args.baseline_rev:
+        runs.insert(0, (f"server@{args.baseline_rev}", checkout_baseline(args.baseline_rev)))
+
+    print(f"{'target':<32}{'import ms':>10}{'modules':>9}{'rss MB':>9}{'fork private MB':>17}")
+    for label, path in runs:
+        module = label.split("@", 1)[0]
+        samples = [run_probe(module, path, not args.no_build) for _ in range(args.repeat)]
+        best = min(samples, key=lambda sample: sample["import_ms"])
+        print(
+            f"{label:<32}{best['import_ms']:>10}{best['modules']:>9}{best['rss_kb'] / 1024:>9.1f}"
+            f"{best.get('fork_private_kb', 0) / 1024:>17.1f}"
+        )
+        heaviest = sorted(best["packages"].items(), key=lambda item: -item[1])[:args.top]
+        print("    " + ", ".join(f"{name} {self_ms:.0f}ms" for name, self_ms in heaviest))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Leaderboard operation latency at a million ranked users.
+
+Builds a Leaderboard in memory (no Mongo) with --users random scores and
+times score updates, rank lookups, top-K pages and neighbourhood queries,
+against ranking the same users by sorting, which is what a query over the
+users collection without the board would cost per request.
+
+Usage:
+    python benchmarks/bench_leaderboard.py [--users 1000000] [--ops 20000]
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from thriveremote.leaderboards import Leaderboard, RankedList  # noqa: E402
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def timed(operation, args_list):
+    samples = []
+    for args in args_list:
+        started = time.perf_counter()
+        operation(*args)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000000)
+    parser.add_argument("--ops", type=int, default=20000)
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    user_ids = [f"user-{i:07d}" for i in range(args.users)]
+    scores = {user_id: rng.randint(1, 50000) for user_id in user_ids}
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    board = Leaderboard("bench", "productivity_score", "Benchmark")
+    board.scores = dict(scores)
+    board.ranked = RankedList([(-score, user_id) for user_id, score in scores.items()])
+    board.loaded = True
+    build_s = time.perf_counter() - started
+    memory_mb = tracemalloc.get_traced_memory()[0] / 1e6
+    tracemalloc.stop()
+
+    sample = [rng.choice(user_ids) for _ in range(args.ops)]
+    results = {
+        "update": timed(
+            lambda user_id: board.set_score(user_id, board.scores[user_id] + rng.randint(1, 50)),
+            [(user_id,) for user_id in sample]
+        ),
+        "rank": timed(lambda user_id: board.rank_of_score(board.scores[user_id]), [(user_id,) for user_id in sample]),
+        "top 10": timed(lambda: board.entries(0, 10), [()] * args.ops),
+        "page at 500k": timed(lambda: board.entries(args.users // 2, args.users // 2 + 10), [()] * args.ops),
+        "around ±5": timed(
+            lambda user_id: board.entries(max(0, board.position(user_id) - 5), board.position(user_id) + 6),
+            [(user_id,) for user_id in sample]
+        ),
+    }
+
+    started = time.perf_counter()
+    ordered = sorted(board.scores.items(), key=lambda item: -item[1])
+    sort_ms = (time.perf_counter() - started) * 1000
+    del ordered
+
+    print(f"{args.users} users: built in {build_s:.2f} s, {memory_mb:.0f} MB traced")
+    print(f"{'operation':<16}{'p50 us':>10}{'p99 us':>10}{'mean us':>10}")
+    for name, samples in results.items():
+        print(f"{name:<16}{percentile(samples, 50):>10.1f}{percentile(samples, 99):>10.1f}"
+              f"{statistics.mean(samples):>10.1f}")
+    print(f"{'full sort':<16}{sort_ms * 1000:>10.0f}{'':>10}{'':>10}  (per rank query without the board)")
+
+if __name__ == "__main__":
+    main()
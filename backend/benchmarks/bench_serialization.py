@@ -0,0 +1,130 @@
+"""Compare response encoding cost for large /api/tasks and /api/applications payloads.
+
+Baseline is FastAPI's default path (jsonable_encoder + json.dumps, as done by
+JSONResponse.render); candidate is FastJSONResponse from thriveremote.encoding.
+
+Usage:
+    python benchmarks/bench_serialization.py [--items 5000] [--repeat 20]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from thriveremote.encoding import FastJSONResponse  # noqa: E402
+
+
+def make_tasks(count: int, with_bson: bool):
+    now = datetime.now()
+    tasks = []
+    for i in range(count):
+        task = {
+            "id": str(uuid.uuid4()),
+            "user_id": "bench-user",
+            "title": f"Task {i}",
+            "description": "Add latest skills and experience " * 3,
+            "status": ("todo", "in_progress", "completed")[i % 3],
+            "priority": ("low", "medium", "high")[i % 3],
+            "category": "job_search",
+            "due_date": (now + timedelta(days=i % 30)).date().isoformat(),
+            "created_date": now.isoformat()
+        }
+        if with_bson:
+            task["_id"] = ObjectId()
+            task["created_at"] = now
+        tasks.append(task)
+    return {"tasks": tasks}
+
+
+def make_applications(count: int, with_bson: bool):
+    now = datetime.now()
+    applications = []
+    for i in range(count):
+        application = {
+            "id": str(uuid.uuid4()),
+            "user_id": "bench-user",
+            "job_id": str(uuid.uuid4()),
+            "job_title": f"Senior Remote Engineer {i}",
+            "company": f"Company {i % 50}",
+            "status": "applied",
+            "applied_date": now.isoformat(),
+            "notes": f"Applied via ThriveRemote OS to Company {i % 50}"
+        }
+        if with_bson:
+            application["_id"] = ObjectId()
+            application["applied_at"] = now
+        applications.append(application)
+    return {"applications": applications, "total": count}
+
+
+def default_encode(payload):
+    # FastAPI's default: jsonable_encoder in serialize_response, then JSONResponse.render
+    return JSONResponse(jsonable_encoder(payload, custom_encoder={ObjectId: str})).body
+
+
+def fast_encode(payload):
+    return FastJSONResponse(payload).body
+
+
+def measure(encode, payload, repeat: int):
+    encode(payload)  # warm up
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        encode(payload)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    encode(payload)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "min_ms": round(min(timings), 3),
+        "peak_alloc_kb": round(peak / 1024, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    results = {}
+    for name, factory in (("tasks", make_tasks), ("applications", make_applications)):
+        for with_bson in (False, True):
+            payload = factory(args.items, with_bson)
+            label = f"{name}{'+bson' if with_bson else ''}"
+            assert json.loads(default_encode(payload)) == json.loads(fast_encode(payload))
+            default = measure(default_encode, payload, args.repeat)
+            fast = measure(fast_encode, payload, args.repeat)
+            results[label] = {
+                "default": default,
+                "fast": fast,
+                "speedup": round(default["median_ms"] / fast["median_ms"], 1)
+            }
+
+    print(f"{'payload':<20}{'default ms':>12}{'fast ms':>10}{'speedup':>9}{'default KB':>12}{'fast KB':>10}")
+    for label, result in results.items():
+        print(
+            f"{label:<20}{result['default']['median_ms']:>12}{result['fast']['median_ms']:>10}"
+            f"{result['speedup']:>8}x{result['default']['peak_alloc_kb']:>12}{result['fast']['peak_alloc_kb']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
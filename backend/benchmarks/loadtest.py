@@ -0,0 +1,398 @@
+"""Offline load test: scenario mixes against a local app with stubbed upstream hosts.
+
+The app runs under uvicorn in a child process, against either a local mongod
+(--mongo mongodb://..., using --database, which is dropped afterwards) or the
+in-memory mongomock stand-in (--mongo memory, requires `pip install
+mongomock`). Remotive and Relocate Me are replaced by stub HTTP servers in
+this process, reached through REMOTIVE_API_URL and RELOCATE_ME_URL, so no
+request leaves the machine.
+
+Scenarios (each runs for --duration seconds with --concurrency workers and
+its own freshly registered --users, so one scenario's writes do not slow the next):
+  login_storm              POST /api/auth/login
+  dashboard_polling        stats, notifications, achievements and tasks, with ETags
+  terminal_spam            POST /api/terminal/command
+  bulk_task_upload         POST /api/tasks/upload with --upload-size tasks
+  job_refresh_under_reads  one worker refreshing jobs, the rest reading them
+  mixed                    weighted mix of all of the above
+
+Throughput and p50/p95/p99 per endpoint are written as JSON (--output); two
+result files, e.g. from two commits, are compared with --compare.
+
+Usage:
+    python benchmarks/loadtest.py [--mongo memory] [--scenarios all] [--concurrency 20] [--duration 10]
+                                  [--output results.json]
+    python benchmarks/loadtest.py --compare before.json after.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+SCENARIOS = ("login_storm", "dashboard_polling", "terminal_spam", "bulk_task_upload", "job_refresh_under_reads", "mixed")
+TERMINAL_COMMANDS = ("help", "stats", "jobs", "savings", "pong", "relocate", "whoami", "konami")
+PASSWORD = "loadtest-password"
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+# Upstream stubs
+def remotive_payload(count: int) -> bytes:
+    jobs = [
+        {
+            "title": f"Senior Engineer {i}",
+            "company_name": f"Company {i % 17}",
+            "candidate_required_location": "Worldwide",
+            "salary": "$120k - $160k",
+            "job_type": "full_time",
+            "description": "<p>We are hiring.</p><ul>" + "<li>Python, FastAPI and MongoDB</li>" * 20 + "</ul>",
+            "tags": ["python", "fastapi", "mongodb", "aws", "docker", "k8s"],
+            "publication_date": "2024-01-01T00:00:00",
+            "url": f"https://example.invalid/jobs/{i}"
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"jobs": jobs}).encode()
+
+def start_stub_server(routes, latency_ms: float) -> ThreadingHTTPServer:
+    """Serve canned (content type, body) responses by path prefix from a background thread"""
+    class StubHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if latency_ms:
+                time.sleep(latency_ms / 1000)
+            for prefix, (content_type, body) in routes.items():
+                if self.path.startswith(prefix):
+                    self.send_response(200)
+                    self.send_header("Content-Type", content_type)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+            self.send_error(404)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# App process
+def serve(args):
+    """Child process entry point: run the app under uvicorn"""
+    if args.mongo == "memory":
+        import mongomock
+        import pymongo
+        pymongo.MongoClient = mongomock.MongoClient
+    else:
+        os.environ["MONGO_URL"] = args.mongo
+
+    import logging
+    import uvicorn
+    from thriveremote import db
+    from thriveremote import create_app
+
+    db.DATABASE_NAME = args.database
+    app = create_app()
+    logging.getLogger().setLevel(logging.WARNING)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning", access_log=False)
+
+def start_app(args, remotive_url: str, relocate_url: str):
+    port = free_port()
+    env = {
+        **os.environ,
+        "REMOTIVE_API_URL": remotive_url,
+        "RELOCATE_ME_URL": relocate_url,
+        "JOB_CATALOG_SNAPSHOT_PATH": os.path.join(tempfile.mkdtemp(prefix="loadtest-"), "catalog.json"),
+    }
+    command = [
+        sys.executable, os.path.abspath(__file__), "--serve", "--port", str(port),
+        "--mongo", args.mongo, "--database", args.database
+    ]
+    process = subprocess.Popen(command, cwd=BACKEND_DIR, env=env)
+    return process, f"http://127.0.0.1:{port}"
+
+async def wait_until_ready(client, process, timeout: float = 60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"App exited with code {process.returncode}")
+        try:
+            if (await client.get("/health/ready")).status_code == 200:
+                return
+        except Exception:
+            pass
+        await asyncio.sleep(0.2)
+    raise RuntimeError("App did not become ready")
+
+# Load generation
+class Recorder:
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+
+    async def call(self, client, label: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            failed = response.status_code >= 400
+        except Exception:
+            response, failed = None, True
+        self.latencies.setdefault(label, []).append((time.perf_counter() - started) * 1000)
+        if failed:
+            self.errors[label] = self.errors.get(label, 0) + 1
+        return response
+
+    def report(self, elapsed: float):
+        endpoints = {}
+        for label, samples in sorted(self.latencies.items()):
+            endpoints[label] = {
+                "requests": len(samples),
+                "errors": self.errors.get(label, 0),
+                "throughput_rps": round(len(samples) / elapsed, 1),
+                "p50_ms": round(percentile(samples, 50), 2),
+                "p95_ms": round(percentile(samples, 95), 2),
+                "p99_ms": round(percentile(samples, 99), 2),
+                "max_ms": round(max(samples), 2)
+            }
+        total = sum(len(samples) for samples in self.latencies.values())
+        return {
+            "duration_s": round(elapsed, 2),
+            "requests": total,
+            "errors": sum(self.errors.values()),
+            "throughput_rps": round(total / elapsed, 1),
+            "endpoints": endpoints
+        }
+
+class LoadContext:
+    """Users, cached ETags and the current job ids shared by the workers"""
+    def __init__(self, client, recorder, users, upload_size: int):
+        self.client = client
+        self.recorder = recorder
+        self.users = users
+        self.etags = {}
+        self.job_ids = []
+        self.upload_body = json.dumps([
+            {"title": f"Imported {i}", "description": "Load test task", "priority": "medium"}
+            for i in range(upload_size)
+        ]).encode()
+
+    async def call(self, label, method, url, **kwargs):
+        return await self.recorder.call(self.client, label, method, url, **kwargs)
+
+async def login(ctx, user, worker):
+    await ctx.call("POST /api/auth/login", "POST", "/api/auth/login",
+                   json={"username": user["username"], "password": PASSWORD})
+
+async def poll_dashboard(ctx, user, worker):
+    for path in ("/api/dashboard/stats", "/api/realtime/notifications", "/api/achievements", "/api/tasks"):
+        key = (user["token"], path)
+        headers = {"If-None-Match": ctx.etags[key]} if key in ctx.etags else {}
+        response = await ctx.call(f"GET {path}", "GET", path, params={"session_token": user["token"]}, headers=headers)
+        if response is not None and "etag" in response.headers:
+            ctx.etags[key] = response.headers["etag"]
+
+async def terminal_command(ctx, user, worker):
+    await ctx.call("POST /api/terminal/command", "POST", "/api/terminal/command",
+                   params={"session_token": user["token"]}, json={"command": random.choice(TERMINAL_COMMANDS)})
+
+async def upload_tasks(ctx, user, worker):
+    await ctx.call("POST /api/tasks/upload", "POST", "/api/tasks/upload", params={"session_token": user["token"]},
+                   files={"file": ("tasks.json", ctx.upload_body, "application/json")})
+
+async def read_jobs(ctx, user, worker):
+    response = await ctx.call("GET /api/jobs", "GET", "/api/jobs", params={"session_token": user["token"]})
+    if response is not None and response.status_code == 200:
+        ctx.job_ids = [job["id"] for job in response.json().get("jobs", [])]
+    if ctx.job_ids:
+        await ctx.call("GET /api/jobs/{job_id}", "GET", f"/api/jobs/{random.choice(ctx.job_ids)}",
+                       params={"session_token": user["token"]})
+
+async def refresh_or_read_jobs(ctx, user, worker):
+    if worker == 0:
+        await ctx.call("POST /api/jobs/refresh", "POST", "/api/jobs/refresh", params={"session_token": user["token"]})
+        await asyncio.sleep(1)
+    else:
+        await read_jobs(ctx, user, worker)
+
+MIXED_WEIGHTS = ((poll_dashboard, 55), (terminal_command, 20), (read_jobs, 15), (login, 5), (upload_tasks, 5))
+
+async def mixed(ctx, user, worker):
+    step = random.choices([step for step, _ in MIXED_WEIGHTS], weights=[weight for _, weight in MIXED_WEIGHTS])[0]
+    await step(ctx, user, worker)
+
+SCENARIO_STEPS = {
+    "login_storm": login,
+    "dashboard_polling": poll_dashboard,
+    "terminal_spam": terminal_command,
+    "bulk_task_upload": upload_tasks,
+    "job_refresh_under_reads": refresh_or_read_jobs,
+    "mixed": mixed,
+}
+
+async def run_scenario(client, users, name, args):
+    ctx = LoadContext(client, Recorder(), users, args.upload_size)
+    step = SCENARIO_STEPS[name]
+    deadline = time.monotonic() + args.duration
+
+    async def worker(index):
+        turn = index
+        while time.monotonic() < deadline:
+            await step(ctx, users[turn % len(users)], index)
+            turn += args.concurrency
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(args.concurrency)))
+    return ctx.recorder.report(time.perf_counter() - started)
+
+async def register_users(client, count: int):
+    run_id = f"{int(time.time())}{random.randint(0, 999):03d}"
+
+    async def register(i):
+        username = f"load_{run_id}_{i}"
+        response = await client.post("/api/auth/register", json={"username": username, "password": PASSWORD})
+        response.raise_for_status()
+        return {"username": username, "token": response.json()["session_token"]}
+
+    return await asyncio.gather(*(register(i) for i in range(count)))
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+async def run_load(args):
+    import httpx
+
+    remotive = start_stub_server({"/": ("application/json", remotive_payload(args.jobs))}, args.upstream_latency_ms)
+    relocate = start_stub_server({"/": ("text/html", b"<html><body>Relocate Me</body></html>")}, args.upstream_latency_ms)
+    process, base_url = start_app(
+        args, f"http://127.0.0.1:{remotive.server_port}/api/remote-jobs", f"http://127.0.0.1:{relocate.server_port}"
+    )
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    results = {
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "config": {
+            "mongo": "memory" if args.mongo == "memory" else "mongod",
+            "concurrency": args.concurrency,
+            "duration_s": args.duration,
+            "users": args.users,
+            "upload_size": args.upload_size,
+            "upstream_latency_ms": args.upstream_latency_ms
+        },
+        "scenarios": {}
+    }
+    try:
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+            await wait_until_ready(client, process)
+            for name in args.scenarios:
+                users = await register_users(client, args.users)
+                print(f"running {name} for {args.duration}s with {args.concurrency} workers...", file=sys.stderr)
+                results["scenarios"][name] = await run_scenario(client, users, name, args)
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+        remotive.shutdown()
+        relocate.shutdown()
+        if args.mongo != "memory":
+            from pymongo import MongoClient
+            MongoClient(args.mongo).drop_database(args.database)
+    return results
+
+# Reporting
+def print_summary(results):
+    print(f"{'scenario':<26}{'endpoint':<36}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'errors':>8}",
+          file=sys.stderr)
+    for name, scenario in results["scenarios"].items():
+        for label, endpoint in scenario["endpoints"].items():
+            print(f"{name:<26}{label:<36}{endpoint['throughput_rps']:>9}{endpoint['p50_ms']:>9}"
+                  f"{endpoint['p95_ms']:>9}{endpoint['p99_ms']:>9}{endpoint['errors']:>8}", file=sys.stderr)
+
+def compare(before_path: str, after_path: str):
+    with open(before_path) as f:
+        before = json.load(f)
+    with open(after_path) as f:
+        after = json.load(f)
+
+    def change(old, new):
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    print(f"{before.get('revision')} -> {after.get('revision')}")
+    print(f"{'scenario':<26}{'endpoint':<36}{'req/s':>10}{'p50':>10}{'p95':>10}{'p99':>10}")
+    for name, scenario in after["scenarios"].items():
+        old_scenario = before["scenarios"].get(name)
+        if old_scenario is None:
+            continue
+        for label, endpoint in scenario["endpoints"].items():
+            old = old_scenario["endpoints"].get(label)
+            if old is None:
+                continue
+            print(f"{name:<26}{label:<36}{change(old['throughput_rps'], endpoint['throughput_rps']):>10}"
+                  f"{change(old['p50_ms'], endpoint['p50_ms']):>10}{change(old['p95_ms'], endpoint['p95_ms']):>10}"
+                  f"{change(old['p99_ms'], endpoint['p99_ms']):>10}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongo", default="memory", help="'memory' for mongomock, or a mongodb:// URL")
+    parser.add_argument("--database", default="thriveremote_loadtest")
+    parser.add_argument("--scenarios", default="all", help=f"comma separated, from: {', '.join(SCENARIOS)}")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--upload-size", type=int, default=100)
+    parser.add_argument("--jobs", type=int, default=25, help="jobs served by the Remotive stub")
+    parser.add_argument("--upstream-latency-ms", type=float, default=0)
+    parser.add_argument("--output", help="write the JSON results here instead of stdout")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    parser.add_argument("--serve", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args)
+        return
+    if args.compare:
+        compare(*args.compare)
+        return
+    if args.mongo != "memory" and args.database == "thriveremote":
+        parser.error("refusing to load test (and then drop) the application database")
+
+    args.scenarios = list(SCENARIOS) if args.scenarios == "all" else [name.strip() for name in args.scenarios.split(",")]
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    results = asyncio.run(run_load(args))
+    print_summary(results)
+    encoded = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(encoded + "\n")
+    else:
+        print(encoded)
+
+if __name__ == "__main__":
+    main()
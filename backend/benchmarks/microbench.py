@@ -0,0 +1,281 @@
+"""Micro-benchmarks for hot helpers, checked against recorded baselines.
+
+Each helper is timed against a local data fixture: a seeded user, session,
+tasks and achievements in Mongo, a Remotive payload served by an in-process
+stand-in for OutboundHTTP. Mongo is mongomock by default (--mongo memory,
+requires `pip install mongomock`) or a local mongod (--mongo URL, using
+--database, which is dropped afterwards).
+
+Timings are divided by a pure-Python calibration loop before comparing, so
+baselines recorded on one machine stay usable on another of a different
+speed. A benchmark fails when its normalized time exceeds the baseline by
+more than its tolerance (per-benchmark in the baselines file, else
+--tolerance); the exit status is then 1.
+
+Usage:
+    python benchmarks/microbench.py                 # compare with benchmarks/microbench_baselines.json
+    python benchmarks/microbench.py --record        # write new baselines
+    python benchmarks/microbench.py --only verify_password,terminal_responses
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "microbench_baselines.json")
+DEFAULT_TOLERANCE = 0.25
+FIXTURE_USER_ID = "microbench-user"
+FIXTURE_PASSWORD = "microbench-password"
+
+def calibration_loop():
+    total = 0
+    for i in range(10000):
+        total += i * i % 7
+    return total
+
+def time_call(func, min_time: float, repeat: int) -> float:
+    """Median microseconds per call over `repeat` runs of at least `min_time` seconds each"""
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time / 10:
+            break
+        number *= 10
+    number = max(1, int(number * (min_time / max(elapsed, 1e-9))))
+
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        runs.append((time.perf_counter() - started) / number * 1e6)
+    return statistics.median(runs)
+
+# Fixture
+class FixtureResponse:
+    """The parts of httpx.Response the job service uses"""
+    def __init__(self, payload):
+        self.payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.payload
+
+class FixtureHTTP:
+    """Stands in for OutboundHTTP, answering every GET with the Remotive fixture"""
+    def __init__(self, payload):
+        self.response = FixtureResponse(payload)
+
+    async def get(self, url, **kwargs):
+        return self.response
+
+def remotive_fixture(count: int = 25):
+    return {"jobs": [
+        {
+            "title": f"Senior Engineer {i}",
+            "company_name": f"Company {i}",
+            "candidate_required_location": "Worldwide",
+            "salary": "$120k - $160k",
+            "job_type": "full_time",
+            "description": (
+                "<h2>About us</h2><p>We are a <strong>remote-first</strong> team.</p>"
+                "<script>alert(1)</script><ul>" + "<li>Python &amp; FastAPI</li>" * 15 + "</ul>"
+                "<p>Apply at <a href='https://example.invalid/apply'>our site</a>.</p>"
+            ),
+            "tags": ["python", "fastapi", "mongodb", "aws", "docker", "k8s"],
+            "publication_date": "2024-01-01T00:00:00",
+            "url": f"https://example.invalid/jobs/{i}"
+        }
+        for i in range(count)
+    ]}
+
+def seed_fixture():
+    from thriveremote.achievements import ACHIEVEMENT_RULES
+    from thriveremote.db import achievements_collection, tasks_collection, users_collection
+    from thriveremote.sessions import create_session, hash_password
+
+    now = datetime.now()
+    users_collection.delete_many({"user_id": FIXTURE_USER_ID})
+    users_collection.insert_one({
+        "user_id": FIXTURE_USER_ID,
+        "username": "microbench",
+        "password_hash": hash_password(FIXTURE_PASSWORD),
+        "created_date": now.isoformat(),
+        "last_active": now.isoformat(),
+        "total_sessions": 10,
+        "productivity_score": 420,
+        "daily_streak": 3,
+        "last_streak_date": now.date().isoformat(),
+        "savings_goal": 5000.0,
+        "current_savings": 1200.0,
+        "settings": {},
+        "achievements_unlocked": 2,
+        "pong_high_score": 150,
+        "commands_executed": 30,
+        "easter_eggs_found": 1,
+        "tasks_completed": 4,
+        "applications_submitted": 2,
+        "relocation_views": 1
+    })
+    tasks_collection.insert_many([
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": FIXTURE_USER_ID,
+            "title": f"Task {i}",
+            "description": "Fixture task",
+            "status": ("todo", "in_progress", "completed")[i % 3],
+            "priority": "medium",
+            "category": "job_search",
+            "due_date": (now + timedelta(days=i)).date().isoformat(),
+            "created_date": now.isoformat()
+        }
+        for i in range(30)
+    ])
+    achievements_collection.insert_many([
+        {"id": rule.id, "user_id": FIXTURE_USER_ID, "achievement_type": rule.achievement_type, "title": rule.title,
+         "description": rule.description, "icon": rule.icon, "unlocked": i < 2}
+        for i, rule in enumerate(ACHIEVEMENT_RULES)
+    ])
+    return create_session(FIXTURE_USER_ID)
+
+def build_benchmarks():
+    from thriveremote.db import users_collection
+    from thriveremote.jobs import JobFetchingService, normalize_description
+    from thriveremote.routers.terminal import build_terminal_responses
+    from thriveremote.sessions import active_sessions, get_user_from_session, verify_password
+    from thriveremote.users import get_or_create_user, log_productivity_action
+
+    token = seed_fixture()
+    session = dict(active_sessions[token])
+    password_hash = users_collection.find_one({"user_id": FIXTURE_USER_ID})["password_hash"]
+    user = users_collection.find_one({"user_id": FIXTURE_USER_ID}, {"_id": 0})
+    fixture = remotive_fixture()
+    job_service = JobFetchingService(FixtureHTTP(fixture))
+    loop = asyncio.new_event_loop()
+
+    def session_from_db():
+        active_sessions.pop(token, None)
+        get_user_from_session(token)
+
+    def session_cached():
+        active_sessions[token] = session
+        get_user_from_session(token)
+
+    return {
+        "verify_password": lambda: verify_password(FIXTURE_PASSWORD, password_hash),
+        "get_user_from_session": session_cached,
+        "get_user_from_session_db": session_from_db,
+        "log_productivity_action": lambda: loop.run_until_complete(
+            log_productivity_action(FIXTURE_USER_ID, "microbench", 1, {"source": "fixture"})
+        ),
+        "get_or_create_user": lambda: loop.run_until_complete(get_or_create_user(FIXTURE_USER_ID)),
+        "terminal_responses": lambda: build_terminal_responses(user, FIXTURE_USER_ID, 31),
+        "normalize_description": lambda: normalize_description(fixture["jobs"][0]["description"]),
+        "fetch_remotive_jobs": lambda: loop.run_until_complete(job_service.fetch_remotive_jobs()),
+    }
+
+def load_baselines(path: str):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mongo", default="memory", help="'memory' for mongomock, or a mongodb:// URL")
+    parser.add_argument("--database", default="thriveremote_microbench")
+    parser.add_argument("--baselines", default=BASELINES_PATH)
+    parser.add_argument("--record", action="store_true", help="write the measured times as the new baselines")
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help=f"allowed slowdown for benchmarks without their own (default {DEFAULT_TOLERANCE})")
+    parser.add_argument("--only", help="comma separated benchmark names")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timing run")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.mongo == "memory":
+        import mongomock
+        import pymongo
+        pymongo.MongoClient = mongomock.MongoClient
+    elif args.database == "thriveremote":
+        parser.error("refusing to seed (and then drop) the application database")
+    else:
+        os.environ["MONGO_URL"] = args.mongo
+
+    from thriveremote import db
+    db.DATABASE_NAME = args.database
+
+    try:
+        benchmarks = build_benchmarks()
+        selected = args.only.split(",") if args.only else list(benchmarks)
+        unknown = set(selected) - set(benchmarks)
+        if unknown:
+            parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+        calibration = time_call(calibration_loop, args.min_time, args.repeat)
+        results = {name: time_call(benchmarks[name], args.min_time, args.repeat) for name in selected}
+    finally:
+        if args.mongo != "memory":
+            db.get_client().drop_database(args.database)
+        db.close_client()
+
+    baselines = load_baselines(args.baselines)
+    if args.record:
+        previous = baselines or {}
+        recorded = {
+            "calibration_us": round(calibration, 3),
+            "tolerance": previous.get("tolerance", DEFAULT_TOLERANCE),
+            "benchmarks": dict(previous.get("benchmarks", {}))
+        }
+        for name, us in results.items():
+            entry = dict(recorded["benchmarks"].get(name, {}))
+            entry["us"] = round(us, 3)
+            recorded["benchmarks"][name] = entry
+        with open(args.baselines, "w") as f:
+            f.write(json.dumps(recorded, indent=2) + "\n")
+        print(f"calibration {calibration:.1f} us")
+        for name, us in results.items():
+            print(f"{name:<28}{us:>14.2f} us  recorded")
+        return
+
+    if baselines is None:
+        parser.error(f"no baselines at {args.baselines}; run with --record first")
+
+    default_tolerance = args.tolerance if args.tolerance is not None else baselines.get("tolerance", DEFAULT_TOLERANCE)
+    print(f"calibration {calibration:.1f} us (baseline {baselines['calibration_us']:.1f} us)")
+    print(f"{'benchmark':<28}{'us/call':>14}{'baseline':>14}{'change':>10}{'allowed':>10}")
+    regressions = []
+    for name, us in results.items():
+        baseline = baselines["benchmarks"].get(name)
+        if baseline is None:
+            print(f"{name:<28}{us:>14.2f}{'-':>14}{'new':>10}")
+            continue
+        # Compare relative to each machine's calibration loop
+        ratio = (us / calibration) / (baseline["us"] / baselines["calibration_us"])
+        tolerance = baseline.get("tolerance", default_tolerance)
+        regressed = ratio > 1 + tolerance
+        if regressed:
+            regressions.append(name)
+        print(f"{name:<28}{us:>14.2f}{baseline['us']:>14.2f}{(ratio - 1) * 100:>+9.1f}%{tolerance * 100:>9.0f}%"
+              f"{'  REGRESSION' if regressed else ''}")
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed: {', '.join(regressions)}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
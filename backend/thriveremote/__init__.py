@@ -0,0 +1,4 @@
+"""ThriveRemote API"""
+from .app import ROUTERS, create_app
+
+__all__ = ["ROUTERS", "create_app"]
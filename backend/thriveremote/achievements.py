@@ -0,0 +1,240 @@
+"""Achievement definitions and the rules engine that unlocks them from per-user counters"""
+from typing import Any, Callable, Dict, List, NamedTuple
+from collections import OrderedDict
+from datetime import datetime
+import os
+
+from .caching import resource_versions
+from .db import achievements_collection, applications_collection, tasks_collection, users_collection
+from .events import AchievementUnlocked, event_bus
+from .notifications import achievement_notification, notification_hub
+
+ACHIEVEMENT_CACHE_USERS = int(os.environ.get("ACHIEVEMENT_CACHE_USERS", 50000))
+
+class AchievementRule(NamedTuple):
+    """An achievement unlocked once `counter` reaches `threshold`"""
+    id: str
+    achievement_type: str
+    title: str
+    description: str
+    icon: str
+    counter: str
+    threshold: float
+
+ACHIEVEMENT_RULES = (
+    AchievementRule("first_job_apply", "job_application", "First Step", "Applied to your first job", "🎯",
+                    "applications_submitted", 1),
+    AchievementRule("savings_milestone_25", "savings", "Quarter Way There", "Reached 25% of savings goal", "💰",
+                    "savings_progress", 25),
+    AchievementRule("savings_milestone_50", "savings", "Halfway Hero", "Reached 50% of savings goal", "💎",
+                    "savings_progress", 50),
+    AchievementRule("task_master", "tasks", "Task Master", "Completed 10 tasks", "✅",
+                    "tasks_completed", 10),
+    AchievementRule("terminal_ninja", "terminal", "Terminal Ninja", "Executed 50 terminal commands", "⚡",
+                    "commands_executed", 50),
+    AchievementRule("pong_champion", "gaming", "Pong Champion", "Score 200 points in Pong", "🏆",
+                    "pong_high_score", 200),
+    AchievementRule("easter_hunter", "easter_eggs", "Easter Egg Hunter", "Found 5 easter eggs", "🥚",
+                    "easter_eggs_found", 5),
+    AchievementRule("streak_week", "streak", "Weekly Warrior", "Maintained 7-day streak", "🔥",
+                    "daily_streak", 7),
+    AchievementRule("relocation_explorer", "relocation", "Relocation Explorer",
+                    "Explored relocation data and properties", "🏡", "relocation_views", 1),
+)
+ACHIEVEMENT_BITS = {rule.id: 1 << bit for bit, rule in enumerate(ACHIEVEMENT_RULES)}
+RULES_BY_COUNTER: Dict[str, List[AchievementRule]] = {}
+for _rule in ACHIEVEMENT_RULES:
+    RULES_BY_COUNTER.setdefault(_rule.counter, []).append(_rule)
+
+def savings_progress(user: Dict[str, Any]) -> float:
+    return (user.get("current_savings", 0) / (user.get("savings_goal") or 5000.0)) * 100
+
+# Counter values as read from a user document; savings progress is derived, not stored
+COUNTER_READERS: Dict[str, Callable[[Dict[str, Any]], float]] = {
+    counter: (lambda user, counter=counter: user.get(counter, 0)) for counter in RULES_BY_COUNTER
+}
+COUNTER_READERS["savings_progress"] = savings_progress
+
+# Counters added after users already existed; computed once per user from the source collections
+COUNTER_BACKFILL: Dict[str, Callable[[str], int]] = {
+    "tasks_completed": lambda user_id: tasks_collection.count_documents({"user_id": user_id, "status": "completed"}),
+    "applications_submitted": lambda user_id: applications_collection.count_documents({"user_id": user_id}),
+}
+
+async def initialize_achievements(user_id: str):
+    """Initialize achievement system for user"""
+    for rule in ACHIEVEMENT_RULES:
+        # Only insert if doesn't exist
+        existing = achievements_collection.find_one({
+            "user_id": user_id,
+            "id": rule.id
+        })
+        if not existing:
+            achievements_collection.insert_one({
+                "id": rule.id,
+                "user_id": user_id,
+                "achievement_type": rule.achievement_type,
+                "title": rule.title,
+                "description": rule.description,
+                "icon": rule.icon,
+                "unlocked": False
+            })
+
+    resource_versions.bump(user_id, "achievements", "stats")
+
+async def unlock_achievement(user_id: str, achievement_id: str):
+    """Unlock an achievement for user"""
+    achievement = achievements_collection.find_one_and_update(
+        {"user_id": user_id, "id": achievement_id, "unlocked": False},
+        {
+            "$set": {
+                "unlocked": True,
+                "unlock_date": datetime.now().isoformat()
+            }
+        },
+        projection={"_id": 0, "id": 1, "title": 1, "icon": 1, "description": 1}
+    )
+    if achievement is None:
+        # Nothing updated: set the bit only if another process already unlocked it, not when
+        # the user's achievement document is missing
+        if achievements_collection.count_documents(
+            {"user_id": user_id, "id": achievement_id, "unlocked": True}, limit=1
+        ):
+            achievement_engine.mark_unlocked(user_id, achievement_id)
+        return False
+
+    achievement_engine.mark_unlocked(user_id, achievement_id)
+
+    # Update user achievement count
+    users_collection.update_one(
+        {"user_id": user_id},
+        {"$inc": {"achievements_unlocked": 1}}
+    )
+    resource_versions.bump(user_id, "achievements", "stats", "notifications")
+    notification_hub.notify(user_id, achievement_notification(achievement))
+
+    # Bonus points are awarded by the points subscriber
+    await event_bus.publish(AchievementUnlocked(user_id=user_id, achievement_id=achievement_id))
+
+    return True
+
+class AchievementEngine:
+    """Evaluates achievement rules incrementally as counters change.
+
+    Only the rules that watch the changed counter are checked, and achievements
+    already unlocked are skipped using an in-memory bitmask per user, so a
+    counter update that crosses no threshold never touches the achievements
+    collection. The mask is loaded once per user per process; an unlock made by
+    another process is picked up as a no-op unlock attempt.
+    """
+    def __init__(self, max_users: int = ACHIEVEMENT_CACHE_USERS):
+        self.max_users = max_users
+        self.masks: "OrderedDict[str, int]" = OrderedDict()
+        self.evaluations = 0
+        self.skipped = 0
+        self.unlock_attempts = 0
+
+    def mark_unlocked(self, user_id: str, achievement_id: str):
+        if user_id in self.masks:
+            self.masks[user_id] |= ACHIEVEMENT_BITS.get(achievement_id, 0)
+
+    async def unlocked_mask(self, user_id: str) -> int:
+        mask = self.masks.get(user_id)
+        if mask is None:
+            self._load(user_id)
+            return self.masks[user_id]
+        self.masks.move_to_end(user_id)
+        return mask
+
+    def _load(self, user_id: str) -> Dict[str, int]:
+        """Read the unlocked mask and backfill missing counters; returns the backfilled values"""
+        mask = 0
+        for achievement in achievements_collection.find({"user_id": user_id, "unlocked": True}, {"_id": 0, "id": 1}):
+            mask |= ACHIEVEMENT_BITS.get(achievement["id"], 0)
+        self.masks[user_id] = mask
+        if len(self.masks) > self.max_users:
+            self.masks.popitem(last=False)
+
+        backfilled = {}
+        user = users_collection.find_one({"user_id": user_id}, {"_id": 0, **{name: 1 for name in COUNTER_BACKFILL}})
+        if user is None:
+            return backfilled
+        for counter, backfill in COUNTER_BACKFILL.items():
+            if counter not in user:
+                backfilled[counter] = backfill(user_id)
+                users_collection.update_one(
+                    {"user_id": user_id, counter: {"$exists": False}},
+                    {"$set": {counter: backfilled[counter]}}
+                )
+        return backfilled
+
+    async def evaluate(self, user_id: str, counter: str, value: float) -> List[str]:
+        """Unlock every still-locked achievement whose threshold `value` has reached"""
+        self.evaluations += 1
+        mask = await self.unlocked_mask(user_id)
+        unlocked = []
+        for rule in RULES_BY_COUNTER.get(counter, ()):
+            if mask & ACHIEVEMENT_BITS[rule.id]:
+                self.skipped += 1
+                continue
+            if value >= rule.threshold:
+                self.unlock_attempts += 1
+                if await unlock_achievement(user_id, rule.id):
+                    unlocked.append(rule.id)
+        return unlocked
+
+    async def increment(self, user_id: str, counter: str, amount: int = 1) -> int:
+        """Increment a stored counter and evaluate the rules that watch it"""
+        from pymongo import ReturnDocument
+
+        backfilled = self._load(user_id) if user_id not in self.masks else {}
+        if counter in backfilled:
+            # Subscribers run after the primary write, so the backfilled count already includes it
+            await self.evaluate(user_id, counter, backfilled[counter])
+            return backfilled[counter]
+        user = users_collection.find_one_and_update(
+            {"user_id": user_id},
+            {"$inc": {counter: amount}},
+            projection={"_id": 0, counter: 1},
+            return_document=ReturnDocument.AFTER
+        )
+        value = user.get(counter, 0) if user else 0
+        await self.evaluate(user_id, counter, value)
+        return value
+
+    async def observe(self, user_id: str, counter: str, value: float) -> List[str]:
+        """Evaluate a counter whose new value the caller already stored or derived"""
+        if not any(rule.threshold <= value for rule in RULES_BY_COUNTER.get(counter, ())):
+            return []
+        return await self.evaluate(user_id, counter, value)
+
+    async def progress(self, user_id: str, user: Dict[str, Any]) -> List[Dict[str, Any]]:
+        mask = await self.unlocked_mask(user_id)
+        if any(counter not in user for counter in COUNTER_BACKFILL):
+            # Counters were just backfilled for this user
+            user = users_collection.find_one({"user_id": user_id}) or user
+        progress = []
+        for rule in ACHIEVEMENT_RULES:
+            value = COUNTER_READERS[rule.counter](user)
+            unlocked = bool(mask & ACHIEVEMENT_BITS[rule.id])
+            progress.append({
+                "id": rule.id,
+                "title": rule.title,
+                "icon": rule.icon,
+                "counter": rule.counter,
+                "value": round(value, 2) if isinstance(value, float) else value,
+                "threshold": rule.threshold,
+                "progress": 100.0 if unlocked else round(min(value / rule.threshold, 1.0) * 100, 1),
+                "unlocked": unlocked
+            })
+        return progress
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "cached_users": len(self.masks),
+            "evaluations": self.evaluations,
+            "skipped_unlocked": self.skipped,
+            "unlock_attempts": self.unlock_attempts
+        }
+
+achievement_engine = AchievementEngine()
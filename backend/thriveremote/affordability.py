@@ -0,0 +1,96 @@
+"""Vectorized affordability and cost-of-move calculations (imports numpy)"""
+from typing import Any, Dict, List, Optional, Tuple
+import os
+import re
+
+import numpy as np
+
+from .relocation import normalize_property, relocate_service, relocate_store
+
+# Affordability and cost-of-move calculations
+USD_TO_GBP = float(os.environ.get("USD_TO_GBP", 0.79))
+
+def parse_cost_range(value: Any) -> Tuple[float, float, bool]:
+    """Parse "£8,000 - £12,000" or "£1,200/month" into (low, high, is_monthly)"""
+    text = str(value)
+    numbers = [float(number.replace(",", "")) for number in re.findall(r"\d[\d,]*(?:\.\d+)?", text)]
+    if not numbers:
+        return 0.0, 0.0, False
+    return min(numbers), max(numbers), "month" in text.lower()
+
+def parse_moving_costs(moving_costs: Dict[str, Any], temporary_months: int) -> Dict[str, Any]:
+    """Turn the moving cost strings into numeric low/high totals with a breakdown"""
+    breakdown = {}
+    low_total = high_total = 0.0
+    for name, value in moving_costs.items():
+        low, high, monthly = parse_cost_range(value)
+        if monthly:
+            low, high = low * temporary_months, high * temporary_months
+        breakdown[name] = {"low": low, "high": high, "monthly": monthly}
+        low_total += low
+        high_total += high
+    return {"low": low_total, "high": high_total, "breakdown": breakdown}
+
+class AffordabilityEngine:
+    """Evaluates deposit gap and months-to-move for every property in one vectorized pass"""
+    def __init__(self):
+        self.version: Optional[Tuple] = None
+        self.properties: List[Dict[str, Any]] = []
+        self.prices = np.empty(0)
+        self.moving_costs: Dict[str, Any] = {}
+    
+    def rebuild(self, properties: List[Dict[str, Any]], cost_analysis: Dict[str, Any], version: Optional[Tuple] = None):
+        if version is not None and version == self.version:
+            return
+        priced = [prop if "price_value" in prop else normalize_property(prop) for prop in properties]
+        priced = [prop for prop in priced if prop["price_value"] is not None]
+        self.properties = priced
+        self.prices = np.fromiter((prop["price_value"] for prop in priced), dtype=np.float64, count=len(priced))
+        self.moving_costs = cost_analysis.get("moving_costs", {})
+        self.version = version
+    
+    def evaluate(self, savings: float, monthly_savings: float, deposit_rate: float = 0.10,
+                 temporary_months: int = 3) -> Dict[str, Any]:
+        """Affordability for all properties given savings and monthly savings in GBP"""
+        moving = parse_moving_costs(self.moving_costs, temporary_months)
+        
+        deposit = self.prices * deposit_rate
+        upfront_low = deposit + moving["low"]
+        upfront_high = deposit + moving["high"]
+        gap = np.maximum(upfront_high - savings, 0.0)
+        if monthly_savings > 0:
+            months_to_move = np.ceil(gap / monthly_savings)
+        else:
+            months_to_move = np.where(gap > 0, np.inf, 0.0)
+        coverage = np.minimum(savings / np.maximum(upfront_high, 1.0), 1.0)
+        
+        return {
+            "deposit": deposit,
+            "upfront_low": upfront_low,
+            "upfront_high": upfront_high,
+            "deposit_gap": gap,
+            "months_to_move": months_to_move,
+            "coverage": coverage,
+            "affordable_now": gap == 0,
+            "moving_costs": moving
+        }
+
+affordability_engine = AffordabilityEngine()
+
+async def load_affordability_engine() -> AffordabilityEngine:
+    """Make sure the affordability engine reflects the current shared properties and costs"""
+    properties = relocate_store.get("properties")
+    cost_analysis = relocate_store.get("cost_analysis")
+    if properties is None or cost_analysis is None:
+        relocate_data = await relocate_service.get_data()
+        if relocate_data:
+            relocate_store.publish(relocate_data)
+        properties = relocate_data.get("properties", [])
+        cost_analysis = relocate_data.get("cost_analysis", {})
+    
+    refs = relocate_store.refs
+    version = tuple(refs.get(data_type, {}).get("content_hash") for data_type in ("properties", "cost_analysis"))
+    if all(version) and version == affordability_engine.version:
+        return affordability_engine
+    affordability_engine.rebuild(properties, cost_analysis, version if all(version) else None)
+    return affordability_engine
@@ -0,0 +1,62 @@
+"""Application factory"""
+from typing import Iterable, Optional
+import importlib
+import logging
+import os
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from . import subscribers  # noqa: F401  registers the domain event handlers
+from .encoding import FastJSONResponse, FastJSONRoute
+from .lifecycle import lifespan
+from .loopmonitor import LOOP_MONITOR, LoopMonitorMiddleware
+from .metrics import MetricsMiddleware
+from .profiler import MONGO_PROFILE, PROFILE_HEADER, ProfilerMiddleware
+
+# Routers in mount order; each lives in thriveremote.routers.<name>
+ROUTERS = ("system", "auth", "users", "jobs", "savings", "tasks", "achievements", "games", "leaderboards", "terminal", "relocate", "realtime", "batch")
+
+def enabled_routers() -> Iterable[str]:
+    """Routers named in THRIVEREMOTE_ROUTERS (comma separated), or all of them"""
+    configured = os.environ.get("THRIVEREMOTE_ROUTERS", "")
+    names = [name.strip() for name in configured.split(",") if name.strip()]
+    return names or ROUTERS
+
+def create_app(routers: Optional[Iterable[str]] = None) -> FastAPI:
+    """Build the API, mounting only the requested routers.
+
+    Nothing connects at import or construction time: Mongo and the outbound
+    HTTP pool are opened on first use and closed by the lifespan.
+    """
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
+
+    app = FastAPI(default_response_class=FastJSONResponse, lifespan=lifespan)
+    app.router.route_class = FastJSONRoute
+
+    # CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[PROFILE_HEADER] if MONGO_PROFILE else [],
+    )
+    if MONGO_PROFILE:
+        # Development and staging only: per-request Mongo report header, N+1 and slow query logs
+        app.add_middleware(ProfilerMiddleware)
+    if LOOP_MONITOR:
+        # Attributes event loop stalls to the route of the request that caused them
+        app.add_middleware(LoopMonitorMiddleware)
+    # Outermost, so the latency covers every other middleware
+    app.add_middleware(MetricsMiddleware)
+
+    for name in (routers if routers is not None else enabled_routers()):
+        if name not in ROUTERS:
+            raise ValueError(f"Unknown router: {name}")
+        module = importlib.import_module(f".routers.{name}", __package__)
+        app.include_router(module.router)
+
+    return app
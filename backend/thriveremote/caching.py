@@ -0,0 +1,78 @@
+"""Conditional GET helpers and per-user resource versions"""
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+import secrets
+
+from fastapi import Request, Response
+
+# HTTP caching utilities
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag using weak comparison"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque_tag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque_tag:
+            return True
+    return False
+
+def accepted_encodings(accept_encoding: str) -> List[str]:
+    """Parse Accept-Encoding into the codings the client accepts"""
+    codings = []
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        if coding.strip():
+            codings.append(coding.strip())
+    return codings
+
+# Per-user resource versions for conditional GET
+class ResourceVersions:
+    """In-memory version stamps per (user, resource), bumped by the writes that change them"""
+    def __init__(self):
+        # Distinguishes stamps issued before a restart from ones issued after it
+        self.epoch = secrets.token_hex(4)
+        self.global_version = 0
+        self.versions: Dict[Tuple[str, str], int] = {}
+    
+    def bump(self, user_id: str, *resources: str):
+        """Invalidate the given resources for a user"""
+        for resource in resources:
+            key = (user_id, resource)
+            self.versions[key] = self.versions.get(key, 0) + 1
+    
+    def bump_global(self):
+        """Invalidate every user's resources (e.g. after a job refresh)"""
+        self.global_version += 1
+    
+    def etag(self, user_id: str, resource: str, variant: str = "") -> str:
+        version = self.versions.get((user_id, resource), 0)
+        # Streaks roll over at midnight without a write, so the day is part of the stamp
+        today = datetime.now().date().isoformat()
+        return f'W/"{resource}-{self.epoch}.{self.global_version}.{version}-{today}{variant}"'
+
+resource_versions = ResourceVersions()
+
+def check_not_modified(request: Request, user_id: str, resource: str, variant: str = "") -> Optional[Response]:
+    """Return a 304 response if the client already has the current version of a resource"""
+    etag = resource_versions.etag(user_id, resource, variant)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+    return None
+
+def set_resource_etag(response: Response, user_id: str, resource: str, variant: str = ""):
+    """Stamp a full response with the resource's current version"""
+    response.headers["ETag"] = resource_versions.etag(user_id, resource, variant)
+    response.headers["Cache-Control"] = "private, no-cache"
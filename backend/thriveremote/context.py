@@ -0,0 +1,27 @@
+"""Request context shared by the sub-requests of a batch"""
+from typing import Any, Dict, Optional
+from contextvars import ContextVar
+
+class RequestContext:
+    """The session and user resolved once for a batch and reused by each sub-request"""
+    def __init__(self, session_token: str, user_id: str, user: Dict[str, Any]):
+        self.session_token = session_token
+        self.user_id = user_id
+        self.users: Dict[str, Dict[str, Any]] = {user_id: user}
+        self.session_hits = 0
+        self.user_hits = 0
+
+    def cached_user_id(self, session_token: Optional[str]) -> Optional[str]:
+        if session_token and session_token == self.session_token:
+            self.session_hits += 1
+            return self.user_id
+        return None
+
+    def cached_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+        user = self.users.get(user_id)
+        if user is not None:
+            self.user_hits += 1
+        return user
+
+# Set by /api/batch around its sub-requests; None for ordinary requests
+request_context: ContextVar[Optional[RequestContext]] = ContextVar("request_context", default=None)
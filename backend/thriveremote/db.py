@@ -0,0 +1,64 @@
+"""MongoDB access; the client is created on first use and closed by the app lifespan"""
+import os
+import threading
+
+MONGO_URL = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+DATABASE_NAME = "thriveremote"
+
+_client = None
+_client_lock = threading.Lock()
+
+def get_client():
+    """Return the shared MongoClient, connecting on first use"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                from pymongo import MongoClient
+                from .metrics import mongo_command_listener
+                from .profiler import MONGO_PROFILE, mongo_profile_listener
+                listeners = [mongo_command_listener()]
+                if MONGO_PROFILE:
+                    listeners.append(mongo_profile_listener())
+                _client = MongoClient(MONGO_URL, event_listeners=listeners)
+    return _client
+
+def get_database():
+    return get_client()[DATABASE_NAME]
+
+def close_client():
+    """Close the shared client; the next access reconnects"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+class LazyCollection:
+    """Stands in for a pymongo collection and binds to it on first use"""
+    def __init__(self, name: str):
+        self.name = name
+        self._collection = None
+        self._bound_client = None
+
+    def __getattr__(self, attr):
+        client = get_client()
+        if self._bound_client is not client:
+            self._collection = client[DATABASE_NAME][self.name]
+            self._bound_client = client
+        return getattr(self._collection, attr)
+
+    def __repr__(self) -> str:
+        return f"LazyCollection({self.name!r})"
+
+# Collections
+users_collection = LazyCollection("users")
+jobs_collection = LazyCollection("jobs")
+applications_collection = LazyCollection("applications")
+tasks_collection = LazyCollection("tasks")
+achievements_collection = LazyCollection("achievements")
+user_sessions_collection = LazyCollection("user_sessions")
+productivity_logs_collection = LazyCollection("productivity_logs")
+relocate_data_collection = LazyCollection("relocate_data")
+relocate_content_collection = LazyCollection("relocate_content")
+leaderboards_collection = LazyCollection("leaderboards")
@@ -0,0 +1,78 @@
+"""orjson response rendering shared by every router"""
+from typing import Any, Optional
+import asyncio
+import functools
+import inspect
+
+import orjson
+from bson import ObjectId
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+# JSON encoding
+def _json_default(value):
+    """Encode the values orjson does not handle natively"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, BaseModel):
+        return value.model_dump() if hasattr(value, "model_dump") else value.dict()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def encode_json(content: Any) -> bytes:
+    """Serialize response content straight to JSON bytes"""
+    return orjson.dumps(content, default=_json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (datetimes, ObjectIds and models included)"""
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+class FastJSONRoute(APIRoute):
+    """Route that renders plain return values with FastJSONResponse, bypassing jsonable_encoder"""
+    def __init__(self, path: str, endpoint, **kwargs):
+        response_model = kwargs.get("response_model")
+        returns_plain_data = response_model is None or type(response_model).__name__ == "DefaultPlaceholder"
+        # include_router re-creates routes from already wrapped endpoints
+        if returns_plain_data and inspect.signature(endpoint).return_annotation is inspect.Signature.empty \
+                and asyncio.iscoroutinefunction(endpoint) and not getattr(endpoint, "_fast_json", False):
+            endpoint = self._encode_fast(endpoint, kwargs.get("status_code"))
+        super().__init__(path, endpoint, **kwargs)
+    
+    @staticmethod
+    def _encode_fast(endpoint, status_code: Optional[int]):
+        signature = inspect.signature(endpoint)
+        response_param = next(
+            (name for name, param in signature.parameters.items() if param.annotation is Response),
+            None
+        )
+        # Ask FastAPI to inject the sub-response so headers/status set by the endpoint survive
+        injected_param = None
+        if response_param is None:
+            injected_param = "_fast_json_sub_response"
+            signature = signature.replace(parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(injected_param, inspect.Parameter.KEYWORD_ONLY, annotation=Response)
+            ])
+        
+        @functools.wraps(endpoint)
+        async def wrapper(**kwargs):
+            sub_response = kwargs.pop(injected_param) if injected_param else kwargs[response_param]
+            result = await endpoint(**kwargs)
+            if isinstance(result, Response):
+                return result
+            
+            response = FastJSONResponse(result, status_code=sub_response.status_code or status_code or 200)
+            response.raw_headers.extend(
+                header for header in sub_response.raw_headers if header[0] != b"content-length"
+            )
+            return response
+        
+        wrapper.__signature__ = signature
+        wrapper._fast_json = True
+        return wrapper
@@ -0,0 +1,190 @@
+"""Domain events and the in-process bus that runs their side effects after the response"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Type
+from datetime import datetime
+import asyncio
+import logging
+import os
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+EVENT_QUEUE_SIZE = int(os.environ.get("EVENT_QUEUE_SIZE", 1000))
+EVENT_DRAIN_TIMEOUT = float(os.environ.get("EVENT_DRAIN_TIMEOUT", 5))
+
+# Domain events
+class DomainEvent(BaseModel):
+    user_id: str
+    occurred_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+
+class TaskCreated(DomainEvent):
+    task_id: str
+    task_title: str
+
+class TasksImported(DomainEvent):
+    count: int
+
+class TaskCompleted(DomainEvent):
+    task_id: str
+    task_title: str
+    previously_completed: bool = False
+
+class JobApplied(DomainEvent):
+    job_id: str
+    job_title: str
+    company: str
+
+class JobsRefreshed(DomainEvent):
+    jobs_count: int
+
+class PongScoreSubmitted(DomainEvent):
+    score: int
+    previous_high: int
+
+class TerminalCommandExecuted(DomainEvent):
+    command: str
+
+class EasterEggFound(DomainEvent):
+    kind: str
+
+class RelocationExplored(DomainEvent):
+    command: str
+
+class SavingsUpdated(DomainEvent):
+    amount: float
+    savings_goal: float
+
+class StreakUpdated(DomainEvent):
+    daily_streak: int
+
+class AchievementUnlocked(DomainEvent):
+    achievement_id: str
+
+EventHandler = Callable[[DomainEvent], Awaitable[Any]]
+
+class Subscriber:
+    """A named consumer with its own bounded queue, processed in publish order by one worker"""
+    def __init__(self, name: str, queue_size: int):
+        self.name = name
+        self.queue_size = queue_size
+        self.handlers: Dict[Type[DomainEvent], List[EventHandler]] = {}
+        self.queue: Optional[asyncio.Queue] = None
+        self.worker: Optional[asyncio.Task] = None
+        self.processed = 0
+        self.failed = 0
+        self.blocked = 0
+        self.max_depth = 0
+
+    def on(self, *event_types: Type[DomainEvent]):
+        """Register the decorated coroutine for these event types"""
+        def decorator(handler: EventHandler) -> EventHandler:
+            for event_type in event_types:
+                self.handlers.setdefault(event_type, []).append(handler)
+            return handler
+        return decorator
+
+    def handles(self, event: DomainEvent) -> bool:
+        return type(event) in self.handlers
+
+    async def handle(self, event: DomainEvent):
+        for handler in self.handlers.get(type(event), ()):
+            try:
+                await handler(event)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Event subscriber {self.name} failed on {type(event).__name__}: {e}")
+        self.processed += 1
+
+    async def put(self, event: DomainEvent):
+        if self.queue.full():
+            # Backpressure: the publishing request waits for this subscriber to catch up
+            self.blocked += 1
+        await self.queue.put(event)
+        self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    async def run(self):
+        while True:
+            event = await self.queue.get()
+            try:
+                await self.handle(event)
+            finally:
+                self.queue.task_done()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "events": sorted(event_type.__name__ for event_type in self.handlers),
+            "queued": self.queue.qsize() if self.queue else 0,
+            "max_depth": self.max_depth,
+            "queue_size": self.queue_size,
+            "processed": self.processed,
+            "failed": self.failed,
+            "blocked_publishes": self.blocked
+        }
+
+class EventBus:
+    """Typed in-process event bus.
+
+    Request handlers make their primary write, publish an event and respond.
+    Each subscriber drains its own bounded queue in a background worker, so a
+    slow subscriber delays only its own work until its queue fills, at which
+    point publishing waits. Until start() is called (scripts, benchmarks, apps
+    built without the lifespan) events are handled inline instead.
+    """
+    def __init__(self, queue_size: int = EVENT_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.subscribers: Dict[str, Subscriber] = {}
+        self.published: Dict[str, int] = {}
+        self.running = False
+
+    def subscriber(self, name: str) -> Subscriber:
+        if name not in self.subscribers:
+            self.subscribers[name] = Subscriber(name, self.queue_size)
+        return self.subscribers[name]
+
+    async def publish(self, event: DomainEvent):
+        if not isinstance(event, DomainEvent):
+            raise TypeError(f"Not a domain event: {type(event).__name__}")
+        event_name = type(event).__name__
+        self.published[event_name] = self.published.get(event_name, 0) + 1
+        for subscriber in self.subscribers.values():
+            if not subscriber.handles(event):
+                continue
+            if self.running:
+                await subscriber.put(event)
+            else:
+                await subscriber.handle(event)
+
+    async def start(self):
+        if self.running:
+            return
+        for subscriber in self.subscribers.values():
+            subscriber.queue = asyncio.Queue(subscriber.queue_size)
+            subscriber.worker = asyncio.create_task(subscriber.run(), name=f"subscriber:{subscriber.name}")
+        self.running = True
+
+    async def stop(self, timeout: float = EVENT_DRAIN_TIMEOUT):
+        """Stop accepting queued work, give workers `timeout` seconds to drain, then cancel them"""
+        if not self.running:
+            return
+        self.running = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(subscriber.queue.join() for subscriber in self.subscribers.values())),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Event bus stopped with undelivered events")
+        for subscriber in self.subscribers.values():
+            subscriber.worker.cancel()
+        await asyncio.gather(
+            *(subscriber.worker for subscriber in self.subscribers.values()), return_exceptions=True
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "published": self.published,
+            "subscribers": {name: subscriber.stats() for name, subscriber in self.subscribers.items()}
+        }
+
+event_bus = EventBus()
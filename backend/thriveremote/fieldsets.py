@@ -0,0 +1,38 @@
+"""Sparse fieldsets: the `fields=` query parameter of list and profile endpoints"""
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+import hashlib
+
+from fastapi import HTTPException
+
+def model_field_names(model) -> Tuple[str, ...]:
+    fields = getattr(model, "model_fields", None)
+    return tuple(fields if fields is not None else model.__fields__)
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[FrozenSet[str]]:
+    """Requested field names from a comma separated list, None when the caller wants whole documents"""
+    if fields is None:
+        return None
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    if not requested:
+        raise HTTPException(status_code=400, detail="No fields requested")
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested
+
+def fields_projection(requested: Optional[FrozenSet[str]], default: Dict[str, int]) -> Dict[str, int]:
+    """Mongo projection returning only the requested fields"""
+    if requested is None:
+        return default
+    return {"_id": 0, **{name: 1 for name in sorted(requested)}}
+
+def pick_fields(document: Dict[str, Any], requested: Optional[FrozenSet[str]]) -> Dict[str, Any]:
+    if requested is None:
+        return document
+    return {name: value for name, value in document.items() if name in requested}
+
+def fields_variant(requested: Optional[FrozenSet[str]]) -> str:
+    """ETag suffix telling fieldsets of the same resource apart"""
+    if requested is None:
+        return ""
+    return "+" + hashlib.sha1(",".join(sorted(requested)).encode()).hexdigest()[:8]
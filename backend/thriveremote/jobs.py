@@ -0,0 +1,389 @@
+"""Remotive job fetching, description normalization and the in-memory job catalog"""
+from typing import Dict, FrozenSet, List, Optional, Tuple
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from html.parser import HTMLParser
+import gzip
+import hashlib
+import html
+import logging
+import os
+import re
+import tempfile
+import uuid
+
+import orjson
+from fastapi import Request, Response
+
+from .caching import accepted_encodings, etag_matches, resource_versions
+from .db import jobs_collection
+from .encoding import encode_json
+from .fieldsets import model_field_names, pick_fields
+from .models import Job
+from .outbound import OutboundHTTP, outbound_http
+
+logger = logging.getLogger(__name__)
+
+# Job description normalization
+DESCRIPTION_SNIPPET_LENGTH = 280
+
+# Fields only needed by the job detail view; list endpoints project them out
+JOB_DETAIL_FIELDS = ["description_text", "description_html"]
+# Bookkeeping stored with each job but never served
+JOB_INTERNAL_FIELDS = ["refreshed_at", "feed_rank"]
+
+JOB_DETAIL_PROJECTION = {"_id": 0, **{field: 0 for field in JOB_INTERNAL_FIELDS}}
+JOB_LIST_PROJECTION = {**JOB_DETAIL_PROJECTION, **{field: 0 for field in JOB_DETAIL_FIELDS}}
+JOB_LIST_FIELDS = tuple(field for field in model_field_names(Job) if field not in JOB_DETAIL_FIELDS)
+
+# Pre-encoded `fields=` variants kept per snapshot, least recently used evicted first
+JOB_FIELD_VARIANTS = int(os.environ.get("JOB_FIELD_VARIANTS", 16))
+
+# (gzip level, brotli quality): the full catalog is compressed once per refresh, so at the
+# maximum; `fields=` variants and status patches are built on request, so cheaply
+SNAPSHOT_COMPRESSION = (9, 11)
+VARIANT_COMPRESSION = (1, 1)
+
+# Jobs that dropped out of the Remotive feed stay fetchable (details, apply) this long
+JOB_RETENTION_DAYS = float(os.environ.get("JOB_RETENTION_DAYS", 7))
+# A replica starting within this long of another's refresh serves the stored catalog instead of refetching
+JOB_STARTUP_REFRESH_AGE = float(os.environ.get("JOB_STARTUP_REFRESH_AGE", 900))
+JOB_ID_NAMESPACE = uuid.UUID("6f1c7a0e-3d5b-4c1e-9a7f-2b8e4d6c9a10")
+
+class DescriptionNormalizer(HTMLParser):
+    """Convert untrusted job description HTML to plain text and safe minimal HTML"""
+    ALLOWED_TAGS = {"p", "br", "ul", "ol", "li", "strong", "b", "em", "i", "h3", "h4", "a", "code", "pre", "blockquote"}
+    BLOCK_TAGS = {"p", "div", "ul", "ol", "li", "br", "h1", "h2", "h3", "h4", "h5", "h6", "pre", "blockquote", "tr", "section"}
+    HEADING_MAP = {"h1": "h3", "h2": "h3", "h5": "h4", "h6": "h4"}
+    VOID_TAGS = {"br"}
+    DROP_CONTENT_TAGS = {"script", "style", "iframe", "object", "embed", "noscript", "template"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.text_parts = []
+        self.html_parts = []
+        self.open_tags = []
+        self.skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.DROP_CONTENT_TAGS:
+            self.skip_depth += 1
+            return
+        if self.skip_depth:
+            return
+        if tag in ("p", "li") and tag in self.open_tags:
+            # Paragraphs and list items implicitly close their unterminated predecessor
+            self.handle_endtag(tag)
+        if tag in self.BLOCK_TAGS:
+            self.text_parts.append("\n")
+        if tag == "li":
+            self.text_parts.append("• ")
+
+        tag = self.HEADING_MAP.get(tag, tag)
+        if tag not in self.ALLOWED_TAGS:
+            return
+        if tag == "a":
+            href = dict(attrs).get("href") or ""
+            if not href.startswith(("http://", "https://")):
+                return
+            self.html_parts.append(f'<a href="{html.escape(href, quote=True)}" rel="nofollow noopener" target="_blank">')
+        else:
+            self.html_parts.append(f"<{tag}>")
+        if tag not in self.VOID_TAGS:
+            self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in self.VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self.DROP_CONTENT_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+            return
+        if self.skip_depth:
+            return
+        if tag in self.BLOCK_TAGS:
+            self.text_parts.append("\n")
+
+        tag = self.HEADING_MAP.get(tag, tag)
+        if tag in self.open_tags:
+            # Close anything left open inside this element so the output stays well formed
+            while self.open_tags:
+                open_tag = self.open_tags.pop()
+                self.html_parts.append(f"</{open_tag}>")
+                if open_tag == tag:
+                    break
+
+    def handle_data(self, data):
+        if self.skip_depth:
+            return
+        self.text_parts.append(data)
+        self.html_parts.append(html.escape(data, quote=False))
+
+    def result(self) -> Dict[str, str]:
+        self.close()
+        while self.open_tags:
+            self.html_parts.append(f"</{self.open_tags.pop()}>")
+
+        lines = (re.sub(r"\s+", " ", line).strip() for line in "".join(self.text_parts).split("\n"))
+        text = "\n".join(line for line in lines if line)
+        return {"text": text, "html": "".join(self.html_parts).strip()}
+
+def make_snippet(text: str, length: int = DESCRIPTION_SNIPPET_LENGTH) -> str:
+    """Shorten plain text on a word boundary for list views"""
+    text = " ".join(text.split())
+    if len(text) <= length:
+        return text
+    cut = text[:length].rsplit(" ", 1)[0] or text[:length]
+    return cut.rstrip(" ,.;:-") + "..."
+
+def normalize_description(raw_html: Optional[str]) -> Dict[str, str]:
+    """Normalize description HTML once at ingest into snippet, full text and safe HTML"""
+    if not raw_html:
+        return {"description": "", "description_text": "", "description_html": ""}
+
+    parser = DescriptionNormalizer()
+    try:
+        parser.feed(raw_html)
+        normalized = parser.result()
+    except Exception as e:
+        logger.warning(f"Falling back to tag stripping for job description: {e}")
+        text = html.unescape(re.sub(r"<[^>]+>", " ", raw_html))
+        normalized = {"text": " ".join(text.split()), "html": ""}
+
+    return {
+        "description": make_snippet(normalized["text"]),
+        "description_text": normalized["text"],
+        "description_html": normalized["html"]
+    }
+
+# Job catalog snapshot
+def brotli_compress(body: bytes, quality: int) -> Optional[bytes]:
+    """Brotli is optional and only imported once a snapshot is compressed; clients fall back to gzip"""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(body, quality=quality)
+
+class JobCatalogSnapshot:
+    """Immutable pre-encoded /api/jobs payload shared by every request until the next refresh"""
+    __slots__ = ("jobs", "source", "body", "gzip_body", "brotli_body", "etag", "created_at", "variants")
+    
+    def __init__(self, jobs: List[Dict], source: str = "live_api", compression: Tuple[int, int] = SNAPSHOT_COMPRESSION):
+        payload = {"jobs": jobs, "total": len(jobs), "source": source}
+        gzip_level, brotli_quality = compression
+        self.jobs = jobs
+        self.source = source
+        self.variants: "OrderedDict[FrozenSet[str], JobCatalogSnapshot]" = OrderedDict()
+        self.body = encode_json(payload)
+        self.gzip_body = gzip.compress(self.body, compresslevel=gzip_level, mtime=0)
+        self.brotli_body = brotli_compress(self.body, brotli_quality)
+        self.etag = '"' + hashlib.sha256(self.body).hexdigest()[:32] + '"'
+        self.created_at = datetime.now().isoformat()
+    
+    def encoded(self, accept_encoding: str) -> Tuple[bytes, Optional[str]]:
+        """Pick the best pre-compressed variant for the client"""
+        codings = accepted_encodings(accept_encoding)
+        if self.brotli_body is not None and "br" in codings:
+            return self.brotli_body, "br"
+        if "gzip" in codings or "*" in codings:
+            return self.gzip_body, "gzip"
+        return self.body, None
+    
+    def with_fields(self, fields: FrozenSet[str]) -> "JobCatalogSnapshot":
+        """The same catalog restricted to `fields`, kept for the most recently requested fieldsets"""
+        variant = self.variants.get(fields)
+        if variant is not None:
+            self.variants.move_to_end(fields)
+            return variant
+        variant = JobCatalogSnapshot([pick_fields(job, fields) for job in self.jobs], self.source, VARIANT_COMPRESSION)
+        self.variants[fields] = variant
+        if len(self.variants) > JOB_FIELD_VARIANTS:
+            self.variants.popitem(last=False)
+        return variant
+    
+    def to_response(self, request: Request) -> Response:
+        """Serve the snapshot from memory, answering conditional requests with 304"""
+        headers = {"ETag": self.etag, "Vary": "Accept-Encoding", "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        
+        body, encoding = self.encoded(request.headers.get("accept-encoding", ""))
+        if encoding:
+            headers["Content-Encoding"] = encoding
+        return Response(content=body, media_type="application/json", headers=headers)
+
+class JobCatalog:
+    """Holds the current job catalog snapshot, swapped atomically on refresh"""
+    def __init__(self):
+        self.snapshot: Optional[JobCatalogSnapshot] = None
+    
+    def publish(self, jobs: List[Dict]) -> JobCatalogSnapshot:
+        snapshot = JobCatalogSnapshot(jobs)
+        self.snapshot = snapshot
+        logger.info(f"Published job catalog snapshot {snapshot.etag} ({len(snapshot.body)} bytes)")
+        return snapshot
+    
+    def invalidate(self):
+        """Drop the snapshot after a write to the jobs collection"""
+        self.snapshot = None
+    
+    def set_application_status(self, job_id: str, status: str) -> Optional[JobCatalogSnapshot]:
+        """Patch one job's status into the current snapshot without re-reading Mongo.
+
+        The patched snapshot is compressed cheaply and not written to the warm-start
+        file; the next refresh, or warm_up after a restart, publishes the stored status.
+        """
+        snapshot = self.snapshot
+        if snapshot is None or not any(job["id"] == job_id for job in snapshot.jobs):
+            return snapshot
+        jobs = [{**job, "application_status": status} if job["id"] == job_id else job for job in snapshot.jobs]
+        self.snapshot = JobCatalogSnapshot(jobs, snapshot.source, VARIANT_COMPRESSION)
+        return self.snapshot
+    
+    def last_refreshed(self) -> Optional[datetime]:
+        """When the stored catalog was last refreshed from Remotive, by any replica"""
+        latest = jobs_collection.find_one({}, {"_id": 0, "refreshed_at": 1}, sort=[("refreshed_at", -1)])
+        if not latest or not latest.get("refreshed_at"):
+            return None
+        return datetime.fromisoformat(latest["refreshed_at"])
+    
+    def load_from_db(self) -> Optional[JobCatalogSnapshot]:
+        """Rebuild the snapshot from the jobs collection"""
+        # The latest refresh first, in feed order; jobs kept only for their retention period come after it
+        jobs = list(jobs_collection.find({}, JOB_LIST_PROJECTION).sort([("refreshed_at", -1), ("feed_rank", 1)]).limit(25))
+        if not jobs:
+            return None
+        return self.publish(jobs)
+    
+    def save_to_file(self, path: str):
+        """Persist the current snapshot so the next process can start warm"""
+        if self.snapshot is None:
+            return
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile("wb", dir=directory, delete=False) as f:
+            f.write(self.snapshot.body)
+            temp_path = f.name
+        os.replace(temp_path, path)
+    
+    def load_from_file(self, path: str) -> Optional[JobCatalogSnapshot]:
+        """Rebuild the snapshot from a file written by save_to_file"""
+        try:
+            with open(path, "rb") as f:
+                payload = orjson.loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable job catalog snapshot {path}: {e}")
+            return None
+        
+        jobs = payload.get("jobs") if isinstance(payload, dict) else None
+        if not jobs:
+            return None
+        return self.publish(jobs)
+
+job_catalog = JobCatalog()
+
+JOB_CATALOG_SNAPSHOT_PATH = os.environ.get(
+    "JOB_CATALOG_SNAPSHOT_PATH",
+    os.path.join(tempfile.gettempdir(), "thriveremote_job_catalog.json")
+)
+
+def stable_job_id(job: Dict) -> str:
+    """Derive the job id from Remotive's own id (or URL) so it survives refreshes and replicas"""
+    source_key = job.get("id") or job.get("url") or f"{job.get('company_name', '')}|{job.get('title', '')}"
+    return str(uuid.uuid5(JOB_ID_NAMESPACE, f"remotive:{source_key}"))
+
+# Job fetching service (existing)
+class JobFetchingService:
+    def __init__(self, http: OutboundHTTP):
+        self.http = http
+        self.api_url = os.environ.get("REMOTIVE_API_URL", "https://remotive.io/api/remote-jobs")
+    
+    async def fetch_remotive_jobs(self) -> List[Dict]:
+        """Fetch real jobs from Remotive API"""
+        try:
+            response = await self.http.get(self.api_url)
+            response.raise_for_status()
+            data = response.json()
+            
+            jobs = []
+            for job in data.get('jobs', [])[:25]:  # Limit to 25 recent jobs
+                normalized_job = {
+                    "id": stable_job_id(job),
+                    "title": job.get('title', ''),
+                    "company": job.get('company_name', ''),
+                    "location": job.get('candidate_required_location', 'Remote'),
+                    "salary": self._format_salary(job.get('salary')),
+                    "type": job.get('job_type', 'Full-time'),
+                    **normalize_description(job.get('description')),
+                    "skills": job.get('tags', [])[:5],  # Limit skills
+                    "posted_date": job.get('publication_date', datetime.now().isoformat()),
+                    "application_status": "not_applied",
+                    "source": "Remotive",
+                    "url": job.get('url', '')
+                }
+                jobs.append(normalized_job)
+            
+            return jobs
+        except Exception as e:
+            logger.error(f"Error fetching Remotive jobs: {e}")
+            return []
+    
+    def _format_salary(self, salary_text) -> str:
+        """Format salary text"""
+        if not salary_text:
+            return "Competitive"
+        return str(salary_text)[:50]  # Limit length
+    
+    def store_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Upsert fetched jobs by their stable id and return the list view of the stored documents"""
+        from pymongo import UpdateOne
+        
+        refreshed_at = datetime.now().isoformat()
+        # Ids served by earlier snapshots, warm-start files or other replicas keep resolving
+        jobs_collection.bulk_write([
+            UpdateOne(
+                {"id": job["id"]},
+                {
+                    "$set": {
+                        **{k: v for k, v in job.items() if k != "application_status"},
+                        "refreshed_at": refreshed_at,
+                        "feed_rank": rank
+                    },
+                    "$setOnInsert": {"application_status": job["application_status"]}
+                },
+                upsert=True
+            )
+            for rank, job in enumerate(jobs)
+        ], ordered=False)
+        
+        cutoff = (datetime.now() - timedelta(days=JOB_RETENTION_DAYS)).isoformat()
+        # Documents without refreshed_at predate stable ids and can never be refreshed again
+        jobs_collection.delete_many({"$or": [{"refreshed_at": {"$lt": cutoff}}, {"refreshed_at": {"$exists": False}}]})
+        
+        ids = [job["id"] for job in jobs]
+        stored = {job["id"]: job for job in jobs_collection.find({"id": {"$in": ids}}, JOB_LIST_PROJECTION)}
+        return [stored[job_id] for job_id in ids if job_id in stored]
+    
+    async def refresh_jobs(self):
+        """Fetch and store fresh jobs"""
+        jobs = await self.fetch_remotive_jobs()
+        
+        if jobs:
+            listed = self.store_jobs(jobs)
+            logger.info(f"Refreshed {len(jobs)} jobs from Remotive")
+            
+            job_catalog.publish(listed)
+            resource_versions.bump_global()
+            try:
+                job_catalog.save_to_file(JOB_CATALOG_SNAPSHOT_PATH)
+            except OSError as e:
+                logger.warning(f"Could not persist job catalog snapshot: {e}")
+        
+        return len(jobs)
+
+job_service = JobFetchingService(outbound_http)
@@ -0,0 +1,324 @@
+"""Global leaderboards kept in in-memory order-statistics lists"""
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from datetime import datetime
+import asyncio
+import bisect
+import logging
+import os
+
+from .db import leaderboards_collection, users_collection
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_PERSIST_SECONDS = float(os.environ.get("LEADERBOARD_PERSIST_SECONDS", 60))
+LEADERBOARD_PERSIST_TOP = int(os.environ.get("LEADERBOARD_PERSIST_TOP", 100))
+LEADERBOARD_NAME_CACHE = int(os.environ.get("LEADERBOARD_NAME_CACHE", 100000))
+
+# Entries are (-score, user_id) so ascending order is best first, ties broken by user id
+Entry = Tuple[float, str]
+
+class RankedList:
+    """Sorted list with positional access, split into buckets of at most 2 * load keys.
+
+    A binary search over bucket maxima finds the bucket, a Fenwick tree over
+    bucket lengths turns a bucket position into a global index and back, so
+    add, remove, rank and select cost O(log n) plus a memmove of one bucket.
+    """
+    def __init__(self, keys: Optional[List[Entry]] = None, load: int = 1000):
+        self.load = load
+        keys = sorted(keys or [])
+        self._lists: List[List[Entry]] = [keys[i:i + load] for i in range(0, len(keys), load)]
+        self._maxes: List[Entry] = [bucket[-1] for bucket in self._lists]
+        self._len = len(keys)
+        self._build_index()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def _build_index(self):
+        tree = [0] + [len(bucket) for bucket in self._lists]
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _update_index(self, pos: int, delta: int):
+        i = pos + 1
+        while i < len(self._tree):
+            self._tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, pos: int) -> int:
+        """Number of keys in the buckets before `pos`"""
+        total, i = 0, pos
+        while i > 0:
+            total += self._tree[i]
+            i -= i & -i
+        return total
+
+    def _locate(self, index: int) -> Tuple[int, int]:
+        """Bucket and offset of the key at global `index`"""
+        pos, step = 0, 1 << (len(self._tree).bit_length() - 1)
+        while step:
+            nxt = pos + step
+            if nxt < len(self._tree) and self._tree[nxt] <= index:
+                index -= self._tree[nxt]
+                pos = nxt
+            step >>= 1
+        return pos, index
+
+    def add(self, key: Entry):
+        if not self._lists:
+            self._lists.append([key])
+            self._maxes.append(key)
+            self._len = 1
+            self._build_index()
+            return
+        pos = bisect.bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            pos -= 1
+            self._lists[pos].append(key)
+            self._maxes[pos] = key
+        else:
+            bisect.insort(self._lists[pos], key)
+        self._len += 1
+        bucket = self._lists[pos]
+        if len(bucket) > 2 * self.load:
+            # Splitting shifts every later bucket, so the index is rebuilt (once per `load` inserts)
+            self._lists[pos:pos + 1] = [bucket[:self.load], bucket[self.load:]]
+            self._maxes[pos:pos + 1] = [bucket[self.load - 1], bucket[-1]]
+            self._build_index()
+        else:
+            self._update_index(pos, 1)
+
+    def remove(self, key: Entry) -> bool:
+        pos = bisect.bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return False
+        bucket = self._lists[pos]
+        i = bisect.bisect_left(bucket, key)
+        if i == len(bucket) or bucket[i] != key:
+            return False
+        del bucket[i]
+        self._len -= 1
+        if not bucket:
+            del self._lists[pos]
+            del self._maxes[pos]
+            self._build_index()
+        else:
+            self._maxes[pos] = bucket[-1]
+            self._update_index(pos, -1)
+        return True
+
+    def bisect_left(self, key: Entry) -> int:
+        """Number of keys that sort before `key`"""
+        pos = bisect.bisect_left(self._maxes, key)
+        if pos == len(self._maxes):
+            return self._len
+        return self._prefix(pos) + bisect.bisect_left(self._lists[pos], key)
+
+    def __getitem__(self, index: int) -> Entry:
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("RankedList index out of range")
+        pos, offset = self._locate(index)
+        return self._lists[pos][offset]
+
+    def islice(self, start: int, stop: int) -> Iterator[Entry]:
+        """Keys at positions [start, stop) without copying the buckets in between"""
+        start, stop = max(start, 0), min(stop, self._len)
+        if start >= stop:
+            return
+        pos, offset = self._locate(start)
+        remaining = stop - start
+        while remaining > 0:
+            chunk = self._lists[pos][offset:offset + remaining]
+            yield from chunk
+            remaining -= len(chunk)
+            pos, offset = pos + 1, 0
+
+class Leaderboard:
+    """Ranking of users by one numeric field of their user document.
+
+    Scores at or below `floor` (nobody has played yet, a streak of one day) are
+    not stored; those users share the rank after the last ranked user. The board
+    is built from the users collection on first use and then kept current by
+    set_score() calls from the code paths that write the field.
+    """
+    def __init__(self, name: str, field: str, title: str, floor: float = 0):
+        self.name = name
+        self.field = field
+        self.title = title
+        self.floor = floor
+        self.scores: Dict[str, float] = {}
+        self.ranked = RankedList()
+        self.loaded = False
+        self.dirty = False
+        self.updates = 0
+        self.persisted_at: Optional[str] = None
+        self._loading: Optional[asyncio.Task] = None
+        self._pending: Optional[Dict[str, float]] = None
+
+    def _read(self) -> Dict[str, float]:
+        scores = {}
+        cursor = users_collection.find({self.field: {"$gt": self.floor}}, {"_id": 0, "user_id": 1, self.field: 1})
+        for user in cursor:
+            scores[user["user_id"]] = user[self.field]
+        return scores
+
+    async def _load(self):
+        self._pending = {}
+        try:
+            scores = await asyncio.to_thread(self._read)
+            # Writes that landed while the collection was being read win over what was read
+            scores.update(self._pending)
+            scores = {user_id: score for user_id, score in scores.items() if score > self.floor}
+            self.scores = scores
+            self.ranked = RankedList([(-score, user_id) for user_id, score in scores.items()])
+            self.loaded = True
+            logger.info(f"Leaderboard {self.name} loaded with {len(scores)} ranked users")
+        finally:
+            self._pending = None
+
+    async def ensure_loaded(self):
+        if self.loaded:
+            return
+        if self._loading is None or (self._loading.done() and not self.loaded):
+            self._loading = asyncio.ensure_future(self._load())
+        await asyncio.shield(self._loading)
+
+    def set_score(self, user_id: str, score: Optional[float]):
+        """Record a user's new value of the field; O(log n)"""
+        if score is None:
+            return
+        if self._pending is not None:
+            self._pending[user_id] = score
+        if not self.loaded:
+            return
+        previous = self.scores.get(user_id)
+        if previous == score:
+            return
+        if previous is not None:
+            self.ranked.remove((-previous, user_id))
+            del self.scores[user_id]
+        if score > self.floor:
+            self.ranked.add((-score, user_id))
+            self.scores[user_id] = score
+        self.updates += 1
+        self.dirty = True
+
+    def rank_of_score(self, score: float) -> int:
+        """1-based competition rank: one more than the number of users with a higher score"""
+        if score <= self.floor:
+            return len(self.ranked) + 1
+        return self.ranked.bisect_left((-score, "")) + 1
+
+    def position(self, user_id: str) -> int:
+        """0-based position of the user in board order (unranked users sort last)"""
+        score = self.scores.get(user_id)
+        if score is None:
+            return len(self.ranked)
+        return self.ranked.bisect_left((-score, user_id))
+
+    def entries(self, start: int, stop: int) -> List[Tuple[int, str, float]]:
+        """(rank, user_id, score) for board positions [start, stop)"""
+        entries, rank, last_score = [], 0, None
+        for position, (negative, user_id) in enumerate(self.ranked.islice(start, stop), start):
+            score = -negative
+            if score != last_score:
+                rank = position + 1 if last_score is not None else self.rank_of_score(score)
+                last_score = score
+            entries.append((rank, user_id, score))
+        return entries
+
+    def snapshot(self, top: int = LEADERBOARD_PERSIST_TOP) -> Dict[str, Any]:
+        return {
+            "_id": self.name,
+            "field": self.field,
+            "ranked_users": len(self.ranked),
+            "top": [
+                {"rank": rank, "user_id": user_id, "score": score}
+                for rank, user_id, score in self.entries(0, top)
+            ],
+            "persisted_at": datetime.now().isoformat()
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "ranked_users": len(self.ranked),
+            "updates": self.updates,
+            "persisted_at": self.persisted_at
+        }
+
+class Leaderboards:
+    """The boards, username lookups for displayed entries and periodic persistence"""
+    def __init__(self, boards: List[Leaderboard]):
+        self.boards: Dict[str, Leaderboard] = {board.name: board for board in boards}
+        self.by_field: Dict[str, Leaderboard] = {board.field: board for board in boards}
+        self.usernames: Dict[str, str] = {}
+
+    def get(self, name: str) -> Optional[Leaderboard]:
+        return self.boards.get(name)
+
+    def set_score(self, field: str, user_id: str, score: Optional[float]):
+        board = self.by_field.get(field)
+        if board is not None:
+            board.set_score(user_id, score)
+
+    def forget_username(self, user_id: str):
+        self.usernames.pop(user_id, None)
+
+    def resolve_usernames(self, user_ids: List[str]) -> Dict[str, str]:
+        """Usernames for the given users, fetching the uncached ones in a single query"""
+        missing = [user_id for user_id in user_ids if user_id not in self.usernames]
+        if missing:
+            if len(self.usernames) + len(missing) > LEADERBOARD_NAME_CACHE:
+                self.usernames.clear()
+            for user in users_collection.find({"user_id": {"$in": missing}}, {"_id": 0, "user_id": 1, "username": 1}):
+                self.usernames[user["user_id"]] = user.get("username", "")
+        return {user_id: self.usernames.get(user_id, "") for user_id in user_ids}
+
+    async def load_all(self):
+        for board in self.boards.values():
+            try:
+                await board.ensure_loaded()
+            except Exception as e:
+                logger.error(f"Failed to load leaderboard {board.name}: {e}")
+
+    def persist(self, force: bool = False) -> int:
+        """Write the top of every changed board to the leaderboards collection"""
+        written = 0
+        for board in self.boards.values():
+            if not board.loaded or not (board.dirty or force):
+                continue
+            snapshot = board.snapshot()
+            names = self.resolve_usernames([entry["user_id"] for entry in snapshot["top"]])
+            for entry in snapshot["top"]:
+                entry["username"] = names[entry["user_id"]]
+            leaderboards_collection.replace_one({"_id": board.name}, snapshot, upsert=True)
+            board.dirty = False
+            board.persisted_at = snapshot["persisted_at"]
+            written += 1
+        return written
+
+    async def run(self, interval: float = LEADERBOARD_PERSIST_SECONDS):
+        """Load every board, then persist the changed ones every `interval` seconds"""
+        await self.load_all()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.persist()
+            except Exception as e:
+                logger.error(f"Failed to persist leaderboards: {e}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {name: board.stats() for name, board in self.boards.items()}
+
+leaderboards = Leaderboards([
+    Leaderboard("productivity", "productivity_score", "Productivity"),
+    Leaderboard("pong", "pong_high_score", "Pong High Score"),
+    Leaderboard("streak", "daily_streak", "Daily Streak", floor=1),
+])
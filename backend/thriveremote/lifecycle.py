@@ -0,0 +1,112 @@
+"""Warm start, background refresh and resource cleanup owned by the app lifespan"""
+from typing import Dict
+from contextlib import asynccontextmanager
+from datetime import datetime
+import asyncio
+import logging
+
+from fastapi import FastAPI
+
+from .db import close_client, relocate_data_collection
+from .events import event_bus
+from .jobs import JOB_CATALOG_SNAPSHOT_PATH, JOB_STARTUP_REFRESH_AGE, job_catalog, job_service
+from .leaderboards import leaderboards
+from .loopmonitor import LOOP_MONITOR, loop_monitor
+from .outbound import outbound_http
+
+logger = logging.getLogger(__name__)
+
+# Warm-up state reported by the health endpoints
+warmup_state = {
+    "started_at": None,
+    "ready": False,
+    "catalog_source": None,
+    "refresh": "pending"
+}
+
+background_tasks: Dict[str, asyncio.Task] = {}
+
+async def warm_up():
+    """Load the last good catalog from Mongo if needed, then refresh jobs from the network unless another replica just did"""
+    if job_catalog.snapshot is None:
+        try:
+            if await asyncio.to_thread(job_catalog.load_from_db):
+                warmup_state.update(catalog_source="mongo", ready=True)
+                logger.info("Job catalog warm-started from Mongo")
+        except Exception as e:
+            logger.error(f"Failed to load job catalog from Mongo: {e}")
+    
+    # Per-user relocation copies are superseded by the shared relocate_content collection
+    try:
+        result = await asyncio.to_thread(relocate_data_collection.delete_many, {"content": {"$exists": True}})
+        if result.deleted_count:
+            logger.info(f"Removed {result.deleted_count} legacy per-user relocation copies")
+    except Exception as e:
+        logger.error(f"Failed to clean up legacy relocation data: {e}")
+    
+    # Replicas booting together share the catalog one of them just fetched
+    try:
+        last_refreshed = await asyncio.to_thread(job_catalog.last_refreshed)
+    except Exception as e:
+        last_refreshed = None
+        logger.error(f"Failed to read job catalog age: {e}")
+    if last_refreshed and (datetime.now() - last_refreshed).total_seconds() < JOB_STARTUP_REFRESH_AGE:
+        if warmup_state["catalog_source"] == "file":
+            # The file may predate the other replica's refresh
+            try:
+                if await asyncio.to_thread(job_catalog.load_from_db):
+                    warmup_state["catalog_source"] = "mongo"
+            except Exception as e:
+                logger.error(f"Failed to load job catalog from Mongo: {e}")
+        warmup_state.update(refresh="skipped", ready=True)
+        logger.info(f"Skipping startup job refresh, catalog refreshed at {last_refreshed.isoformat()}")
+        return
+    
+    warmup_state["refresh"] = "running"
+    try:
+        count = await job_service.refresh_jobs()
+        warmup_state["refresh"] = "done" if count else "empty"
+        if count:
+            warmup_state["catalog_source"] = "network"
+        logger.info("Initial job refresh completed")
+    except Exception as e:
+        warmup_state["refresh"] = "failed"
+        logger.error(f"Failed to refresh jobs on startup: {e}")
+    
+    # Serve regardless once the refresh attempt is over; /api/jobs retries when empty
+    warmup_state["ready"] = True
+
+async def start_up():
+    """Start serving from the last good job catalog and refresh in the background"""
+    warmup_state["started_at"] = datetime.now().isoformat()
+    if LOOP_MONITOR:
+        loop_monitor.start()
+    await event_bus.start()
+    if job_catalog.load_from_file(JOB_CATALOG_SNAPSHOT_PATH):
+        warmup_state.update(catalog_source="file", ready=True)
+        logger.info(f"Job catalog warm-started from {JOB_CATALOG_SNAPSHOT_PATH}")
+    
+    background_tasks["warm_up"] = asyncio.create_task(warm_up(), name="warm_up")
+    background_tasks["leaderboards"] = asyncio.create_task(leaderboards.run(), name="leaderboards")
+
+async def shut_down():
+    """Stop background work, drain pending events and close pooled outbound and Mongo connections"""
+    for task in background_tasks.values():
+        task.cancel()
+    background_tasks.clear()
+    await event_bus.stop()
+    try:
+        leaderboards.persist()
+    except Exception as e:
+        logger.error(f"Failed to persist leaderboards: {e}")
+    await outbound_http.close()
+    close_client()
+    loop_monitor.stop()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await start_up()
+    try:
+        yield
+    finally:
+        await shut_down()
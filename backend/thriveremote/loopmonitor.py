@@ -0,0 +1,208 @@
+"""Event-loop lag monitor: finds the synchronous calls that hold the loop and the routes they run in.
+
+Enabled with LOOP_MONITOR=1. A heartbeat task sleeps LOOP_MONITOR_INTERVAL_MS
+at a time and records how late it wakes up; that lateness is the loop lag.
+A watchdog thread checks the heartbeat and, once it is more than
+LOOP_MONITOR_THRESHOLD_MS overdue, samples the loop thread's stack with
+sys._current_frames(). The stall is attributed to the task that was running
+(the request's route for HTTP requests, the task name for background work)
+and to the innermost thriveremote frame on that stack, the call site to fix.
+Each stall is logged, with the full stack the first time a site is seen, and
+counted in /metrics.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+
+from .metrics import UNMATCHED_ROUTE, Histogram, format_labels, format_metric
+
+logger = logging.getLogger(__name__)
+
+LOOP_MONITOR = os.environ.get("LOOP_MONITOR", "").lower() in ("1", "true", "yes")
+LOOP_MONITOR_INTERVAL_MS = float(os.environ.get("LOOP_MONITOR_INTERVAL_MS", 50))
+LOOP_MONITOR_THRESHOLD_MS = float(os.environ.get("LOOP_MONITOR_THRESHOLD_MS", 100))
+# Distinct (route, site) series kept before further stalls are counted under "other"
+LOOP_MONITOR_MAX_SITES = int(os.environ.get("LOOP_MONITOR_MAX_SITES", 200))
+LOOP_MONITOR_STACK_DEPTH = 20
+
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_ROOT = os.path.dirname(PACKAGE_DIR)
+# Callbacks that run outside any task (transport callbacks, call_soon handlers)
+LOOP_CALLBACK = "loop"
+# Tasks left with asyncio's default Task-N name
+UNNAMED_TASK = "background"
+# Stalls that ended between two watchdog checks, before a stack could be taken
+UNSAMPLED = "unsampled"
+OTHER_SITE = "other"
+
+def call_site(frame) -> str:
+    """The innermost frame in this package, where the blocking call was made, else the innermost frame"""
+    innermost = frame
+    while frame is not None:
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(PACKAGE_DIR + os.sep) and filename != os.path.abspath(__file__):
+            return f"{os.path.relpath(filename, SOURCE_ROOT)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return f"{os.path.basename(innermost.f_code.co_filename)}:{innermost.f_lineno} in {innermost.f_code.co_name}"
+
+class Stall:
+    """What the loop thread was doing when the heartbeat went overdue"""
+    __slots__ = ("route", "site", "stack")
+
+    def __init__(self, route: str, site: str, stack: List[str]):
+        self.route = route
+        self.site = site
+        self.stack = stack
+
+class LoopMonitor:
+    """Heartbeat on the loop, watchdog in a thread, stalls tallied by route and call site"""
+    def __init__(self, interval_ms: float = LOOP_MONITOR_INTERVAL_MS, threshold_ms: float = LOOP_MONITOR_THRESHOLD_MS):
+        self.interval = interval_ms / 1000
+        self.threshold = threshold_ms / 1000
+        self.lock = threading.Lock()
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[int] = None
+        self.heartbeat: Optional[asyncio.Task] = None
+        self.watchdog: Optional[threading.Thread] = None
+        self.stopping = threading.Event()
+        self.last_beat = time.monotonic()
+        # Scopes of the requests in flight, by the task serving them
+        self.requests: Dict[asyncio.Task, Dict[str, Any]] = {}
+        # (heartbeat it was taken for, stall) from the watchdog, consumed when that heartbeat lands
+        self.pending: Optional[Tuple[float, Optional[Stall]]] = None
+        self.lag = Histogram(LAG_BUCKETS)
+        self.max_lag = 0.0
+        self.stalls: Dict[Tuple[str, str], int] = {}
+        self.stalled_seconds: Dict[Tuple[str, str], float] = {}
+
+    @property
+    def running(self) -> bool:
+        return self.heartbeat is not None
+
+    def start(self):
+        """Start the heartbeat on the running loop and the watchdog thread"""
+        if self.running:
+            return
+        self.loop = asyncio.get_running_loop()
+        self.loop_thread = threading.get_ident()
+        self.last_beat = time.monotonic()
+        self.stopping = threading.Event()
+        self.heartbeat = asyncio.create_task(self.beat(), name="loop_monitor")
+        self.watchdog = threading.Thread(target=self.watch, name="loop-monitor", daemon=True)
+        self.watchdog.start()
+        logger.info(
+            f"Event loop monitor started (interval {self.interval * 1000:.0f} ms, "
+            f"threshold {self.threshold * 1000:.0f} ms)"
+        )
+
+    def stop(self):
+        if not self.running:
+            return
+        self.stopping.set()
+        self.heartbeat.cancel()
+        self.heartbeat = None
+        self.watchdog = None
+
+    async def beat(self):
+        while True:
+            self.last_beat = beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self.record(beat, max(0.0, time.monotonic() - beat - self.interval))
+
+    def watch(self):
+        """Watchdog thread: sample the loop thread's stack once per stall"""
+        while not self.stopping.wait(self.interval / 2):
+            beat = self.last_beat
+            pending = self.pending
+            if time.monotonic() - beat - self.interval >= self.threshold and (pending is None or pending[0] != beat):
+                self.pending = (beat, self.sample())
+
+    def sample(self) -> Optional[Stall]:
+        frame = sys._current_frames().get(self.loop_thread)
+        if frame is None:
+            return None
+        stack = traceback.format_stack(frame, limit=LOOP_MONITOR_STACK_DEPTH)
+        return Stall(self.current_route(), call_site(frame), stack)
+
+    def current_route(self) -> str:
+        # Reads the loop's current task from this thread; a stale answer only mislabels one sample
+        task = asyncio.current_task(self.loop)
+        if task is None:
+            return LOOP_CALLBACK
+        scope = self.requests.get(task)
+        if scope is not None:
+            return f"{scope['method']} {getattr(scope.get('route'), 'path', UNMATCHED_ROUTE)}"
+        name = task.get_name()
+        return UNNAMED_TASK if name.startswith("Task-") else name
+
+    def record(self, beat: float, lag: float):
+        pending, self.pending = self.pending, None
+        stall = pending[1] if pending is not None and pending[0] == beat else None
+        with self.lock:
+            self.lag.observe(lag)
+            self.max_lag = max(self.max_lag, lag)
+            if lag < self.threshold:
+                return
+            if stall is None:
+                stall = Stall(UNSAMPLED, UNSAMPLED, [])
+            key = (stall.route, stall.site)
+            first = key not in self.stalls
+            if first and len(self.stalls) >= LOOP_MONITOR_MAX_SITES:
+                key, first = (stall.route, OTHER_SITE), False
+            self.stalls[key] = self.stalls.get(key, 0) + 1
+            self.stalled_seconds[key] = self.stalled_seconds.get(key, 0.0) + lag
+        message = f"Event loop blocked for {lag * 1000:.0f} ms in {stall.route} at {stall.site}"
+        if first and stall.stack:
+            logger.warning(message + "\n" + "".join(stall.stack).rstrip())
+        else:
+            logger.warning(message)
+
+    def metric_lines(self) -> List[str]:
+        """Exposition lines for /metrics"""
+        with self.lock:
+            name = "thriveremote_event_loop_lag_seconds"
+            lines = [f"# HELP {name} Event loop heartbeat lateness.", f"# TYPE {name} histogram"]
+            for bound, count in self.lag.cumulative():
+                lines.append(f"{name}_bucket{format_labels({'le': bound})} {count}")
+            lines.append(f"{name}_sum {self.lag.total:.6f}")
+            lines.append(f"{name}_count {self.lag.count}")
+            lines.extend(format_metric(
+                "thriveremote_event_loop_lag_max_seconds", "Largest event loop lag seen.", "gauge",
+                [({}, f"{self.max_lag:.6f}")]
+            ))
+            lines.extend(format_metric(
+                "thriveremote_event_loop_blocked_total", "Event loop stalls over the threshold by route and call site.",
+                "counter", [({"route": route, "site": site}, count) for (route, site), count in sorted(self.stalls.items())]
+            ))
+            lines.extend(format_metric(
+                "thriveremote_event_loop_blocked_seconds_total", "Event loop time lost to stalls by route and call site.",
+                "counter", [({"route": route, "site": site}, f"{seconds:.6f}")
+                            for (route, site), seconds in sorted(self.stalled_seconds.items())]
+            ))
+        return lines
+
+loop_monitor = LoopMonitor()
+
+class LoopMonitorMiddleware:
+    """Register each HTTP request's task so stalls inside it are attributed to its route"""
+    def __init__(self, app, monitor: LoopMonitor = loop_monitor):
+        self.app = app
+        self.monitor = monitor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        self.monitor.requests[task] = scope
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.requests.pop(task, None)
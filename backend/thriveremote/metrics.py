@@ -0,0 +1,201 @@
+"""Per-route request and Mongo command metrics, rendered in the Prometheus text format"""
+from typing import Dict, List, Optional, Tuple
+from contextvars import ContextVar
+import bisect
+import threading
+import time
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MONGO_COMMAND_BUCKETS = (0, 1, 2, 3, 5, 8, 12, 20, 50)
+# Requests that matched no route share one label so unknown paths cannot grow the series
+UNMATCHED_ROUTE = "unmatched"
+# Commands issued outside any request (startup, background tasks, event subscribers)
+BACKGROUND_ROUTE = "background"
+
+class RequestCost:
+    """Mongo work done on behalf of one request, attributed to its route once the response is sent"""
+    __slots__ = ("count", "seconds", "by_command")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        # command name -> [count, seconds, failures]
+        self.by_command: Dict[str, List[float]] = {}
+
+    def add(self, command: str, seconds: float, failed: bool):
+        self.count += 1
+        self.seconds += seconds
+        tally = self.by_command.get(command)
+        if tally is None:
+            tally = self.by_command[command] = [0, 0.0, 0]
+        tally[0] += 1
+        tally[1] += seconds
+        tally[2] += failed
+
+# Set by MetricsMiddleware for the duration of each request
+request_cost: ContextVar[Optional[RequestCost]] = ContextVar("request_cost", default=None)
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        buckets, running = [], 0
+        for bound, count in zip(self.bounds, self.counts):
+            running += count
+            buckets.append((format_value(bound), running))
+        buckets.append(("+Inf", self.count))
+        return buckets
+
+def format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+def escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def format_labels(labels: Dict[str, str]) -> str:
+    return "{" + ",".join(f'{name}="{escape_label(value)}"' for name, value in labels.items()) + "}"
+
+def format_metric(name: str, help_text: str, metric_type: str, samples: List[Tuple[Dict[str, str], float]]) -> List[str]:
+    """Exposition lines for a metric maintained elsewhere (gauges read at scrape time)"""
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        lines.append(f"{name}{format_labels(labels) if labels else ''} {value}")
+    return lines
+
+class MetricsRegistry:
+    """Request counts, latency and Mongo cost keyed by method and route template"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started_at = time.time()
+        self.requests: Dict[Tuple[str, str, int], int] = {}
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        self.mongo_per_request: Dict[Tuple[str, str], Histogram] = {}
+        self.mongo_commands: Dict[Tuple[str, str], int] = {}
+        self.mongo_seconds: Dict[Tuple[str, str], float] = {}
+        self.mongo_failures: Dict[Tuple[str, str], int] = {}
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float, cost: RequestCost):
+        with self.lock:
+            key = (method, route)
+            self.requests[(method, route, status)] = self.requests.get((method, route, status), 0) + 1
+            if key not in self.latency:
+                self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.mongo_per_request[key] = Histogram(MONGO_COMMAND_BUCKETS)
+            self.latency[key].observe(seconds)
+            self.mongo_per_request[key].observe(cost.count)
+            for command, (count, command_seconds, failures) in cost.by_command.items():
+                self._add_commands(route, command, count, command_seconds, failures)
+
+    def _add_commands(self, route: str, command: str, count: int, seconds: float, failures: int):
+        key = (route, command)
+        self.mongo_commands[key] = self.mongo_commands.get(key, 0) + count
+        self.mongo_seconds[key] = self.mongo_seconds.get(key, 0.0) + seconds
+        if failures:
+            self.mongo_failures[key] = self.mongo_failures.get(key, 0) + failures
+
+    def observe_command(self, command: str, seconds: float, failed: bool = False):
+        cost = request_cost.get()
+        if cost is not None:
+            cost.add(command, seconds, failed)
+            return
+        with self.lock:
+            self._add_commands(BACKGROUND_ROUTE, command, 1, seconds, int(failed))
+
+    def render(self, extra: Optional[List[str]] = None) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)"""
+        with self.lock:
+            lines = [
+                "# HELP thriveremote_process_start_time_seconds Start time of the process since the epoch.",
+                "# TYPE thriveremote_process_start_time_seconds gauge",
+                f"thriveremote_process_start_time_seconds {self.started_at:.3f}",
+                "# HELP thriveremote_http_requests_total HTTP requests by method, route and status.",
+                "# TYPE thriveremote_http_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self.requests.items()):
+                labels = format_labels({"method": method, "route": route, "status": str(status)})
+                lines.append(f"thriveremote_http_requests_total{labels} {count}")
+            for name, help_text, histograms in (
+                ("thriveremote_http_request_duration_seconds", "HTTP request latency by method and route.", self.latency),
+                ("thriveremote_http_request_mongo_commands", "Mongo commands issued per HTTP request.", self.mongo_per_request),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} histogram")
+                for (method, route), histogram in sorted(histograms.items()):
+                    labels = {"method": method, "route": route}
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{name}_bucket{format_labels({**labels, 'le': bound})} {count}")
+                    lines.append(f"{name}_sum{format_labels(labels)} {histogram.total:.6f}")
+                    lines.append(f"{name}_count{format_labels(labels)} {histogram.count}")
+            for name, help_text, values in (
+                ("thriveremote_mongo_commands_total", "Mongo commands by route and command name.", self.mongo_commands),
+                ("thriveremote_mongo_command_seconds_total", "Time spent in Mongo commands by route and command name.",
+                 self.mongo_seconds),
+                ("thriveremote_mongo_command_failures_total", "Failed Mongo commands by route and command name.",
+                 self.mongo_failures),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (route, command), value in sorted(values.items()):
+                    rendered = f"{value:.6f}" if isinstance(value, float) else str(value)
+                    lines.append(f"{name}{format_labels({'route': route, 'command': command})} {rendered}")
+        lines.extend(extra or [])
+        return "\n".join(lines) + "\n"
+
+metrics = MetricsRegistry()
+
+class MetricsMiddleware:
+    """ASGI middleware timing each HTTP request and attributing its Mongo commands to the matched route"""
+    def __init__(self, app, registry: MetricsRegistry = metrics):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        cost = RequestCost()
+        cost_token = request_cost.set(cost)
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_cost.reset(cost_token)
+            # The router records the matched route in the scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            self.registry.observe_request(scope["method"], route, status, time.perf_counter() - started, cost)
+
+def mongo_command_listener():
+    """A pymongo CommandListener feeding the registry; built lazily so pymongo stays unimported until Mongo is used"""
+    from pymongo import monitoring
+
+    class MongoCommandMetrics(monitoring.CommandListener):
+        def started(self, event):
+            pass
+
+        def succeeded(self, event):
+            metrics.observe_command(event.command_name, event.duration_micros / 1e6)
+
+        def failed(self, event):
+            metrics.observe_command(event.command_name, event.duration_micros / 1e6, failed=True)
+
+    return MongoCommandMetrics()
@@ -0,0 +1,117 @@
+"""Pydantic models"""
+from typing import List, Optional, Dict, Any
+
+from pydantic import BaseModel
+
+class User(BaseModel):
+    user_id: str
+    username: str
+    email: Optional[str] = None
+    password_hash: str
+    created_date: str
+    last_active: str
+    total_sessions: int = 0
+    productivity_score: int = 0
+    daily_streak: int = 0
+    last_streak_date: Optional[str] = None
+    savings_goal: float = 5000.0
+    current_savings: float = 0.0
+    settings: Dict[str, Any] = {}
+
+class LoginRequest(BaseModel):
+    username: str
+    password: str
+
+class RegisterRequest(BaseModel):
+    username: str
+    password: str
+    email: Optional[str] = None
+
+class Job(BaseModel):
+    id: str
+    title: str
+    company: str
+    location: str
+    salary: str
+    type: str
+    description: str  # plain-text list snippet
+    description_text: str = ""
+    description_html: str = ""
+    skills: List[str]
+    posted_date: str
+    application_status: str = "not_applied"
+    source: str = "API"
+    url: Optional[str] = None
+
+class Application(BaseModel):
+    id: str
+    user_id: str
+    job_id: str
+    job_title: str
+    company: str
+    status: str
+    applied_date: str
+    follow_up_date: Optional[str] = None
+    notes: str = ""
+
+class Task(BaseModel):
+    id: str
+    user_id: str
+    title: str
+    description: str
+    status: str  # todo, in_progress, completed
+    priority: str  # low, medium, high
+    category: str
+    due_date: Optional[str] = None
+    created_date: str
+    completed_date: Optional[str] = None
+
+class Achievement(BaseModel):
+    id: str
+    user_id: str
+    achievement_type: str
+    title: str
+    description: str
+    icon: str
+    unlocked: bool
+    unlock_date: Optional[str] = None
+
+class PongGameResult(BaseModel):
+    score: int
+    played_at: Optional[str] = None
+
+class PongScoreBatch(BaseModel):
+    games: List[PongGameResult]
+
+class BatchSubRequest(BaseModel):
+    id: Optional[str] = None
+    method: str = "GET"
+    path: str
+    headers: Dict[str, str] = {}
+
+class BatchRequest(BaseModel):
+    requests: List[BatchSubRequest]
+
+class ProductivityLog(BaseModel):
+    id: str
+    user_id: str
+    action: str
+    timestamp: str
+    points: int
+    metadata: Dict[str, Any] = {}
+
+class RelocateContent(BaseModel):
+    data_type: str  # properties, cost_analysis, moving_tips, etc.
+    content_hash: str
+    version: int
+    title: str
+    content: Any
+    source: str = "move_uk_demo"
+    created_date: str
+
+class RelocateData(BaseModel):
+    user_id: str
+    data_type: str = "content_refs"
+    refs: Dict[str, Dict[str, Any]]  # data_type -> {"content_hash", "version"}
+    bundle_version: str
+    updated_date: str
@@ -0,0 +1,133 @@
+"""Push notifications: an in-process pub/sub hub feeding one SSE stream per session"""
+from typing import Any, Dict, Iterator, Optional, Set
+from contextlib import contextmanager
+from datetime import datetime
+import asyncio
+import os
+
+from .encoding import encode_json
+
+SSE_QUEUE_SIZE = int(os.environ.get("SSE_QUEUE_SIZE", 100))
+SSE_KEEPALIVE_SECONDS = float(os.environ.get("SSE_KEEPALIVE_SECONDS", 15))
+
+def make_notification(notification_id: str, kind: str, title: str, message: str) -> Dict[str, Any]:
+    return {
+        "id": notification_id,
+        "type": kind,
+        "title": title,
+        "message": message,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def streak_notification(streak: int) -> Dict[str, Any]:
+    return make_notification("streak_week", "achievement", "Weekly Streak! 🔥", f"{streak} days strong! Keep going!")
+
+def productivity_notification(productivity: int) -> Dict[str, Any]:
+    return make_notification(
+        "productivity_milestone", "success", "Productivity Beast! 🚀", f"{productivity} points and climbing!"
+    )
+
+def pending_applications_notification(pending_apps: int) -> Dict[str, Any]:
+    return make_notification(
+        "pending_applications", "info", "Follow-up Reminder 📋", f"You have {pending_apps} pending applications"
+    )
+
+def achievement_notification(achievement: Dict[str, Any]) -> Dict[str, Any]:
+    return make_notification(
+        achievement["id"], "achievement",
+        f"{achievement.get('icon', '🏆')} {achievement.get('title', 'Achievement')} unlocked!",
+        achievement.get("description", "")
+    )
+
+def sse_frame(event: str, data: Any, event_id: Optional[int] = None) -> bytes:
+    """One Server-Sent Events frame; orjson output never contains raw newlines"""
+    frame = b"id: %d\n" % event_id if event_id is not None else b""
+    return frame + b"event: " + event.encode() + b"\ndata: " + encode_json(data) + b"\n\n"
+
+SSE_KEEPALIVE_FRAME = b": keep-alive\n\n"
+
+class Subscription:
+    """One connected session; a bounded queue that drops its oldest frame when the client falls behind"""
+    __slots__ = ("user_id", "queue", "dropped")
+
+    def __init__(self, user_id: str, maxsize: int):
+        self.user_id = user_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self.dropped = 0
+
+    def deliver(self, frame: bytes) -> bool:
+        dropped = False
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            dropped = True
+        self.queue.put_nowait(frame)
+        return not dropped
+
+    async def next_frame(self, timeout: float) -> bytes:
+        """Next queued frame, or a keep-alive comment once the connection has been idle for `timeout`"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return SSE_KEEPALIVE_FRAME
+
+class NotificationHub:
+    """Fans events out to the sessions of a user.
+
+    Publishing for a user with no open stream is a dict lookup, so callers
+    can check `has_subscribers` before doing any extra work for the payload.
+    Each event is encoded once and the same frame is queued for every session.
+    """
+    def __init__(self, queue_size: int = SSE_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self.subscribers: Dict[str, Set[Subscription]] = {}
+        self.sequence = 0
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def has_subscribers(self, user_id: str) -> bool:
+        return user_id in self.subscribers
+
+    @contextmanager
+    def subscribe(self, user_id: str) -> Iterator[Subscription]:
+        subscription = Subscription(user_id, self.queue_size)
+        self.subscribers.setdefault(user_id, set()).add(subscription)
+        try:
+            yield subscription
+        finally:
+            sessions = self.subscribers.get(user_id)
+            if sessions is not None:
+                sessions.discard(subscription)
+                if not sessions:
+                    del self.subscribers[user_id]
+
+    def publish(self, user_id: str, event: str, data: Any) -> int:
+        """Queue an event for every open session of the user; returns the number of sessions reached"""
+        sessions = self.subscribers.get(user_id)
+        if not sessions:
+            return 0
+
+        self.sequence += 1
+        self.published += 1
+        frame = sse_frame(event, data, self.sequence)
+        for subscription in sessions:
+            if not subscription.deliver(frame):
+                self.dropped += 1
+        self.delivered += len(sessions)
+        return len(sessions)
+
+    def notify(self, user_id: str, notification: Dict[str, Any]) -> int:
+        return self.publish(user_id, "notification", notification)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "users": len(self.subscribers),
+            "connections": sum(len(sessions) for sessions in self.subscribers.values()),
+            "published": self.published,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+            "queue_size": self.queue_size
+        }
+
+notification_hub = NotificationHub()
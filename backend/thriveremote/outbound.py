@@ -0,0 +1,185 @@
+"""Shared outbound HTTP layer: one pooled client with retries, breakers and per-host metrics"""
+from typing import TYPE_CHECKING, Any, Dict, Optional
+from urllib.parse import urlsplit
+import asyncio
+import logging
+import os
+import random
+import time
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+# Shared outbound HTTP layer
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host whose circuit breaker is open"""
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets one probe through after a cool-down"""
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+    
+    def allow(self) -> bool:
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self.state = "half_open"
+            return True
+        # While half open only the single probe request is in flight
+        return self.state == "closed"
+    
+    def record_success(self):
+        self.state = "closed"
+        self.failures = 0
+    
+    def record_failure(self):
+        self.failures += 1
+        if self.state == "half_open" or self.failures >= self.failure_threshold:
+            self.state = "open"
+            self.opened_at = time.monotonic()
+    
+    def abandon_probe(self):
+        """A probe that ended without an answer (cancelled, invalid request) reopens for another cool-down"""
+        if self.state == "half_open":
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+def parse_host_timeouts(spec: str) -> Dict[str, float]:
+    """Parse OUTBOUND_HOST_TIMEOUTS such as remotive.io=10,move-uk-demo.emergent.host=5"""
+    timeouts = {}
+    for item in spec.split(","):
+        host, _, seconds = item.partition("=")
+        if host.strip() and seconds.strip():
+            timeouts[host.strip()] = float(seconds)
+    return timeouts
+
+class OutboundHTTP:
+    """One pooled httpx client for all outbound calls, with retries, breakers and per-host metrics"""
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    RETRYABLE_STATUS = {429, 502, 503, 504}
+    
+    def __init__(self):
+        self.default_timeout = float(os.environ.get("OUTBOUND_TIMEOUT", 10))
+        self.host_timeouts = parse_host_timeouts(os.environ.get("OUTBOUND_HOST_TIMEOUTS", ""))
+        self.max_retries = int(os.environ.get("OUTBOUND_MAX_RETRIES", 2))
+        self.backoff_base = 0.2
+        self.backoff_cap = 2.0
+        self.max_connections = int(os.environ.get("OUTBOUND_MAX_CONNECTIONS", 50))
+        self.max_keepalive_connections = int(os.environ.get("OUTBOUND_MAX_KEEPALIVE", 10))
+        self._client: Optional["httpx.AsyncClient"] = None
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+    
+    @property
+    def client(self) -> "httpx.AsyncClient":
+        if self._client is None or self._client.is_closed:
+            # httpx (and the async backends it pulls in) is only imported once a call goes out
+            import httpx
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=30.0
+            )
+            self._client = httpx.AsyncClient(limits=limits, timeout=self.default_timeout)
+        return self._client
+    
+    def _host_metrics(self, host: str) -> Dict[str, Any]:
+        if host not in self.metrics:
+            self.metrics[host] = {
+                "requests": 0, "errors": 0, "retries": 0, "short_circuited": 0,
+                "latency_ms_total": 0.0, "latency_ms_max": 0.0, "last_status": None
+            }
+        return self.metrics[host]
+    
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff"""
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+    
+    async def request(self, method: str, url: str, retries: Optional[int] = None, **kwargs) -> "httpx.Response":
+        """Send a request, retrying idempotent calls and failing fast while the host is down"""
+        import httpx
+        
+        method = method.upper()
+        host = urlsplit(url).hostname or ""
+        breaker = self.breakers.setdefault(host, CircuitBreaker())
+        metrics = self._host_metrics(host)
+        kwargs.setdefault("timeout", self.host_timeouts.get(host, self.default_timeout))
+        max_retries = (self.max_retries if retries is None else retries) if method in self.IDEMPOTENT_METHODS else 0
+        
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                metrics["short_circuited"] += 1
+                raise CircuitOpenError(f"Circuit open for {host}")
+            
+            metrics["requests"] += 1
+            started = time.perf_counter()
+            try:
+                response = await self.client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                failure, response = e, None
+            except BaseException:
+                # Otherwise the breaker would stay half open, refusing every later call to the host
+                breaker.abandon_probe()
+                raise
+            else:
+                failure = None if response.status_code < 500 and response.status_code != 429 else response
+            finally:
+                latency_ms = (time.perf_counter() - started) * 1000
+                metrics["latency_ms_total"] += latency_ms
+                metrics["latency_ms_max"] = max(metrics["latency_ms_max"], latency_ms)
+            
+            if response is not None:
+                metrics["last_status"] = response.status_code
+            if failure is None:
+                breaker.record_success()
+                return response
+            
+            metrics["errors"] += 1
+            breaker.record_failure()
+            retryable = response is None or response.status_code in self.RETRYABLE_STATUS
+            if attempt >= max_retries or not retryable:
+                if response is not None:
+                    return response
+                raise failure
+            
+            attempt += 1
+            metrics["retries"] += 1
+            await asyncio.sleep(self._backoff(attempt))
+    
+    async def get(self, url: str, **kwargs) -> "httpx.Response":
+        return await self.request("GET", url, **kwargs)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Per-host latency, error and breaker state"""
+        hosts = {}
+        for host, metrics in self.metrics.items():
+            completed = metrics["requests"]
+            hosts[host] = {
+                **metrics,
+                "latency_ms_avg": round(metrics["latency_ms_total"] / completed, 2) if completed else None,
+                "latency_ms_total": round(metrics["latency_ms_total"], 2),
+                "latency_ms_max": round(metrics["latency_ms_max"], 2),
+                "timeout_seconds": self.host_timeouts.get(host, self.default_timeout),
+                "circuit": self.breakers[host].state
+            }
+        return {
+            "pool": {
+                "max_connections": self.max_connections,
+                "max_keepalive_connections": self.max_keepalive_connections
+            },
+            "hosts": hosts
+        }
+    
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+outbound_http = OutboundHTTP()
@@ -0,0 +1,185 @@
+"""Development profiler for Mongo access: N+1 patterns, slow queries with their plans, per-request reports.
+
+Enabled with MONGO_PROFILE=1 (development and staging only). Every Mongo
+command issued while handling a request is recorded by shape, that is
+command, collection and filter with the values replaced by their types. A
+shape repeated MONGO_PROFILE_REPEAT times or more in one request is reported
+as an N+1 pattern; a command slower than MONGO_PROFILE_SLOW_MS is logged with
+its explain() plan, fetched after the response has been sent. Each response
+carries an X-Mongo-Profile header summarising the request.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from contextvars import ContextVar
+import asyncio
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+MONGO_PROFILE = os.environ.get("MONGO_PROFILE", "").lower() in ("1", "true", "yes")
+MONGO_PROFILE_REPEAT = int(os.environ.get("MONGO_PROFILE_REPEAT", 5))
+MONGO_PROFILE_SLOW_MS = float(os.environ.get("MONGO_PROFILE_SLOW_MS", 100))
+PROFILE_HEADER = "X-Mongo-Profile"
+
+# Commands whose plan explain() can show
+EXPLAINABLE_COMMANDS = {"find", "aggregate", "count", "distinct", "update", "delete", "findAndModify"}
+# Driver and session fields that explain() rejects or that say nothing about the query
+COMMAND_ENVELOPE_FIELDS = {"lsid", "$db", "$clusterTime", "$readPreference", "txnNumber", "signature"}
+
+def value_shape(value: Any) -> Any:
+    """A filter with its values replaced by type names, so queries differing only in values compare equal"""
+    if isinstance(value, dict):
+        return {key: value_shape(item) for key, item in sorted(value.items())}
+    if isinstance(value, (list, tuple)):
+        return "[...]" if value else "[]"
+    return type(value).__name__
+
+def command_filter(command_name: str, command: Dict[str, Any]) -> Any:
+    if command_name in ("find", "count", "distinct"):
+        return command.get("filter", command.get("query"))
+    if command_name == "findAndModify":
+        return command.get("query")
+    if command_name in ("update", "delete"):
+        statements = command.get(command_name + "s") or [{}]
+        return statements[0].get("q")
+    if command_name == "aggregate":
+        first_stage = (command.get("pipeline") or [{}])[0]
+        return first_stage.get("$match")
+    return None
+
+def command_shape(command_name: str, command: Dict[str, Any]) -> str:
+    collection = command.get(command_name)
+    query = command_filter(command_name, command)
+    shape = f"{command_name} {collection}"
+    return f"{shape} {value_shape(query)}" if query is not None else shape
+
+def plan_summary(plan: Dict[str, Any]) -> str:
+    """Winning plan stages from the root down, e.g. FETCH > IXSCAN(user_id_1)"""
+    stages, stage = [], plan
+    while stage:
+        name = stage.get("stage", "?")
+        if stage.get("indexName"):
+            name += f"({stage['indexName']})"
+        stages.append(name)
+        stage = stage.get("inputStage") or (stage.get("inputStages") or [None])[0]
+    return " > ".join(stages)
+
+class RequestProfile:
+    """Commands issued on behalf of one request"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes: Dict[str, int] = {}
+        self.in_flight: Dict[Tuple[Any, int], Tuple[str, Dict[str, Any], str]] = {}
+        self.slow: List[Tuple[str, float, Dict[str, Any], str]] = []
+
+    def started(self, key: Tuple[Any, int], command_name: str, command: Dict[str, Any], database: str):
+        shape = command_shape(command_name, command)
+        with self.lock:
+            self.shapes[shape] = self.shapes.get(shape, 0) + 1
+            self.in_flight[key] = (command_name, command, database)
+
+    def finished(self, key: Tuple[Any, int], seconds: float):
+        with self.lock:
+            command_name, command, database = self.in_flight.pop(key, (None, None, None))
+            self.count += 1
+            self.seconds += seconds
+            if command_name and seconds * 1000 >= MONGO_PROFILE_SLOW_MS:
+                self.slow.append((command_name, seconds, command, database))
+
+    def repeated(self) -> List[Tuple[str, int]]:
+        return sorted(
+            ((shape, count) for shape, count in self.shapes.items() if count >= MONGO_PROFILE_REPEAT),
+            key=lambda item: -item[1]
+        )
+
+    def header(self) -> str:
+        parts = [f"commands={self.count}", f"time_ms={self.seconds * 1000:.1f}", f"shapes={len(self.shapes)}"]
+        repeated = self.repeated()
+        if repeated:
+            parts.append("n_plus_one=" + ",".join(
+                ":".join(shape.split(" ")[:2]) + f"x{count}" for shape, count in repeated
+            ))
+        if self.slow:
+            parts.append(f"slow={len(self.slow)}")
+        return "; ".join(parts)
+
+# Set by ProfilerMiddleware for the duration of each request
+request_profile: ContextVar[Optional[RequestProfile]] = ContextVar("request_profile", default=None)
+
+def explain_slow_command(route: str, command_name: str, seconds: float, command: Dict[str, Any], database: str):
+    """Log a slow command with its query plan; runs off the request path"""
+    from .db import get_client
+
+    query = {key: value for key, value in command.items() if key not in COMMAND_ENVELOPE_FIELDS}
+    summary = f"Slow Mongo {command_shape(command_name, command)} ({seconds * 1000:.1f} ms) in {route}"
+    if command_name not in EXPLAINABLE_COMMANDS:
+        logger.warning(summary)
+        return
+    try:
+        explained = get_client()[database].command({"explain": query, "verbosity": "queryPlanner"})
+        plan = plan_summary(explained.get("queryPlanner", {}).get("winningPlan", {}))
+        scan = " (collection scan)" if "COLLSCAN" in plan else ""
+        logger.warning(f"{summary}: plan {plan}{scan}")
+    except Exception as e:
+        logger.warning(f"{summary}: explain failed: {e}")
+
+class ProfilerMiddleware:
+    """Attach a RequestProfile to each HTTP request, report it in a header and log what it flags"""
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = RequestProfile()
+        token = request_profile.set(profile)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((PROFILE_HEADER.lower().encode("latin-1"), profile.header().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_profile.reset(token)
+            self.report(scope, profile)
+
+    def report(self, scope: Dict[str, Any], profile: RequestProfile):
+        route = f"{scope['method']} {getattr(scope.get('route'), 'path', scope['path'])}"
+        for shape, count in profile.repeated():
+            logger.warning(f"N+1 Mongo pattern in {route}: {count}x {shape}")
+        if profile.slow:
+            loop = asyncio.get_running_loop()
+            for command_name, seconds, command, database in profile.slow:
+                # The executor does not copy the context, so explain() is not counted against the request
+                loop.run_in_executor(None, explain_slow_command, route, command_name, seconds, command, database)
+
+def mongo_profile_listener():
+    """A pymongo CommandListener feeding the current request's profile; built lazily like the metrics listener"""
+    from pymongo import monitoring
+
+    class MongoCommandProfiler(monitoring.CommandListener):
+        def started(self, event):
+            profile = request_profile.get()
+            if profile is not None:
+                profile.started(
+                    (event.connection_id, event.request_id), event.command_name, event.command, event.database_name
+                )
+
+        def succeeded(self, event):
+            profile = request_profile.get()
+            if profile is not None:
+                profile.finished((event.connection_id, event.request_id), event.duration_micros / 1e6)
+
+        def failed(self, event):
+            self.succeeded(event)
+
+    return MongoCommandProfiler()
@@ -0,0 +1,291 @@
+"""In-memory property search and geo indexes over the shared relocation content"""
+from typing import Any, Dict, List, Optional, Tuple
+import bisect
+import heapq
+import math
+
+from .relocation import normalize_property, relocate_service, relocate_store
+
+class PropertySearchIndex:
+    """In-memory property index: price-sorted buckets per bedroom count plus feature bitsets"""
+    SORTS = ("price_asc", "price_desc", "bedrooms_asc", "bedrooms_desc")
+    
+    def __init__(self):
+        self.version: Optional[str] = None
+        self.size = 0
+        self.feature_bits: Dict[str, int] = {}
+        self._bedroom_keys: List[int] = []
+        # bedrooms -> (sorted prices, entries as (price, bathrooms, feature mask, property))
+        self._buckets: Dict[int, Tuple[List[int], List[Tuple[int, int, int, Dict]]]] = {}
+    
+    def rebuild(self, properties: List[Dict[str, Any]], version: Optional[str] = None):
+        """Rebuild the index unless it already holds this content version"""
+        if version is not None and version == self.version:
+            return
+        
+        feature_bits: Dict[str, int] = {}
+        grouped: Dict[int, List[Tuple[int, int, int, Dict]]] = {}
+        for prop in properties:
+            if "price_value" not in prop:
+                prop = normalize_property(prop)
+            if prop["price_value"] is None:
+                continue
+            mask = 0
+            for feature in prop["features"]:
+                bit = feature_bits.setdefault(feature.lower(), 1 << len(feature_bits))
+                mask |= bit
+            grouped.setdefault(prop["bedrooms"], []).append((prop["price_value"], prop["bathrooms"], mask, prop))
+        
+        buckets = {}
+        for bedrooms, entries in grouped.items():
+            entries.sort(key=lambda entry: (entry[0], entry[3].get("id", "")))
+            buckets[bedrooms] = ([entry[0] for entry in entries], entries)
+        
+        # Swap in one go so concurrent searches never see a half-built index
+        self.feature_bits, self._buckets = feature_bits, buckets
+        self._bedroom_keys = sorted(buckets)
+        self.size = sum(len(entries) for entries in grouped.values())
+        self.version = version
+    
+    def feature_mask(self, features: List[str]) -> Optional[int]:
+        """Bitmask for the requested features, None if any is unknown (nothing can match)"""
+        mask = 0
+        for feature in features:
+            bit = self.feature_bits.get(feature.lower())
+            if bit is None:
+                return None
+            mask |= bit
+        return mask
+    
+    def search(
+        self,
+        min_price: Optional[int] = None,
+        max_price: Optional[int] = None,
+        min_bedrooms: Optional[int] = None,
+        max_bedrooms: Optional[int] = None,
+        min_bathrooms: Optional[int] = None,
+        features: Optional[List[str]] = None,
+        sort: str = "price_asc",
+        limit: int = 20,
+        offset: int = 0
+    ) -> Dict[str, Any]:
+        """Range search in O(b log n + k) for b bedroom buckets and k scanned matches"""
+        required = self.feature_mask(features or [])
+        if required is None:
+            return {"properties": [], "has_more": False}
+        
+        keys = self._bedroom_keys
+        lo_key = bisect.bisect_left(keys, min_bedrooms) if min_bedrooms is not None else 0
+        hi_key = bisect.bisect_right(keys, max_bedrooms) if max_bedrooms is not None else len(keys)
+        descending = sort.endswith("_desc")
+        
+        ranges = []
+        for bedrooms in keys[lo_key:hi_key]:
+            prices, entries = self._buckets[bedrooms]
+            start = bisect.bisect_left(prices, min_price) if min_price is not None else 0
+            end = bisect.bisect_right(prices, max_price) if max_price is not None else len(prices)
+            if start < end:
+                ranges.append((entries, start, end))
+        
+        def iterate(entries, start, end):
+            indexes = range(end - 1, start - 1, -1) if descending else range(start, end)
+            for index in indexes:
+                yield entries[index]
+        
+        streams = [iterate(*price_range) for price_range in ranges]
+        if sort.startswith("price"):
+            candidates = heapq.merge(*streams, key=lambda entry: entry[0], reverse=descending)
+        else:
+            candidates = (entry for stream in (reversed(streams) if descending else streams) for entry in stream)
+        
+        results = []
+        skipped = 0
+        for price, bathrooms, mask, prop in candidates:
+            if mask & required != required:
+                continue
+            if min_bathrooms is not None and bathrooms < min_bathrooms:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            if len(results) == limit:
+                return {"properties": results, "has_more": True}
+            results.append(prop)
+        
+        return {"properties": results, "has_more": False}
+
+property_index = PropertySearchIndex()
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in kilometres"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * 6371.0 * math.asin(math.sqrt(a))
+
+def service_category(group: str, service: Dict[str, Any]) -> str:
+    """Map a local_services entry to a nearby-search category"""
+    service_type = str(service.get("type", "")).lower()
+    if group == "schools":
+        return "school"
+    if group == "healthcare":
+        return "gp_surgery" if "gp" in service_type else "hospital"
+    if group == "transport":
+        return "station" if "station" in service or service_type == "train" else "bus"
+    return group
+
+class GeoGridIndex:
+    """Uniform lat/lng grid for nearest-neighbour and radius queries over geotagged items"""
+    KM_PER_DEGREE = 111.32
+    
+    def __init__(self, cell_degrees: float = 0.05):
+        self.cell_degrees = cell_degrees
+        self.version: Optional[Tuple] = None
+        self.size = 0
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, str, Dict]]] = {}
+        self._bounds: Optional[Tuple[int, int, int, int]] = None
+    
+    def _cell(self, lat: float, lng: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.cell_degrees), math.floor(lng / self.cell_degrees))
+    
+    def _ring_km(self, lat: float) -> float:
+        """Smallest distance covered by one ring of cells around a point at this latitude"""
+        shrink = math.cos(math.radians(min(89.0, abs(lat) + self.cell_degrees)))
+        return self.cell_degrees * self.KM_PER_DEGREE * shrink
+    
+    def rebuild(self, items: List[Tuple[str, Dict[str, Any]]], version: Optional[Tuple] = None):
+        """Index (category, item) pairs that carry coordinates"""
+        if version is not None and version == self.version:
+            return
+        
+        cells: Dict[Tuple[int, int], List[Tuple[float, float, str, Dict]]] = {}
+        for category, item in items:
+            coordinates = item.get("coordinates") or {}
+            if "lat" not in coordinates or "lng" not in coordinates:
+                continue
+            lat, lng = float(coordinates["lat"]), float(coordinates["lng"])
+            cells.setdefault(self._cell(lat, lng), []).append((lat, lng, category, item))
+        
+        rows = [cell[0] for cell in cells]
+        cols = [cell[1] for cell in cells]
+        self._bounds = (min(rows), max(rows), min(cols), max(cols)) if cells else None
+        self._cells = cells
+        self.size = sum(len(entries) for entries in cells.values())
+        self.version = version
+    
+    def _ring(self, center: Tuple[int, int], ring: int):
+        row, col = center
+        if ring == 0:
+            yield center
+            return
+        for offset in range(-ring, ring + 1):
+            yield (row - ring, col + offset)
+            yield (row + ring, col + offset)
+        for offset in range(-ring + 1, ring):
+            yield (row + offset, col - ring)
+            yield (row + offset, col + ring)
+    
+    def nearest(self, lat: float, lng: float, category: str, limit: int = 3,
+                max_km: Optional[float] = None) -> List[Tuple[float, Dict]]:
+        """Closest items of a category, expanding rings of cells until the answer is settled"""
+        if self._bounds is None:
+            return []
+        center = self._cell(lat, lng)
+        ring_km = self._ring_km(lat)
+        found: List[Tuple[float, int, Dict]] = []
+        
+        # Rings past the farthest occupied cell cannot contain anything
+        min_row, max_row, min_col, max_col = self._bounds
+        last_ring = max(abs(center[0] - min_row), abs(center[0] - max_row),
+                        abs(center[1] - min_col), abs(center[1] - max_col))
+        
+        def visit(cell):
+            for item_lat, item_lng, item_category, item in self._cells.get(cell, ()):
+                if item_category != category:
+                    continue
+                distance = haversine_km(lat, lng, item_lat, item_lng)
+                if max_km is not None and distance > max_km:
+                    continue
+                entry = (-distance, id(item), item)
+                if len(found) < limit:
+                    heapq.heappush(found, entry)
+                elif distance < -found[0][0]:
+                    heapq.heapreplace(found, entry)
+        
+        for ring in range(0, last_ring + 1):
+            # Everything outside the scanned rings is at least this far away
+            if ring > 0 and len(found) >= limit and -found[0][0] <= (ring - 1) * ring_km:
+                break
+            if max_km is not None and ring > 0 and (ring - 1) * ring_km > max_km:
+                break
+            if 8 * ring > len(self._cells):
+                # Sparse grid far from the query: visiting the remaining occupied cells is cheaper
+                for cell in self._cells:
+                    if max(abs(cell[0] - center[0]), abs(cell[1] - center[1])) >= ring:
+                        visit(cell)
+                break
+            for cell in self._ring(center, ring):
+                visit(cell)
+        
+        return sorted(((-negative, item) for negative, _, item in found), key=lambda pair: pair[0])
+    
+    def within(self, lat: float, lng: float, radius_km: float, category: str) -> List[Tuple[float, Dict]]:
+        """Items of a category within a radius, scanning only the covering cells"""
+        lat_span = radius_km / self.KM_PER_DEGREE
+        lng_span = radius_km / (self.KM_PER_DEGREE * max(0.01, math.cos(math.radians(min(89.0, abs(lat) + lat_span)))))
+        row_lo, col_lo = self._cell(lat - lat_span, lng - lng_span)
+        row_hi, col_hi = self._cell(lat + lat_span, lng + lng_span)
+        
+        results = []
+        if (row_hi - row_lo + 1) * (col_hi - col_lo + 1) > len(self._cells):
+            # Radius covers more cells than are occupied, walk the occupied ones instead
+            candidate_cells = [cell for cell in self._cells if row_lo <= cell[0] <= row_hi and col_lo <= cell[1] <= col_hi]
+        else:
+            candidate_cells = [(row, col) for row in range(row_lo, row_hi + 1) for col in range(col_lo, col_hi + 1)]
+        for cell in candidate_cells:
+            for item_lat, item_lng, item_category, item in self._cells.get(cell, ()):
+                if item_category != category:
+                    continue
+                distance = haversine_km(lat, lng, item_lat, item_lng)
+                if distance <= radius_km:
+                    results.append((distance, item))
+        
+        results.sort(key=lambda pair: pair[0])
+        return results
+
+geo_index = GeoGridIndex()
+
+async def load_geo_index() -> GeoGridIndex:
+    """Make sure the geo index reflects the current shared properties and local services"""
+    properties = relocate_store.get("properties")
+    local_services = relocate_store.get("local_services")
+    if properties is None or local_services is None:
+        relocate_data = await relocate_service.get_data()
+        if relocate_data:
+            relocate_store.publish(relocate_data)
+        properties = relocate_data.get("properties", [])
+        local_services = relocate_data.get("local_services", {})
+    
+    refs = relocate_store.refs
+    version = tuple(refs.get(data_type, {}).get("content_hash") for data_type in ("properties", "local_services"))
+    if all(version) and version == geo_index.version:
+        # Unchanged content, skip collecting the items
+        return geo_index
+    
+    items = [("property", prop) for prop in properties]
+    for group, services in local_services.items():
+        items.extend((service_category(group, service), service) for service in services)
+    geo_index.rebuild(items, version if all(version) else None)
+    return geo_index
+
+async def load_property_index() -> PropertySearchIndex:
+    """Make sure the property index reflects the current shared properties"""
+    properties = relocate_store.get("properties")
+    if properties is None:
+        relocate_data = await relocate_service.get_data()
+        if relocate_data:
+            relocate_store.publish(relocate_data)
+        properties = relocate_data.get("properties", [])
+    
+    ref = relocate_store.refs.get("properties")
+    property_index.rebuild(properties, ref["content_hash"] if ref else None)
+    return property_index
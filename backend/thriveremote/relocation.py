@@ -0,0 +1,356 @@
+"""Relocate Me integration: fetching, normalization and the shared content store"""
+from typing import Any, Dict, Optional
+from collections import OrderedDict
+from datetime import datetime
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import time
+
+import orjson
+
+from .db import relocate_content_collection, relocate_data_collection
+from .outbound import OutboundHTTP, outbound_http
+
+logger = logging.getLogger(__name__)
+
+# Users whose content refs are known to be current, least recently seen evicted first
+RELOCATE_USER_BUNDLE_CACHE = int(os.environ.get("RELOCATE_USER_BUNDLE_CACHE", 50000))
+
+# Relocate Me integration service
+class RelocateMeService:
+    def __init__(self, http: OutboundHTTP):
+        self.http = http
+        self.base_url = os.environ.get("RELOCATE_ME_URL", "https://move-uk-demo.emergent.host")
+        self.demo_credentials = {
+            "username": "relocate_user",
+            "password": "SecurePass2025!"
+        }
+        
+        # Stale-while-revalidate cache of the last good payload
+        self.cache_ttl = float(os.environ.get("RELOCATE_CACHE_TTL", 900))
+        self.retry_interval = float(os.environ.get("RELOCATE_CACHE_RETRY", 30))
+        self._cached_data: Optional[Dict[str, Any]] = None
+        self._fetched_at = 0.0
+        self._retry_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.metrics = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_failures": 0}
+    
+    async def get_data(self) -> Dict[str, Any]:
+        """Serve relocation data from memory, revalidating in the background once stale"""
+        now = time.monotonic()
+        if self._cached_data is None:
+            # Cold cache: the first caller waits, concurrent callers share the same fetch
+            self.metrics["misses"] += 1
+            if now < self._retry_at:
+                # The last cold fetch failed; back off instead of making every request wait on a new attempt
+                return {}
+            await asyncio.shield(self._schedule_refresh())
+            return self._cached_data or {}
+        
+        if now - self._fetched_at < self.cache_ttl:
+            self.metrics["hits"] += 1
+        else:
+            self.metrics["stale_hits"] += 1
+            if now >= self._retry_at:
+                self._schedule_refresh()
+        
+        return self._cached_data
+    
+    def _schedule_refresh(self) -> asyncio.Task:
+        """Start a background refresh unless one is already running"""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh(), name="relocate_refresh")
+        return self._refresh_task
+    
+    async def _refresh(self):
+        self.metrics["refreshes"] += 1
+        try:
+            data = await self.login_and_fetch_data()
+        except Exception as e:
+            # Keep serving the last good copy
+            self.metrics["refresh_failures"] += 1
+            self._retry_at = time.monotonic() + self.retry_interval
+            logger.warning(f"Relocate Me refresh failed, serving cached copy: {e}")
+            return
+        
+        self._cached_data = normalize_relocate_data(data)
+        self._fetched_at = time.monotonic()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Cache hit/miss/refresh counters and freshness"""
+        age = time.monotonic() - self._fetched_at if self._cached_data is not None else None
+        return {
+            **self.metrics,
+            "ttl_seconds": self.cache_ttl,
+            "age_seconds": round(age, 1) if age is not None else None,
+            "fresh": age is not None and age < self.cache_ttl,
+            "refreshing": self._refresh_task is not None and not self._refresh_task.done()
+        }
+    
+    async def login_and_fetch_data(self) -> Dict[str, Any]:
+        """Login to Relocate Me and fetch available data"""
+        try:
+            # First, get the login page to see if there are any forms or additional endpoints
+            # Only a transport failure fails the fetch; the demo data below doesn't depend on the page
+            login_response = await self.http.get(f"{self.base_url}/")
+            
+            # Try to login (this is a demo, so we'll simulate the data)
+            # In a real scenario, we'd parse the login form and submit credentials
+            
+            # For now, let's create realistic relocation data based on the platform theme
+            relocate_data = {
+                "properties": [
+                    {
+                        "id": "prop_001",
+                        "title": "2 Bedroom Cottage in Peak District",
+                        "price": "£450,000",
+                        "location": "Bakewell, Derbyshire",
+                        "description": "Charming stone cottage with stunning Peak District views",
+                        "bedrooms": 2,
+                        "bathrooms": 1,
+                        "features": ["Garden", "Parking", "Period Features", "Rural Views"],
+                        "coordinates": {"lat": 53.2136, "lng": -1.6757}
+                    },
+                    {
+                        "id": "prop_002", 
+                        "title": "3 Bedroom House in Hope Valley",
+                        "price": "£325,000",
+                        "location": "Hope, Derbyshire",
+                        "description": "Modern family home in the heart of Peak District",
+                        "bedrooms": 3,
+                        "bathrooms": 2,
+                        "features": ["Garage", "Garden", "Modern Kitchen", "Close to Transport"],
+                        "coordinates": {"lat": 53.3488, "lng": -1.7436}
+                    },
+                    {
+                        "id": "prop_003",
+                        "title": "4 Bedroom Farmhouse",
+                        "price": "£650,000", 
+                        "location": "Hathersage, Peak District",
+                        "description": "Converted farmhouse with extensive grounds and panoramic views",
+                        "bedrooms": 4,
+                        "bathrooms": 3,
+                        "features": ["Large Garden", "Original Features", "Parking", "Outbuildings"],
+                        "coordinates": {"lat": 53.3299, "lng": -1.6532}
+                    }
+                ],
+                "cost_analysis": {
+                    "phoenix_vs_peak_district": {
+                        "housing_cost_difference": "+15%",
+                        "living_costs": "-20%",
+                        "transport_savings": "+40%",
+                        "healthcare": "Free NHS",
+                        "education": "Excellent rural schools"
+                    },
+                    "moving_costs": {
+                        "international_shipping": "£8,000 - £12,000",
+                        "visa_costs": "£1,500 - £3,000",
+                        "temporary_accommodation": "£1,200/month",
+                        "legal_fees": "£2,000 - £4,000"
+                    }
+                },
+                "moving_tips": [
+                    {
+                        "category": "Documentation",
+                        "tips": [
+                            "Apply for UK visa 6 months in advance",
+                            "Get official document translations",
+                            "Register with HMRC for tax purposes"
+                        ]
+                    },
+                    {
+                        "category": "Logistics",
+                        "tips": [
+                            "Book international shipping 2 months ahead", 
+                            "Research pet import requirements",
+                            "Plan for climate differences - Peak District is much cooler!"
+                        ]
+                    },
+                    {
+                        "category": "Integration",
+                        "tips": [
+                            "Join local community groups",
+                            "Register with GP and dentist immediately",
+                            "Explore Peak District hiking trails"
+                        ]
+                    }
+                ],
+                "local_services": {
+                    "schools": [
+                        {"name": "Bakewell CE Primary", "rating": "Outstanding", "type": "Primary",
+                         "coordinates": {"lat": 53.2155, "lng": -1.6790}},
+                        {"name": "Lady Manners School", "rating": "Good", "type": "Secondary",
+                         "coordinates": {"lat": 53.2081, "lng": -1.6729}}
+                    ],
+                    "healthcare": [
+                        {"name": "Bakewell Medical Centre", "type": "GP Surgery",
+                         "coordinates": {"lat": 53.2128, "lng": -1.6782}},
+                        {"name": "Chesterfield Royal Hospital", "type": "Hospital", "distance": "15 miles",
+                         "coordinates": {"lat": 53.2440, "lng": -1.3926}}
+                    ],
+                    "transport": [
+                        {"type": "Bus", "service": "Bakewell to Sheffield", "frequency": "Hourly",
+                         "coordinates": {"lat": 53.2140, "lng": -1.6761}},
+                        {"type": "Train", "station": "Hope Station", "lines": "Manchester-Sheffield",
+                         "coordinates": {"lat": 53.3461, "lng": -1.7297}}
+                    ]
+                },
+                "weather_comparison": {
+                    "phoenix_az": {"avg_temp": "75°F", "rainfall": "8 inches/year", "sunshine": "300+ days"},
+                    "peak_district": {"avg_temp": "50°F", "rainfall": "40 inches/year", "sunshine": "120 days"}
+                }
+            }
+            
+            return relocate_data
+            
+        except Exception as e:
+            logger.error(f"Error fetching Relocate Me data: {e}")
+            raise
+
+def parse_price(price: Any) -> Optional[int]:
+    """Parse a display price like "£450,000" into whole pounds"""
+    if isinstance(price, (int, float)):
+        return int(price)
+    digits = re.sub(r"[^\d.]", "", str(price or ""))
+    try:
+        return int(float(digits)) if digits else None
+    except ValueError:
+        return None
+
+def normalize_property(prop: Dict[str, Any]) -> Dict[str, Any]:
+    """Add numeric search fields to a property listing"""
+    return {
+        **prop,
+        "price_value": parse_price(prop.get("price")),
+        "bedrooms": int(prop.get("bedrooms") or 0),
+        "bathrooms": int(prop.get("bathrooms") or 0),
+        "features": list(prop.get("features") or [])
+    }
+
+def normalize_relocate_data(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize freshly fetched relocation data once at ingest"""
+    if not data or not isinstance(data.get("properties"), list):
+        return data
+    return {**data, "properties": [normalize_property(prop) for prop in data["properties"]]}
+
+# Initialize services
+relocate_service = RelocateMeService(outbound_http)
+
+class RelocateContentStore:
+    """Relocation content stored once per (data_type, content hash) and shared by all users"""
+    def __init__(self, max_users: int = RELOCATE_USER_BUNDLE_CACHE):
+        self.refs: Dict[str, Dict[str, Any]] = {}
+        self.bundle_version: Optional[str] = None
+        self.max_users = max_users
+        self._content: Dict[str, Any] = {}
+        self._loaded_at: Dict[str, float] = {}
+        self._published_source = None
+        self._user_bundles: "OrderedDict[str, str]" = OrderedDict()
+    
+    @staticmethod
+    def content_hash(content: Any) -> str:
+        return hashlib.sha256(orjson.dumps(content, option=orjson.OPT_SORT_KEYS)).hexdigest()
+    
+    def publish(self, relocate_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+        """Store each data type once, writing only when its content hash changes"""
+        if relocate_data is self._published_source:
+            # Same cached payload object as last time, nothing can have changed
+            return self.refs
+        
+        for data_type, content in relocate_data.items():
+            if not isinstance(content, (dict, list)):
+                continue
+            content_hash = self.content_hash(content)
+            current = self.refs.get(data_type)
+            if not current or current["content_hash"] != content_hash:
+                self.refs[data_type] = self._store(data_type, content_hash, content)
+            self._content[data_type] = content
+            self._loaded_at[data_type] = time.monotonic()
+        
+        self._published_source = relocate_data
+        self.bundle_version = self.content_hash(self.refs)[:16]
+        return self.refs
+    
+    def _store(self, data_type: str, content_hash: str, content: Any) -> Dict[str, Any]:
+        existing = relocate_content_collection.find_one(
+            {"data_type": data_type, "content_hash": content_hash},
+            {"_id": 0, "version": 1}
+        )
+        if existing:
+            return {"content_hash": content_hash, "version": existing["version"]}
+        
+        latest = relocate_content_collection.find_one(
+            {"data_type": data_type},
+            {"_id": 0, "version": 1},
+            sort=[("version", -1)]
+        )
+        version = latest["version"] + 1 if latest else 1
+        relocate_content_collection.update_one(
+            {"_id": f"{data_type}:{content_hash}"},
+            {"$setOnInsert": {
+                "data_type": data_type,
+                "content_hash": content_hash,
+                "version": version,
+                "title": data_type.replace('_', ' ').title(),
+                "content": content,
+                "source": "move_uk_demo",
+                "created_date": datetime.now().isoformat()
+            }},
+            upsert=True
+        )
+        logger.info(f"Stored relocation {data_type} v{version} ({content_hash[:12]})")
+        return {"content_hash": content_hash, "version": version}
+    
+    def record_user_refs(self, user_id: str):
+        """Point a user's relocation state at the current shared content"""
+        if not self.bundle_version:
+            return
+        if self._user_bundles.get(user_id) == self.bundle_version:
+            self._user_bundles.move_to_end(user_id)
+            return
+        
+        current = relocate_data_collection.find_one(
+            {"user_id": user_id, "data_type": "content_refs"},
+            {"_id": 0, "bundle_version": 1}
+        )
+        if not current or current.get("bundle_version") != self.bundle_version:
+            relocate_data_collection.update_one(
+                {"user_id": user_id, "data_type": "content_refs"},
+                {"$set": {
+                    "refs": self.refs,
+                    "bundle_version": self.bundle_version,
+                    "updated_date": datetime.now().isoformat()
+                }},
+                upsert=True
+            )
+        self._user_bundles[user_id] = self.bundle_version
+        self._user_bundles.move_to_end(user_id)
+        if len(self._user_bundles) > self.max_users:
+            self._user_bundles.popitem(last=False)
+    
+    def get(self, data_type: str) -> Optional[Any]:
+        """Read shared content through the memory cache"""
+        loaded_at = self._loaded_at.get(data_type)
+        if loaded_at is not None and time.monotonic() - loaded_at < relocate_service.cache_ttl:
+            return self._content[data_type]
+        
+        projection = {"_id": 0, "content": 1, "content_hash": 1, "version": 1}
+        ref = self.refs.get(data_type)
+        if ref:
+            # The published hash, not the highest version: content can revert to an earlier hash
+            doc = relocate_content_collection.find_one({"_id": f"{data_type}:{ref['content_hash']}"}, projection)
+        else:
+            # Nothing published by this process yet, start from the newest stored content
+            doc = relocate_content_collection.find_one({"data_type": data_type}, projection, sort=[("version", -1)])
+        if not doc:
+            return self._content.get(data_type)
+        
+        self.refs[data_type] = {"content_hash": doc["content_hash"], "version": doc["version"]}
+        self._content[data_type] = doc["content"]
+        self._loaded_at[data_type] = time.monotonic()
+        return doc["content"]
+
+relocate_store = RelocateContentStore()
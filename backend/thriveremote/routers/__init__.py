@@ -0,0 +1 @@
+"""API routers, one per domain; mounted by create_app()"""
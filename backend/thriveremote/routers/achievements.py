@@ -0,0 +1,59 @@
+"""Achievement listing, progress and manual unlocks"""
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from ..achievements import achievement_engine, unlock_achievement
+from ..caching import check_not_modified, set_resource_etag
+from ..db import achievements_collection
+from ..encoding import FastJSONRoute
+from ..sessions import get_current_user
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+@router.get("/api/achievements")
+async def get_achievements(request: Request, response: Response, session_token: str):
+    """Get user's achievements"""
+    user_id = get_current_user(session_token)
+    not_modified = check_not_modified(request, user_id, "achievements")
+    if not_modified:
+        return not_modified
+    await get_or_create_user(user_id)
+    
+    achievements = list(achievements_collection.find(
+        {"user_id": user_id}, 
+        {"_id": 0}
+    ).sort("unlocked", -1))
+    
+    set_resource_etag(response, user_id, "achievements")
+    return {"achievements": achievements}
+
+@router.get("/api/achievements/progress")
+async def get_achievement_progress(session_token: str):
+    """Progress towards every achievement, from the same counters the rules engine evaluates"""
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+    
+    progress = await achievement_engine.progress(user_id, user)
+    return {
+        "progress": progress,
+        "unlocked": sum(1 for item in progress if item["unlocked"]),
+        "total": len(progress)
+    }
+
+@router.post("/api/achievements/{achievement_id}/unlock")
+async def manual_unlock_achievement(achievement_id: str, session_token: str):
+    """Manually unlock achievement (for testing)"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    unlocked = await unlock_achievement(user_id, achievement_id)
+    
+    if unlocked:
+        achievement = achievements_collection.find_one({"user_id": user_id, "id": achievement_id})
+        return {
+            "message": "Achievement unlocked! 🏆",
+            "achievement": {k: v for k, v in achievement.items() if k != "_id"},
+            "points_earned": 50
+        }
+    else:
+        raise HTTPException(status_code=400, detail="Achievement already unlocked or not found")
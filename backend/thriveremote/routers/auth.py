@@ -0,0 +1,102 @@
+"""Registration, login and logout"""
+from datetime import datetime
+import uuid
+
+from fastapi import APIRouter, HTTPException
+
+from ..db import user_sessions_collection, users_collection
+from ..encoding import FastJSONRoute
+from ..models import LoginRequest, RegisterRequest
+from ..sessions import active_sessions, create_session, hash_password, verify_password
+from ..achievements import initialize_achievements
+from ..users import update_user_activity
+
+router = APIRouter(route_class=FastJSONRoute)
+
+# Authentication endpoints
+@router.post("/api/auth/register")
+async def register_user(request: RegisterRequest):
+    """Register new user"""
+    # Check if username exists
+    existing_user = users_collection.find_one({"username": request.username})
+    if existing_user:
+        raise HTTPException(status_code=400, detail="Username already exists")
+    
+    # Create new user
+    user_id = str(uuid.uuid4())
+    password_hash = hash_password(request.password)
+    
+    user_data = {
+        "user_id": user_id,
+        "username": request.username,
+        "email": request.email,
+        "password_hash": password_hash,
+        "created_date": datetime.now().isoformat(),
+        "last_active": datetime.now().isoformat(),
+        "total_sessions": 0,
+        "productivity_score": 0,
+        "daily_streak": 1,
+        "last_streak_date": datetime.now().date().isoformat(),
+        "savings_goal": 5000.0,
+        "current_savings": 0.0,
+        "settings": {},
+        "achievements_unlocked": 0,
+        "pong_high_score": 0,
+        "commands_executed": 0,
+        "easter_eggs_found": 0,
+        "tasks_completed": 0,
+        "applications_submitted": 0,
+        "relocation_views": 0
+    }
+    
+    users_collection.insert_one(user_data)
+    await initialize_achievements(user_id)
+    
+    # Create session
+    session_token = create_session(user_id)
+    
+    return {
+        "message": "User registered successfully!",
+        "user_id": user_id,
+        "username": request.username,
+        "session_token": session_token
+    }
+
+@router.post("/api/auth/login")
+async def login_user(request: LoginRequest):
+    """Login user"""
+    # Find user by username
+    user = users_collection.find_one({"username": request.username})
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid username or password")
+    
+    # Verify password
+    if not verify_password(request.password, user["password_hash"]):
+        raise HTTPException(status_code=401, detail="Invalid username or password")
+    
+    # Update last active
+    await update_user_activity(user["user_id"])
+    
+    # Create session
+    session_token = create_session(user["user_id"])
+    
+    return {
+        "message": "Login successful!",
+        "user_id": user["user_id"],
+        "username": user["username"],
+        "session_token": session_token
+    }
+
+@router.post("/api/auth/logout")
+async def logout_user(session_token: str):
+    """Logout user"""
+    if session_token in active_sessions:
+        del active_sessions[session_token]
+    
+    # Deactivate in database
+    user_sessions_collection.update_one(
+        {"token": session_token},
+        {"$set": {"active": False}}
+    )
+    
+    return {"message": "Logged out successfully"}
@@ -0,0 +1,131 @@
+"""Several read API calls answered in one request"""
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from ..context import RequestContext, request_context
+from ..encoding import encode_json, FastJSONRoute
+from ..models import BatchRequest, BatchSubRequest
+from ..sessions import get_current_user
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+MAX_BATCH_REQUESTS = 20
+# Streams never finish and batches must not nest
+BATCH_EXCLUDED_PATHS = {"/api/batch", "/api/realtime/stream"}
+# Response headers worth handing back to the client per sub-request
+BATCH_RESPONSE_HEADERS = (b"etag", b"cache-control", b"vary")
+
+def sub_request_error(sub_request: BatchSubRequest) -> Optional[Tuple[int, str]]:
+    if sub_request.method.upper() != "GET":
+        return 405, "Only GET requests can be batched"
+    path = urlsplit(sub_request.path).path
+    if not path.startswith("/api/") or path in BATCH_EXCLUDED_PATHS:
+        return 400, "Path cannot be batched"
+    return None
+
+def sub_request_scope(request: Request, sub_request: BatchSubRequest, session_token: str) -> Dict[str, Any]:
+    url = urlsplit(sub_request.path)
+    query = parse_qsl(url.query, keep_blank_values=True)
+    if not any(name == "session_token" for name, _ in query):
+        query.append(("session_token", session_token))
+    # Sub-responses are spliced into the batch body, so they must not be compressed on their own
+    headers = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in sub_request.headers.items()
+        if name.lower() not in ("accept-encoding", "content-length", "host")
+    ]
+    headers.append((b"host", request.headers.get("host", "localhost").encode("latin-1")))
+    return {
+        "type": "http",
+        "asgi": request.scope.get("asgi", {"version": "3.0"}),
+        "http_version": request.scope.get("http_version", "1.1"),
+        "method": "GET",
+        "scheme": request.scope.get("scheme", "http"),
+        "server": request.scope.get("server"),
+        "client": request.scope.get("client"),
+        "root_path": request.scope.get("root_path", ""),
+        "path": url.path,
+        "raw_path": url.path.encode("latin-1"),
+        "query_string": urlencode(query).encode("latin-1"),
+        "headers": headers,
+        "state": dict(request.scope.get("state", {}))
+    }
+
+async def dispatch(app, scope: Dict[str, Any]) -> Tuple[int, List[Tuple[bytes, bytes]], bytes]:
+    """Run one sub-request through the full ASGI app in-process"""
+    received = False
+    status, headers, body = 500, [], []
+
+    async def receive():
+        nonlocal received
+        if received:
+            return {"type": "http.disconnect"}
+        received = True
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status, headers
+        if message["type"] == "http.response.start":
+            status, headers = message["status"], message.get("headers", [])
+        elif message["type"] == "http.response.body":
+            body.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, headers, b"".join(body)
+
+def encode_result(
+    sub_request: BatchSubRequest, status: int, headers: List[Tuple[bytes, bytes]], body: bytes
+) -> bytes:
+    """One batch entry, with a JSON sub-response body spliced in as-is rather than re-parsed"""
+    content_type, kept_headers = b"", {}
+    for name, value in headers:
+        name = name.lower()
+        if name == b"content-type":
+            content_type = value
+        elif name in BATCH_RESPONSE_HEADERS:
+            kept_headers[name.decode("latin-1")] = value.decode("latin-1")
+
+    if not body:
+        encoded_body = b"null"
+    elif content_type.startswith(b"application/json"):
+        encoded_body = body
+    else:
+        encoded_body = encode_json(body.decode("utf-8", "replace"))
+
+    head = encode_json({"id": sub_request.id, "path": sub_request.path, "status": status, "headers": kept_headers})
+    return head[:-1] + b',"body":' + encoded_body + b"}"
+
+@router.post("/api/batch")
+async def execute_batch(batch: BatchRequest, request: Request, session_token: str):
+    """Run several GET API calls with one session lookup and one user load"""
+    if not batch.requests:
+        raise HTTPException(status_code=400, detail="No requests in batch")
+    if len(batch.requests) > MAX_BATCH_REQUESTS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_REQUESTS} requests per batch")
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+
+    async def run(sub_request: BatchSubRequest) -> bytes:
+        error = sub_request_error(sub_request)
+        if error:
+            status, detail = error
+            return encode_result(sub_request, status, [(b"content-type", b"application/json")],
+                                 encode_json({"detail": detail}))
+        scope = sub_request_scope(request, sub_request, session_token)
+        return encode_result(sub_request, *await dispatch(request.app, scope))
+
+    # Tasks copy the context, so every sub-request sees the resolved session and user
+    token = request_context.set(RequestContext(session_token, user_id, user))
+    try:
+        results = await asyncio.gather(*(run(sub_request) for sub_request in batch.requests))
+    finally:
+        request_context.reset(token)
+
+    return Response(
+        content=b'{"responses":[' + b",".join(results) + b"]}",
+        media_type="application/json"
+    )
@@ -0,0 +1,94 @@
+"""Mini-game scores"""
+from typing import Tuple
+
+from fastapi import APIRouter, HTTPException
+
+from ..caching import resource_versions
+from ..db import users_collection
+from ..encoding import FastJSONRoute
+from ..events import event_bus, PongScoreSubmitted
+from ..leaderboards import leaderboards
+from ..models import PongScoreBatch
+from ..sessions import get_current_user
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+MAX_PONG_BATCH = 100
+
+async def submit_pong_score(user_id: str, score: int) -> Tuple[int, int]:
+    """Raise the stored high score to `score` if higher in one write; returns (previous high, high score)"""
+    from pymongo import ReturnDocument
+
+    user = None
+    for _ in range(2):
+        user = users_collection.find_one_and_update(
+            {"user_id": user_id},
+            {"$max": {"pong_high_score": score}},
+            projection={"_id": 0, "pong_high_score": 1},
+            return_document=ReturnDocument.BEFORE
+        )
+        if user is not None:
+            break
+        # First activity of a default user: create the record, then retry the update
+        await get_or_create_user(user_id)
+
+    previous_high = (user or {}).get("pong_high_score", 0)
+    if score <= previous_high:
+        return previous_high, previous_high
+
+    resource_versions.bump(user_id, "stats")
+    leaderboards.set_score("pong_high_score", user_id, score)
+    # Points and the champion achievement are handled by event subscribers
+    await event_bus.publish(PongScoreSubmitted(user_id=user_id, score=score, previous_high=previous_high))
+    return previous_high, score
+
+@router.post("/api/pong/score")
+async def update_pong_score(score_data: dict, session_token: str):
+    """Update user's Pong high score"""
+    score = score_data.get("score", 0)
+    if not isinstance(score, int) or isinstance(score, bool) or score < 0:
+        raise HTTPException(status_code=400, detail="Score must be a non-negative integer")
+    user_id = get_current_user(session_token)
+
+    previous_high, high_score = await submit_pong_score(user_id, score)
+
+    if high_score > previous_high:
+        return {
+            "message": "New high score! 🏆",
+            "high_score": high_score,
+            "achievement_unlocked": high_score >= 200,
+            "points_earned": 15
+        }
+
+    return {
+        "message": "Good game! 🎮",
+        "high_score": high_score,
+        "points_earned": 5
+    }
+
+@router.post("/api/pong/scores")
+async def submit_pong_scores(batch: PongScoreBatch, session_token: str):
+    """Record several queued games with a single write of their best score"""
+    if not batch.games:
+        raise HTTPException(status_code=400, detail="No games submitted")
+    if len(batch.games) > MAX_PONG_BATCH:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_PONG_BATCH} games per batch")
+    if any(game.score < 0 for game in batch.games):
+        raise HTTPException(status_code=400, detail="Scores must be non-negative")
+    user_id = get_current_user(session_token)
+
+    best_score = max(game.score for game in batch.games)
+    previous_high, high_score = await submit_pong_score(user_id, best_score)
+    improved = high_score > previous_high
+
+    return {
+        "message": "New high score! 🏆" if improved else "Good games! 🎮",
+        "games_recorded": len(batch.games),
+        "best_score": best_score,
+        "previous_high_score": previous_high,
+        "high_score": high_score,
+        "new_high_score": improved,
+        "achievement_unlocked": improved and high_score >= 200,
+        "points_earned": 15 if improved else 5
+    }
@@ -0,0 +1,119 @@
+"""Job catalog, job details and applications"""
+from typing import Optional
+from datetime import datetime
+import uuid
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from ..caching import check_not_modified, resource_versions, set_resource_etag
+from ..db import applications_collection, jobs_collection
+from ..encoding import FastJSONRoute
+from ..events import event_bus, JobApplied, JobsRefreshed
+from ..fieldsets import fields_projection, fields_variant, model_field_names, parse_fields
+from ..jobs import job_catalog, JOB_DETAIL_PROJECTION, JOB_LIST_FIELDS, job_service, JobCatalogSnapshot
+from ..models import Application
+from ..sessions import get_current_user
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+APPLICATION_FIELDS = model_field_names(Application)
+
+@router.get("/api/jobs")
+async def get_jobs(request: Request, session_token: str, fields: Optional[str] = None):
+    """Get real job listings from the in-memory catalog snapshot, optionally only the comma separated `fields`"""
+    user_id = get_current_user(session_token)
+    requested = parse_fields(fields, JOB_LIST_FIELDS)
+    
+    snapshot = job_catalog.snapshot or job_catalog.load_from_db()
+    if snapshot is None:
+        # Nothing stored yet, fetch live data
+        await job_service.refresh_jobs()
+        snapshot = job_catalog.snapshot or JobCatalogSnapshot([])
+    
+    if requested is not None:
+        snapshot = snapshot.with_fields(requested)
+    return snapshot.to_response(request)
+
+@router.get("/api/jobs/{job_id}")
+async def get_job(job_id: str, session_token: str):
+    """Get a single job including its full normalized description"""
+    get_current_user(session_token)
+    
+    job = jobs_collection.find_one({"id": job_id}, JOB_DETAIL_PROJECTION)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    return job
+
+@router.post("/api/jobs/refresh")
+async def refresh_jobs(session_token: str):
+    """Manually refresh job listings"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    count = await job_service.refresh_jobs()
+    
+    await event_bus.publish(JobsRefreshed(user_id=user_id, jobs_count=count))
+    
+    return {"message": f"Refreshed {count} live job listings", "count": count}
+
+@router.post("/api/jobs/{job_id}/apply")
+async def apply_to_job(job_id: str, session_token: str):
+    """Apply to a real job"""
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+    
+    job = jobs_collection.find_one({"id": job_id})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    
+    # Update job status
+    jobs_collection.update_one(
+        {"id": job_id},
+        {"$set": {"application_status": "applied"}}
+    )
+    job_catalog.set_application_status(job_id, "applied")
+    
+    # Create application record
+    application = {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "job_id": job_id,
+        "job_title": job["title"],
+        "company": job["company"],
+        "status": "applied",
+        "applied_date": datetime.now().isoformat(),
+        "notes": f"Applied via ThriveRemote OS to {job['company']}"
+    }
+    applications_collection.insert_one(application)
+    resource_versions.bump(user_id, "applications", "stats", "notifications")
+    
+    # Points, the first application achievement and the reminder are handled by event subscribers
+    await event_bus.publish(JobApplied(
+        user_id=user_id, job_id=job_id, job_title=job["title"], company=job["company"]
+    ))
+    
+    return {
+        "message": "Application submitted successfully! Great progress! 🎯",
+        "application": application,
+        "points_earned": 15
+    }
+
+@router.get("/api/applications")
+async def get_applications(request: Request, response: Response, session_token: str, fields: Optional[str] = None):
+    """Get user's job applications, optionally only the comma separated `fields`"""
+    user_id = get_current_user(session_token)
+    requested = parse_fields(fields, APPLICATION_FIELDS)
+    variant = fields_variant(requested)
+    not_modified = check_not_modified(request, user_id, "applications", variant)
+    if not_modified:
+        return not_modified
+    await get_or_create_user(user_id)
+    
+    applications = list(applications_collection.find(
+        {"user_id": user_id}, 
+        fields_projection(requested, {"_id": 0})
+    ).sort("applied_date", -1))
+    
+    set_resource_etag(response, user_id, "applications", variant)
+    return {"applications": applications, "total": len(applications)}
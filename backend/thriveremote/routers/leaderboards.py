@@ -0,0 +1,84 @@
+"""Global leaderboards: top entries, the current user's rank and their neighbours"""
+from typing import List, Tuple
+
+from fastapi import APIRouter, HTTPException
+
+from ..encoding import FastJSONRoute
+from ..leaderboards import Leaderboard, leaderboards
+from ..sessions import get_current_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+MAX_LEADERBOARD_PAGE = 100
+
+async def loaded_board(name: str) -> Leaderboard:
+    board = leaderboards.get(name)
+    if board is None:
+        raise HTTPException(status_code=404, detail="Leaderboard not found")
+    await board.ensure_loaded()
+    return board
+
+def format_entries(entries: List[Tuple[int, str, float]], user_id: str):
+    names = leaderboards.resolve_usernames([entry_user for _, entry_user, _ in entries])
+    return [
+        {"rank": rank, "username": names[entry_user], "score": score, "you": entry_user == user_id}
+        for rank, entry_user, score in entries
+    ]
+
+@router.get("/api/leaderboards")
+async def list_leaderboards():
+    """Available leaderboards"""
+    return {"leaderboards": [
+        {"name": board.name, "title": board.title, "field": board.field, "ranked_users": len(board.ranked)}
+        for board in leaderboards.boards.values()
+    ]}
+
+@router.get("/api/leaderboards/{name}")
+async def get_leaderboard(name: str, session_token: str, limit: int = 10, offset: int = 0):
+    """Top entries of a leaderboard"""
+    user_id = get_current_user(session_token)
+    board = await loaded_board(name)
+    limit = max(1, min(limit, MAX_LEADERBOARD_PAGE))
+    offset = max(0, offset)
+
+    return {
+        "leaderboard": board.name,
+        "title": board.title,
+        "ranked_users": len(board.ranked),
+        "entries": format_entries(board.entries(offset, offset + limit), user_id),
+        "has_more": offset + limit < len(board.ranked)
+    }
+
+@router.get("/api/leaderboards/{name}/me")
+async def get_my_rank(name: str, session_token: str):
+    """Current user's rank on a leaderboard"""
+    user_id = get_current_user(session_token)
+    board = await loaded_board(name)
+    score = board.scores.get(user_id)
+
+    return {
+        "leaderboard": board.name,
+        "score": score if score is not None else board.floor,
+        "rank": board.rank_of_score(score if score is not None else board.floor),
+        "ranked": score is not None,
+        "ranked_users": len(board.ranked)
+    }
+
+@router.get("/api/leaderboards/{name}/around")
+async def get_leaderboard_neighbours(name: str, session_token: str, radius: int = 5):
+    """Entries directly above and below the current user"""
+    user_id = get_current_user(session_token)
+    board = await loaded_board(name)
+    radius = max(0, min(radius, MAX_LEADERBOARD_PAGE // 2))
+
+    position = board.position(user_id)
+    entries = board.entries(max(0, position - radius), position + radius + 1)
+    if user_id not in board.scores:
+        # Unranked users sit just below the last ranked entry
+        entries.append((board.rank_of_score(board.floor), user_id, board.floor))
+
+    return {
+        "leaderboard": board.name,
+        "ranked_users": len(board.ranked),
+        "entries": format_entries(entries, user_id)
+    }
@@ -0,0 +1,84 @@
+"""Notifications: polled list and the push stream"""
+from typing import Any, Dict, List
+
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import StreamingResponse
+
+from ..caching import check_not_modified, set_resource_etag
+from ..db import applications_collection
+from ..encoding import FastJSONRoute
+from ..notifications import (
+    notification_hub, pending_applications_notification, productivity_notification, sse_frame,
+    SSE_KEEPALIVE_SECONDS, streak_notification
+)
+from ..sessions import get_current_user
+from ..users import get_or_create_user, PRODUCTIVITY_MILESTONE, STREAK_MILESTONE
+
+router = APIRouter(route_class=FastJSONRoute)
+
+async def current_notifications(user_id: str, user: Dict[str, Any]) -> List[Dict[str, Any]]:
+    notifications = []
+
+    # Streak notifications
+    streak = user.get("daily_streak", 1)
+    if streak >= STREAK_MILESTONE:
+        notifications.append(streak_notification(streak))
+
+    # Productivity notifications
+    productivity = user.get("productivity_score", 0)
+    if productivity >= PRODUCTIVITY_MILESTONE:
+        notifications.append(productivity_notification(productivity))
+
+    # Job application reminders
+    pending_apps = applications_collection.count_documents({
+        "user_id": user_id,
+        "status": "applied"
+    })
+    if pending_apps > 0:
+        notifications.append(pending_applications_notification(pending_apps))
+
+    return notifications
+
+@router.get("/api/realtime/notifications")
+async def get_notifications(request: Request, response: Response, session_token: str):
+    """Get real-time notifications for user"""
+    user_id = get_current_user(session_token)
+    not_modified = check_not_modified(request, user_id, "notifications")
+    if not_modified:
+        return not_modified
+    user = await get_or_create_user(user_id)
+    notifications = await current_notifications(user_id, user)
+
+    set_resource_etag(response, user_id, "notifications")
+    return {"notifications": notifications}
+
+@router.get("/api/realtime/stream")
+async def stream_notifications(session_token: str, snapshot: bool = True):
+    """Server-Sent Events: the current notifications once, then only new events as they happen.
+
+    Events are `notification` (same shape as /api/realtime/notifications items)
+    and `stats` (changed counters such as productivity_score or daily_streak).
+    An idle connection costs no queries, only a keep-alive comment now and then.
+    """
+    user_id = get_current_user(session_token)
+
+    async def events():
+        # Subscribe before reading the snapshot so nothing published in between is lost
+        with notification_hub.subscribe(user_id) as subscription:
+            if snapshot:
+                user = await get_or_create_user(user_id)
+                notifications = await current_notifications(user_id, user)
+                yield sse_frame("snapshot", {"notifications": notifications})
+            while True:
+                yield await subscription.next_frame(SSE_KEEPALIVE_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/api/realtime/stats")
+async def get_realtime_stats():
+    """Open streams and delivery counters"""
+    return notification_hub.stats()
@@ -0,0 +1,278 @@
+"""Relocation data, property search, nearby services and affordability"""
+from typing import Optional
+from datetime import datetime
+import time
+
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import HTMLResponse
+
+from ..encoding import FastJSONRoute
+from ..property_search import load_geo_index, load_property_index, PropertySearchIndex
+from ..relocation import relocate_service, relocate_store
+from ..sessions import get_current_user
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+# Relocation integration endpoints
+@router.get("/api/relocate/data")
+async def get_relocate_data(session_token: str):
+    """Get relocation data from Relocate Me integration"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    # Served from the stale-while-revalidate cache
+    relocate_data = await relocate_service.get_data()
+    
+    if relocate_data:
+        # Shared content is only written when its hash changes; the user keeps references
+        relocate_store.publish(relocate_data)
+        relocate_store.record_user_refs(user_id)
+    
+    # Return formatted data
+    return {
+        "data": relocate_data,
+        "message": "Relocation data fetched successfully",
+        "content_version": relocate_store.bundle_version,
+        "last_updated": datetime.now().isoformat()
+    }
+
+@router.get("/api/relocate/properties")
+async def get_relocate_properties(session_token: str):
+    """Get property listings from relocation data"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    # Shared copy first
+    cached_properties = relocate_store.get("properties")
+    if cached_properties is not None:
+        return {"properties": cached_properties, "cached": True}
+    
+    # Fall back to the service cache if nothing is stored yet
+    relocate_data = await relocate_service.get_data()
+    if relocate_data:
+        relocate_store.publish(relocate_data)
+    properties = relocate_data.get("properties", [])
+    
+    return {"properties": properties, "cached": False}
+
+@router.get("/api/relocate/properties/search")
+async def search_relocate_properties(
+    session_token: str,
+    min_price: Optional[int] = None,
+    max_price: Optional[int] = None,
+    min_bedrooms: Optional[int] = None,
+    max_bedrooms: Optional[int] = None,
+    min_bathrooms: Optional[int] = None,
+    features: Optional[str] = None,
+    sort: str = "price_asc",
+    limit: int = 20,
+    offset: int = 0
+):
+    """Search properties by price and bedroom ranges, features and sort order"""
+    get_current_user(session_token)
+    
+    if sort not in PropertySearchIndex.SORTS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of {', '.join(PropertySearchIndex.SORTS)}")
+    
+    index = await load_property_index()
+    feature_list = [feature.strip() for feature in features.split(",") if feature.strip()] if features else []
+    results = index.search(
+        min_price=min_price,
+        max_price=max_price,
+        min_bedrooms=min_bedrooms,
+        max_bedrooms=max_bedrooms,
+        min_bathrooms=min_bathrooms,
+        features=feature_list,
+        sort=sort,
+        limit=max(1, min(limit, 100)),
+        offset=max(0, offset)
+    )
+    
+    return {**results, "count": len(results["properties"]), "indexed": index.size}
+
+@router.get("/api/relocate/nearby")
+async def get_relocate_nearby(
+    session_token: str,
+    property_id: Optional[str] = None,
+    lat: Optional[float] = None,
+    lng: Optional[float] = None,
+    radius_km: float = 10.0,
+    limit: int = 3
+):
+    """Nearest schools, GP surgeries and stations plus properties within a radius"""
+    get_current_user(session_token)
+    index = await load_geo_index()
+    
+    origin_property = None
+    if property_id:
+        properties = relocate_store.get("properties") or []
+        origin_property = next((prop for prop in properties if prop.get("id") == property_id), None)
+        if not origin_property or "coordinates" not in origin_property:
+            raise HTTPException(status_code=404, detail="Property not found")
+        lat, lng = origin_property["coordinates"]["lat"], origin_property["coordinates"]["lng"]
+    elif lat is None or lng is None:
+        raise HTTPException(status_code=400, detail="Provide property_id or lat and lng")
+    
+    limit = max(1, min(limit, 20))
+    radius_km = max(0.1, min(radius_km, 200.0))
+    
+    def with_distance(pairs):
+        return [{**item, "distance_km": round(distance, 2)} for distance, item in pairs]
+    
+    # By id: the store reloads properties as new objects after its TTL while the index keeps the old ones
+    nearby_properties = [
+        (distance, prop) for distance, prop in index.within(lat, lng, radius_km, "property")
+        if property_id is None or prop.get("id") != property_id
+    ]
+    
+    return {
+        "origin": {"lat": lat, "lng": lng, "property_id": property_id},
+        "schools": with_distance(index.nearest(lat, lng, "school", limit)),
+        "gp_surgeries": with_distance(index.nearest(lat, lng, "gp_surgery", limit)),
+        "stations": with_distance(index.nearest(lat, lng, "station", limit)),
+        "properties_within_radius": with_distance(nearby_properties),
+        "radius_km": radius_km
+    }
+
+@router.get("/api/relocate/affordability")
+async def get_relocate_affordability(
+    session_token: str,
+    deposit_rate: float = 0.10,
+    monthly_savings: Optional[float] = None,
+    temporary_months: int = 3,
+    sort: str = "months_to_move",
+    limit: int = 50
+):
+    """Affordability, deposit gap and months-to-move for every property"""
+    import numpy as np
+    from ..affordability import USD_TO_GBP, load_affordability_engine  # numpy is only loaded once used
+    
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+    
+    if sort not in ("months_to_move", "price"):
+        raise HTTPException(status_code=400, detail="sort must be months_to_move or price")
+    if not 0 < deposit_rate <= 1:
+        raise HTTPException(status_code=400, detail="deposit_rate must be between 0 and 1")
+    
+    engine = await load_affordability_engine()
+    
+    # Same savings figures as /api/savings, converted to pounds
+    savings_goal = user.get("savings_goal", 5000.0)
+    streak_bonus = user.get("daily_streak", 1) * 25
+    savings_usd = user.get("current_savings", 0.0) + streak_bonus
+    monthly_usd = monthly_savings if monthly_savings is not None else savings_goal / 10
+    
+    started = time.perf_counter()
+    result = engine.evaluate(
+        savings=savings_usd * USD_TO_GBP,
+        monthly_savings=monthly_usd * USD_TO_GBP,
+        deposit_rate=deposit_rate,
+        temporary_months=max(0, temporary_months)
+    )
+    order = np.argsort(result["months_to_move"] if sort == "months_to_move" else engine.prices, kind="stable")
+    order = order[:max(1, min(limit, 500))]
+    compute_ms = (time.perf_counter() - started) * 1000
+    
+    properties = []
+    for i in order.tolist():
+        months = result["months_to_move"][i]
+        properties.append({
+            "id": engine.properties[i].get("id"),
+            "title": engine.properties[i].get("title"),
+            "price": engine.properties[i].get("price"),
+            "price_value": engine.properties[i]["price_value"],
+            "deposit": round(float(result["deposit"][i]), 2),
+            "upfront_cost_low": round(float(result["upfront_low"][i]), 2),
+            "upfront_cost_high": round(float(result["upfront_high"][i]), 2),
+            "deposit_gap": round(float(result["deposit_gap"][i]), 2),
+            "months_to_move": int(months) if np.isfinite(months) else None,
+            "savings_coverage": round(float(result["coverage"][i]) * 100, 1),
+            "affordable_now": bool(result["affordable_now"][i])
+        })
+    
+    return {
+        "properties": properties,
+        "evaluated": len(engine.properties),
+        "affordable_now": int(result["affordable_now"].sum()),
+        "savings_gbp": round(savings_usd * USD_TO_GBP, 2),
+        "monthly_savings_gbp": round(monthly_usd * USD_TO_GBP, 2),
+        "moving_costs": result["moving_costs"],
+        "exchange_rate_usd_gbp": USD_TO_GBP,
+        "compute_ms": round(compute_ms, 3)
+    }
+
+@router.get("/api/relocate/cache/stats")
+async def get_relocate_cache_stats():
+    """Get Relocate Me cache metrics"""
+    return relocate_service.cache_stats()
+
+@router.get("/api/relocate/iframe")
+async def get_relocate_iframe(session_token: str):
+    """Get iframe content for Relocate Me integration"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    # Create iframe HTML that will load the Relocate Me site
+    iframe_html = f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <title>Relocate Me - Phoenix to Peak District</title>
+        <style>
+            body {{
+                margin: 0;
+                padding: 0;
+                background: linear-gradient(135deg, #0f172a, #1e293b, #334155);
+                color: #22d3ee;
+                font-family: 'SF Mono', 'Monaco', monospace;
+            }}
+            .iframe-container {{
+                width: 100%;
+                height: 100vh;
+                border: 2px solid #22d3ee;
+                border-radius: 8px;
+                overflow: hidden;
+                box-shadow: 0 0 30px rgba(34, 211, 238, 0.3);
+            }}
+            iframe {{
+                width: 100%;
+                height: 100%;
+                border: none;
+            }}
+            .header {{
+                background: rgba(0, 0, 0, 0.8);
+                padding: 10px 20px;
+                border-bottom: 1px solid #22d3ee;
+                display: flex;
+                align-items: center;
+                gap: 15px;
+            }}
+            .status {{
+                color: #10b981;
+                font-size: 12px;
+            }}
+            .url {{
+                color: #64748b;
+                font-size: 12px;
+            }}
+        </style>
+    </head>
+    <body>
+        <div class="header">
+            <span class="status">● CONNECTED</span>
+            <span class="url">🏡 move-uk-demo.emergent.host</span>
+            <span style="margin-left: auto; color: #22d3ee;">Phoenix → Peak District Relocation Data</span>
+        </div>
+        <div class="iframe-container">
+            <iframe src="https://move-uk-demo.emergent.host/" 
+                    title="Relocate Me - Phoenix to Peak District"
+                    allowfullscreen>
+            </iframe>
+        </div>
+    </body>
+    </html>
+    """
+    
+    return HTMLResponse(content=iframe_html)
@@ -0,0 +1,99 @@
+"""Savings progress and projections"""
+from datetime import datetime
+import asyncio
+
+from fastapi import APIRouter
+
+from ..db import productivity_logs_collection, users_collection
+from ..encoding import FastJSONRoute
+from ..savings import get_monthly_savings_progress, savings_projections
+from ..sessions import get_current_user
+from ..events import event_bus, SavingsUpdated
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+@router.get("/api/savings")
+async def get_savings(session_token: str):
+    """Get user's real savings data"""
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+    
+    current_amount = user.get("current_savings", 0.0)
+    target_amount = user.get("savings_goal", 5000.0)
+    daily_streak = user.get("daily_streak", 1)
+    
+    # Calculate streak bonus
+    streak_bonus = daily_streak * 25  # $25 per streak day
+    total_with_bonus = current_amount + streak_bonus
+    
+    progress_percentage = min((total_with_bonus / target_amount) * 100, 100)
+    
+    savings_data = {
+        "id": user["user_id"],
+        "current_amount": total_with_bonus,
+        "base_amount": current_amount,
+        "target_amount": target_amount,
+        "monthly_target": target_amount / 10,  # 10 month goal
+        "last_updated": user.get("last_active"),
+        "progress_percentage": progress_percentage,
+        "months_to_goal": max(1, int((target_amount - total_with_bonus) / (target_amount / 10))),
+        "streak_bonus": streak_bonus,
+        "daily_streak": daily_streak,
+        "monthly_progress": await get_monthly_savings_progress(user_id)
+    }
+    
+    return savings_data
+
+@router.post("/api/savings/update")
+async def update_savings(amount: float, session_token: str):
+    """Update user's savings amount"""
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+    
+    # Update savings
+    users_collection.update_one(
+        {"user_id": user_id},
+        {"$set": {"current_savings": amount}}
+    )
+    savings_projections.pop(user_id, None)
+    
+    # Points and milestone achievements are handled by event subscribers
+    target = user.get("savings_goal", 5000.0)
+    progress = (amount / target) * 100
+    await event_bus.publish(SavingsUpdated(user_id=user_id, amount=amount, savings_goal=target))
+    
+    return {
+        "message": "Savings updated successfully! 💰",
+        "new_amount": amount,
+        "progress_percentage": progress,
+        "points_earned": 10
+    }
+
+@router.get("/api/savings/projection")
+async def get_savings_projection(session_token: str, paths: int = 10000, horizon_months: int = 120):
+    """Monte Carlo projection of time to reach the savings goal"""
+    from ..projection import project_savings  # numpy is only loaded once projections are used
+    
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+    
+    paths = max(100, min(paths, 50000))
+    horizon_months = max(1, min(horizon_months, 240))
+    # Streaks move daily without a savings update, so the day is part of the key
+    cache_key = (paths, horizon_months, datetime.now().date().isoformat())
+    
+    cached = savings_projections.get(user_id)
+    if cached and cached[0] == cache_key:
+        return {**cached[1], "cached": True}
+    
+    history = list(productivity_logs_collection.find(
+        {"user_id": user_id, "action": "savings_update"},
+        {"_id": 0, "timestamp": 1, "metadata.amount": 1}
+    ).sort("timestamp", -1).limit(200))
+    history.reverse()
+    
+    # numpy releases the GIL for most of the simulation, keep it off the event loop
+    projection = await asyncio.to_thread(project_savings, user, history, paths, horizon_months)
+    savings_projections[user_id] = (cache_key, projection)
+    return {**projection, "cached": False}
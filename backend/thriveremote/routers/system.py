@@ -0,0 +1,76 @@
+"""Service info, health probes, outbound HTTP and event bus stats"""
+from fastapi import APIRouter
+from fastapi.responses import JSONResponse, PlainTextResponse
+
+from ..achievements import achievement_engine
+from ..encoding import FastJSONRoute
+from ..events import event_bus
+from ..jobs import job_catalog
+from ..leaderboards import leaderboards
+from ..lifecycle import warmup_state
+from ..loopmonitor import loop_monitor
+from ..metrics import format_metric, metrics
+from ..notifications import notification_hub
+from ..outbound import outbound_http
+
+router = APIRouter(route_class=FastJSONRoute)
+
+@router.get("/")
+async def root():
+    return {
+        "message": "ThriveRemote API Server Running", 
+        "version": "3.0", 
+        "features": ["real_jobs", "user_tracking", "live_data", "multi_user_auth", "relocation_integration"],
+        "easter_egg": "Try the Konami code! ⬆⬆⬇⬇⬅➡⬅➡BA"
+    }
+
+@router.get("/api/system/outbound")
+async def get_outbound_stats():
+    """Get outbound HTTP pool, per-host latency, error and circuit breaker metrics"""
+    return outbound_http.stats()
+
+@router.get("/api/system/events")
+async def get_event_stats():
+    """Get published event counts, per-subscriber queue depth, failures and backpressure, rule evaluations and leaderboard updates"""
+    return {
+        **event_bus.stats(),
+        "achievement_engine": achievement_engine.stats(),
+        "leaderboards": leaderboards.stats()
+    }
+
+@router.get("/metrics")
+async def get_metrics():
+    """Per-route request, latency and Mongo command metrics, plus event loop lag when monitored, in the Prometheus text format"""
+    hub = notification_hub.stats()
+    bus = event_bus.stats()
+    gauges = [
+        *format_metric("thriveremote_sse_connections", "Open notification streams.", "gauge",
+                       [({}, hub["connections"])]),
+        *format_metric("thriveremote_sse_dropped_total", "Notifications dropped from full stream queues.", "counter",
+                       [({}, hub["dropped"])]),
+        *format_metric("thriveremote_events_published_total", "Domain events published by type.", "counter",
+                       [({"event": name}, count) for name, count in sorted(bus["published"].items())]),
+        *format_metric("thriveremote_event_queue_depth", "Events waiting per subscriber.", "gauge",
+                       [({"subscriber": name}, stats["queued"]) for name, stats in sorted(bus["subscribers"].items())]),
+    ]
+    if loop_monitor.running:
+        gauges.extend(loop_monitor.metric_lines())
+    return PlainTextResponse(metrics.render(gauges), media_type="text/plain; version=0.0.4")
+
+@router.get("/health/live")
+async def health_live():
+    """Liveness probe: the process is up and serving"""
+    return {"status": "alive"}
+
+@router.get("/health/ready")
+async def health_ready():
+    """Readiness probe: a job catalog is loaded or the initial refresh has finished"""
+    status_code = 200 if warmup_state["ready"] else 503
+    return JSONResponse(
+        status_code=status_code,
+        content={
+            "status": "ready" if warmup_state["ready"] else "warming_up",
+            **warmup_state,
+            "catalog_etag": job_catalog.snapshot.etag if job_catalog.snapshot else None
+        }
+    )
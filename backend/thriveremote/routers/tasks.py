@@ -0,0 +1,201 @@
+"""Task board, uploads and downloads"""
+from typing import Optional
+from datetime import datetime, timedelta
+import json
+import io
+import uuid
+
+from fastapi import APIRouter, HTTPException, UploadFile, File, Request, Response
+from fastapi.responses import StreamingResponse
+
+from ..caching import check_not_modified, resource_versions, set_resource_etag
+from ..db import tasks_collection
+from ..encoding import FastJSONRoute
+from ..events import event_bus, TaskCompleted, TaskCreated, TasksImported
+from ..fieldsets import fields_projection, fields_variant, model_field_names, parse_fields
+from ..models import Task
+from ..sessions import get_current_user
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+TASK_FIELDS = model_field_names(Task)
+
+@router.get("/api/tasks")
+async def get_tasks(request: Request, response: Response, session_token: str, fields: Optional[str] = None):
+    """Get user's tasks, optionally only the comma separated `fields`"""
+    user_id = get_current_user(session_token)
+    requested = parse_fields(fields, TASK_FIELDS)
+    variant = fields_variant(requested)
+    not_modified = check_not_modified(request, user_id, "tasks", variant)
+    if not_modified:
+        return not_modified
+    await get_or_create_user(user_id)
+    
+    projection = fields_projection(requested, {"_id": 0})
+    tasks = list(tasks_collection.find(
+        {"user_id": user_id}, 
+        projection
+    ).sort("created_date", -1))
+    
+    # If no tasks, create some defaults
+    if not tasks:
+        await create_default_tasks(user_id)
+        tasks = list(tasks_collection.find(
+            {"user_id": user_id}, 
+            projection
+        ).sort("created_date", -1))
+    
+    set_resource_etag(response, user_id, "tasks", variant)
+    return {"tasks": tasks}
+
+async def create_default_tasks(user_id: str):
+    """Create default tasks for new user"""
+    default_tasks = [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "title": "Update Resume",
+            "description": "Add latest skills and experience",
+            "status": "todo",
+            "priority": "high",
+            "category": "job_search",
+            "due_date": (datetime.now() + timedelta(days=7)).date().isoformat(),
+            "created_date": datetime.now().isoformat()
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "title": "Set Monthly Savings Goal",
+            "description": "Define realistic monthly savings target",
+            "status": "in_progress",
+            "priority": "medium",
+            "category": "finance",
+            "created_date": datetime.now().isoformat()
+        },
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "title": "Explore ThriveRemote Features",
+            "description": "Try the terminal, play Pong, and discover easter eggs",
+            "status": "todo",
+            "priority": "low",
+            "category": "platform",
+            "created_date": datetime.now().isoformat()
+        }
+    ]
+    
+    tasks_collection.insert_many(default_tasks)
+    resource_versions.bump(user_id, "tasks", "stats")
+
+@router.post("/api/tasks")
+async def create_task(task_data: dict, session_token: str):
+    """Create a new task"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    task = {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "title": task_data.get("title", "New Task"),
+        "description": task_data.get("description", ""),
+        "status": "todo",
+        "priority": task_data.get("priority", "medium"),
+        "category": task_data.get("category", "general"),
+        "due_date": task_data.get("due_date"),
+        "created_date": datetime.now().isoformat()
+    }
+    
+    tasks_collection.insert_one(task)
+    resource_versions.bump(user_id, "tasks", "stats")
+    await event_bus.publish(TaskCreated(user_id=user_id, task_id=task["id"], task_title=task["title"]))
+    
+    return {"message": "Task created! 📋", "task": task, "points_earned": 5}
+
+@router.put("/api/tasks/{task_id}/complete")
+async def complete_task(task_id: str, session_token: str):
+    """Mark task as completed"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    # Update task
+    task = tasks_collection.find_one_and_update(
+        {"id": task_id, "user_id": user_id},
+        {
+            "$set": {
+                "status": "completed",
+                "completed_date": datetime.now().isoformat()
+            }
+        },
+        projection={"_id": 0, "title": 1, "status": 1}
+    )
+    if not task:
+        raise HTTPException(status_code=404, detail="Task not found")
+    resource_versions.bump(user_id, "tasks", "stats")
+    
+    # Points and the task master achievement are handled by event subscribers
+    await event_bus.publish(TaskCompleted(
+        user_id=user_id, task_id=task_id, task_title=task["title"],
+        previously_completed=task.get("status") == "completed"
+    ))
+    
+    return {
+        "message": "Task completed! Great work! ✅",
+        "points_earned": 20
+    }
+
+@router.post("/api/tasks/upload")
+async def upload_tasks(file: UploadFile = File(...), session_token: str = None):
+    """Upload tasks from JSON file"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    try:
+        content = await file.read()
+        tasks_data = json.loads(content.decode('utf-8'))
+        
+        if not isinstance(tasks_data, list):
+            raise HTTPException(status_code=400, detail="Tasks must be a list")
+        
+        # Process and save tasks
+        for task_data in tasks_data:
+            task = {
+                "id": str(uuid.uuid4()),
+                "user_id": user_id,
+                "title": task_data.get("title", "Imported Task"),
+                "description": task_data.get("description", ""),
+                "status": task_data.get("status", "todo"),
+                "priority": task_data.get("priority", "medium"),
+                "category": task_data.get("category", "imported"),
+                "due_date": task_data.get("due_date"),
+                "created_date": datetime.now().isoformat()
+            }
+            tasks_collection.insert_one(task)
+        
+        resource_versions.bump(user_id, "tasks", "stats")
+        await event_bus.publish(TasksImported(user_id=user_id, count=len(tasks_data)))
+        
+        return {
+            "message": f"Successfully uploaded {len(tasks_data)} tasks! 📋",
+            "tasks_count": len(tasks_data),
+            "points_earned": 15
+        }
+    except json.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON format")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/api/tasks/download")
+async def download_tasks(session_token: str):
+    """Download user's tasks as JSON"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    tasks = list(tasks_collection.find({"user_id": user_id}, {"_id": 0}))
+    tasks_json = json.dumps(tasks, indent=2)
+    
+    return StreamingResponse(
+        io.BytesIO(tasks_json.encode('utf-8')),
+        media_type="application/json",
+        headers={"Content-Disposition": f"attachment; filename=thriveremote_tasks_{user_id}.json"}
+    )
@@ -0,0 +1,235 @@
+"""Terminal commands"""
+from datetime import datetime
+
+from fastapi import APIRouter
+
+from ..db import achievements_collection, applications_collection, jobs_collection, tasks_collection
+from ..encoding import FastJSONRoute
+from ..sessions import get_current_user
+from ..events import EasterEggFound, event_bus, RelocationExplored, TerminalCommandExecuted
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+def build_terminal_responses(user: dict, user_id: str, commands_executed: int) -> dict:
+    """Enhanced responses with real data, keyed by command"""
+    return {
+        "help": {
+            "output": [
+                "ThriveRemote Terminal v3.0 - Live Data Command Reference:",
+                "",
+                "🎯 PRODUCTIVITY:",
+                "  jobs           - List REAL remote job opportunities",
+                "  apply <id>     - Apply to jobs (tracked in your profile)",
+                "  savings        - Show YOUR actual savings progress",
+                "  tasks          - List YOUR personal tasks",
+                "  stats          - Show YOUR live productivity stats",
+                "",
+                "🏡 RELOCATION:",
+                "  relocate       - Explore Phoenix to Peak District relocation data",
+                "  properties     - View available properties in Peak District",
+                "  costs          - Compare living costs Phoenix vs Peak District",
+                "",
+                "🎮 FUN & EASTER EGGS:",
+                "  pong           - Launch Pong game (scores saved)",
+                "  matrix         - Enter the Matrix",
+                "  konami         - Try the Konami code sequence",
+                "  coffee         - Get a coffee break suggestion",
+                "  motivate       - Get a motivational quote",
+                "",
+                "🔧 SYSTEM:",
+                "  clear          - Clear terminal",
+                "  time           - Show current time",
+                "  version        - Show system version",
+                "  whoami         - Show YOUR user info",
+                "  profile        - Show YOUR complete profile",
+                "",
+                "💡 TIP: All your data is saved and tracked in real-time!"
+            ]
+        },
+        "jobs": {
+            "output": [
+                f"📋 Found {jobs_collection.count_documents({})} REAL remote job opportunities:",
+                "These are live jobs from Remotive API!",
+                "Use job search app to apply and track your applications"
+            ]
+        },
+        "savings": {
+            "output": [
+                f"💰 YOUR Savings Progress: ${user.get('current_savings', 0):.2f} / $5,000.00",
+                f"📈 Progress: {min((user.get('current_savings', 0) / 5000) * 100, 100):.1f}%",
+                f"🔥 Daily Streak: {user.get('daily_streak', 1)} days",
+                f"💎 Streak Bonus: ${user.get('daily_streak', 1) * 25}",
+                "Update your savings in the Savings Goal app!"
+            ]
+        },
+        "tasks": {
+            "output": [
+                f"✅ YOU have {tasks_collection.count_documents({'user_id': user_id})} tasks",
+                f"📝 Completed: {tasks_collection.count_documents({'user_id': user_id, 'status': 'completed'})}",
+                "Use Task Manager to add, complete, and organize"
+            ]
+        },
+        "relocate": {
+            "output": [
+                "🏡 PHOENIX TO PEAK DISTRICT RELOCATION DATA:",
+                "📊 Cost Difference: Housing +15%, Living -20%",
+                "🚗 Transport: +40% savings with excellent public transport",
+                "🏥 Healthcare: Free NHS vs US private insurance",
+                "🌤️ Weather: From 300+ sunny days to 120 days",
+                "Use 'properties' and 'costs' commands for details"
+            ]
+        },
+        "properties": {
+            "output": [
+                "🏡 AVAILABLE PROPERTIES IN PEAK DISTRICT:",
+                "1. 2BR Cottage in Bakewell - £450,000",
+                "2. 3BR House in Hope Valley - £325,000", 
+                "3. 4BR Farmhouse in Hathersage - £650,000",
+                "Open Relocation Browser for full details and photos"
+            ]
+        },
+        "costs": {
+            "output": [
+                "💰 PHOENIX VS PEAK DISTRICT COST COMPARISON:",
+                "🏠 Housing: +15% more expensive",
+                "🛒 Living Costs: -20% cheaper",
+                "🚌 Transport: +40% savings",
+                "🏥 Healthcare: Free NHS (massive savings)",
+                "📚 Education: Excellent rural schools",
+                "💸 Moving Costs: £8,000-£12,000 total"
+            ]
+        },
+        "stats": {
+            "output": [
+                "📊 YOUR LIVE PRODUCTIVITY STATS:",
+                f"🔥 Daily Streak: {user.get('daily_streak', 1)} days",
+                f"📈 Productivity Score: {user.get('productivity_score', 0)} points",
+                f"🏆 Achievements: {achievements_collection.count_documents({'user_id': user_id, 'unlocked': True})}/9",
+                f"⚡ Commands Executed: {commands_executed}",
+                f"🎮 Pong High Score: {user.get('pong_high_score', 0)}",
+                f"🎯 Total Sessions: {user.get('total_sessions', 1)}",
+                f"💼 Job Applications: {applications_collection.count_documents({'user_id': user_id})}",
+                "All data updates in real-time!"
+            ]
+        },
+        "profile": {
+            "output": [
+                f"👤 USER PROFILE: {user.get('username', 'RemoteWarrior')}",
+                f"📅 Member Since: {user.get('created_date', '')[:10]}",
+                f"⏰ Last Active: {user.get('last_active', '')[:16]}",
+                f"🔥 Current Streak: {user.get('daily_streak', 1)} days",
+                f"💰 Savings: ${user.get('current_savings', 0):.2f}",
+                f"📈 Productivity: {user.get('productivity_score', 0)} points",
+                "Your journey to remote work success!"
+            ]
+        },
+        "pong": {
+            "output": [
+                "🎮 Launching Pong game...",
+                f"Beat your high score: {user.get('pong_high_score', 0)} points!",
+                "Scores are automatically saved to your profile"
+            ]
+        },
+        "matrix": {
+            "output": [
+                "🟢 Welcome to the Matrix...",
+                "01001000 01100101 01101100 01101100 01101111",
+                "Wake up, Neo... The remote work revolution has begun.",
+                "💊 Red pill: Keep grinding. Blue pill: Take a break.",
+                "+5 productivity points for finding this easter egg!"
+            ]
+        },
+        "konami": {
+            "output": [
+                "🎮 Konami Code detected!",
+                "⬆⬆⬇⬇⬅➡⬅➡BA",
+                "🚀 Productivity mode ACTIVATED!",
+                "+50 productivity points!",
+                "Easter egg found and saved to your profile!"
+            ]
+        },
+        "coffee": {
+            "output": [
+                "☕ Personalized Coffee Break Suggestions:",
+                f"• You've been productive for {user.get('total_sessions', 1)} sessions",
+                f"• Your streak: {user.get('daily_streak', 1)} days - keep it up!",
+                "• Take a 5-minute walk",
+                "• Play a quick Pong game",
+                "• Check your real savings progress"
+            ]
+        },
+        "motivate": {
+            "output": [
+                "💪 PERSONALIZED MOTIVATION:",
+                f"\"You're on a {user.get('daily_streak', 1)}-day streak! 🔥\"",
+                f"\"Productivity score: {user.get('productivity_score', 0)} and climbing!\"",
+                "\"Remote work is the future, and you're living it!\"",
+                f"Keep pushing towards your ${user.get('savings_goal', 5000)} goal! 💰"
+            ]
+        },
+        "surprise": {
+            "output": [
+                "🎉 SURPRISE! Random easter egg activated!",
+                "🦄 You found a unicorn in the terminal!",
+                "✨ Magic productivity boost applied! (+10 points)",
+                "🎁 Hidden achievement progress updated!",
+                "This discovery is saved to your profile!"
+            ]
+        },
+        "time": {
+            "output": [f"🕐 Current time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"]
+        },
+        "version": {
+            "output": [
+                "ThriveRemote OS v3.0 - LIVE DATA EDITION",
+                "🚀 Features: Real jobs, multi-user auth, relocation data",
+                "🏡 NEW: Phoenix to Peak District relocation integration",
+                "Built for serious remote work professionals"
+            ]
+        },
+        "whoami": {
+            "output": [
+                f"👤 {user.get('username', 'RemoteWarrior')}",
+                f"🔥 Streak: {user.get('daily_streak', 1)} days",
+                f"📊 Productivity: {user.get('productivity_score', 0)} points",
+                f"🎯 Status: Remote Work Champion!"
+            ]
+        },
+        "clear": {
+            "output": ["Terminal cleared! ✨"]
+        }
+    }
+
+@router.post("/api/terminal/command")
+async def execute_terminal_command(command: dict, session_token: str):
+    """Execute terminal command and track usage"""
+    cmd = command.get("command", "").lower().strip()
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+    
+    # Counter, points and terminal ninja achievement are handled by event subscribers
+    commands_executed = user.get("commands_executed", 0) + 1
+    await event_bus.publish(TerminalCommandExecuted(user_id=user_id, command=cmd))
+    
+    responses = build_terminal_responses(user, user_id, commands_executed)
+    
+    if cmd in responses:
+        # Special handling for easter eggs
+        if cmd in ["konami", "matrix", "surprise"]:
+            await event_bus.publish(EasterEggFound(user_id=user_id, kind=cmd))
+        
+        # Special handling for relocation commands
+        if cmd in ["relocate", "properties", "costs"]:
+            await event_bus.publish(RelocationExplored(user_id=user_id, command=cmd))
+        
+        return responses[cmd]
+    else:
+        return {
+            "output": [
+                f"Command not found: {cmd}",
+                "💡 Type 'help' for available commands",
+                "🎮 Try 'surprise' for a random easter egg!",
+                f"Commands executed: {commands_executed}"
+            ]
+        }
@@ -0,0 +1,127 @@
+"""Current user, profile and dashboard"""
+from typing import Optional
+from datetime import datetime
+
+from fastapi import APIRouter, Request, Response
+
+from ..caching import check_not_modified, resource_versions, set_resource_etag
+from ..db import achievements_collection, applications_collection, jobs_collection, tasks_collection, users_collection
+from ..encoding import FastJSONRoute
+from ..fieldsets import fields_projection, parse_fields, pick_fields
+from ..leaderboards import leaderboards
+from ..savings import savings_projections
+from ..sessions import get_current_user
+from ..users import get_or_create_user
+
+router = APIRouter(route_class=FastJSONRoute)
+
+PROFILE_STORED_FIELDS = (
+    "user_id", "username", "email", "created_date", "last_active", "total_sessions", "productivity_score",
+    "daily_streak", "last_streak_date", "savings_goal", "current_savings", "settings", "achievements_unlocked",
+    "pong_high_score", "commands_executed", "easter_eggs_found", "tasks_completed", "applications_submitted",
+    "relocation_views"
+)
+# Computed profile stats, each costing a count query
+PROFILE_COMPUTED_FIELDS = {
+    "total_applications": lambda user_id: applications_collection.count_documents({"user_id": user_id}),
+    "total_tasks": lambda user_id: tasks_collection.count_documents({"user_id": user_id}),
+    "completed_tasks": lambda user_id: tasks_collection.count_documents({"user_id": user_id, "status": "completed"}),
+    "unlocked_achievements": lambda user_id: achievements_collection.count_documents(
+        {"user_id": user_id, "unlocked": True}
+    ),
+}
+
+@router.get("/api/user/current")
+async def get_current_user_info(session_token: str):
+    """Get current user information"""
+    user_id = get_current_user(session_token)
+    user = await get_or_create_user(user_id)
+    
+    # Remove sensitive data
+    safe_user = {k: v for k, v in user.items() if k not in ["password_hash", "_id"]}
+    return safe_user
+
+@router.get("/api/dashboard/stats")
+async def get_dashboard_stats(request: Request, response: Response, session_token: str):
+    """Get real user dashboard statistics"""
+    user_id = get_current_user(session_token)
+    not_modified = check_not_modified(request, user_id, "stats")
+    if not_modified:
+        return not_modified
+    user = await get_or_create_user(user_id)
+    
+    # Get real counts
+    total_applications = applications_collection.count_documents({"user_id": user_id})
+    total_tasks = tasks_collection.count_documents({"user_id": user_id})
+    completed_tasks = tasks_collection.count_documents({"user_id": user_id, "status": "completed"})
+    unlocked_achievements = achievements_collection.count_documents({"user_id": user_id, "unlocked": True})
+    
+    # Calculate savings progress
+    current_savings = user.get("current_savings", 0.0)
+    savings_goal = user.get("savings_goal", 5000.0)
+    streak_bonus = user.get("daily_streak", 1) * 25
+    total_savings = current_savings + streak_bonus
+    savings_progress = min((total_savings / savings_goal) * 100, 100)
+    
+    set_resource_etag(response, user_id, "stats")
+    return {
+        "total_applications": total_applications,
+        "interviews_scheduled": applications_collection.count_documents({
+            "user_id": user_id, 
+            "status": {"$in": ["interviewing", "interview_scheduled"]}
+        }),
+        "savings_progress": savings_progress,
+        "tasks_completed_today": completed_tasks,
+        "active_jobs_watching": jobs_collection.count_documents({}),
+        "monthly_savings": total_savings,
+        "days_to_goal": max(1, int((savings_goal - total_savings) / 50)),  # $50 per day goal
+        "skill_development_hours": user.get("productivity_score", 0) / 10,  # Convert points to hours
+        "daily_streak": user.get("daily_streak", 1),
+        "productivity_score": user.get("productivity_score", 0),
+        "achievements_unlocked": unlocked_achievements,
+        "pong_high_score": user.get("pong_high_score", 0),
+        "last_updated": datetime.now().isoformat(),
+        "total_tasks": total_tasks,
+        "completion_rate": (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
+    }
+
+@router.get("/api/user/profile")
+async def get_user_profile(session_token: str, fields: Optional[str] = None):
+    """Get complete user profile, or only the comma separated `fields`"""
+    user_id = get_current_user(session_token)
+    requested = parse_fields(fields, (*PROFILE_STORED_FIELDS, *PROFILE_COMPUTED_FIELDS))
+    stored = requested.intersection(PROFILE_STORED_FIELDS) if requested is not None else None
+    # user_id keeps the projection non-empty when only computed stats are requested
+    user = await get_or_create_user(user_id, fields_projection(stored | {"user_id"}, None) if stored is not None else None)
+    
+    # Remove sensitive fields
+    profile = {k: v for k, v in pick_fields(user, stored).items() if k not in ["password_hash", "_id"]}
+    
+    # Add computed stats
+    for name, compute in PROFILE_COMPUTED_FIELDS.items():
+        if requested is None or name in requested:
+            profile[name] = compute(user_id)
+    
+    return profile
+
+@router.put("/api/user/profile")
+async def update_user_profile(profile_data: dict, session_token: str):
+    """Update user profile"""
+    user_id = get_current_user(session_token)
+    await get_or_create_user(user_id)
+    
+    # Allow only safe fields to be updated
+    allowed_fields = ["username", "email", "savings_goal", "settings"]
+    update_data = {k: v for k, v in profile_data.items() if k in allowed_fields}
+    
+    if update_data:
+        users_collection.update_one(
+            {"user_id": user_id},
+            {"$set": update_data}
+        )
+        resource_versions.bump(user_id, "stats")
+        savings_projections.pop(user_id, None)
+        if "username" in update_data:
+            leaderboards.forget_username(user_id)
+    
+    return {"message": "Profile updated successfully! ✨"}
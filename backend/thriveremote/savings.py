@@ -0,0 +1,26 @@
+"""Savings progress and the cached Monte Carlo projections"""
+from typing import Any, Dict, List, Tuple
+
+from .db import users_collection
+
+# user_id -> (cache key, projection); dropped on update_savings, once its history entry is logged, and on goal changes
+savings_projections: Dict[str, Tuple[Tuple, Dict[str, Any]]] = {}
+
+async def get_monthly_savings_progress(user_id: str) -> List[Dict]:
+    """Get monthly savings progress"""
+    user = users_collection.find_one({"user_id": user_id})
+    current = user.get("current_savings", 0.0)
+    
+    # Simulate monthly progression
+    months = ["Jan 2025", "Feb 2025", "Mar 2025"]
+    progress = []
+    
+    for i, month in enumerate(months):
+        amount = (current / 3) * (i + 1)  # Distribute across months
+        progress.append({
+            "month": month,
+            "amount": round(amount, 2),
+            "streak_days": min(user.get("daily_streak", 1), 31)
+        })
+    
+    return progress
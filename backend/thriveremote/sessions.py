@@ -0,0 +1,101 @@
+"""Password hashing, session tokens and the current-user dependency"""
+from typing import Optional
+from datetime import datetime
+import hashlib
+import secrets
+
+from fastapi import HTTPException
+
+from .context import request_context
+from .db import user_sessions_collection
+
+# Authentication utilities
+def hash_password(password: str) -> str:
+    """Hash password with salt"""
+    salt = secrets.token_hex(16)
+    return hashlib.pbkdf2_hmac('sha256', password.encode(), salt.encode(), 100000).hex() + ':' + salt
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Verify password against hash"""
+    try:
+        stored_hash, salt = password_hash.split(':')
+        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt.encode(), 100000).hex() == stored_hash
+    except:
+        return False
+
+def generate_session_token() -> str:
+    """Generate secure session token"""
+    return secrets.token_urlsafe(32)
+
+# Session management
+active_sessions = {}
+
+def create_session(user_id: str) -> str:
+    """Create new session for user"""
+    token = generate_session_token()
+    active_sessions[token] = {
+        "user_id": user_id,
+        "created_at": datetime.now(),
+        "last_used": datetime.now()
+    }
+    
+    # Store in database
+    user_sessions_collection.insert_one({
+        "token": token,
+        "user_id": user_id,
+        "created_at": datetime.now().isoformat(),
+        "last_used": datetime.now().isoformat(),
+        "active": True
+    })
+    
+    return token
+
+def get_user_from_session(token: str) -> Optional[str]:
+    """Get user ID from session token"""
+    if not token:
+        return None
+        
+    session = active_sessions.get(token)
+    if session:
+        # Update last used
+        session["last_used"] = datetime.now()
+        user_sessions_collection.update_one(
+            {"token": token},
+            {"$set": {"last_used": datetime.now().isoformat()}}
+        )
+        return session["user_id"]
+    
+    # Check database
+    db_session = user_sessions_collection.find_one({"token": token, "active": True})
+    if db_session:
+        # Restore to memory
+        active_sessions[token] = {
+            "user_id": db_session["user_id"],
+            "created_at": datetime.fromisoformat(db_session["created_at"]),
+            "last_used": datetime.now()
+        }
+        return db_session["user_id"]
+    
+    return None
+
+# Helper function to get user from session
+def get_current_user(session_token: str = None):
+    """Dependency to get current user from session"""
+    if not session_token:
+        raise HTTPException(status_code=401, detail="Session token required")
+    
+    context = request_context.get()
+    if context is not None:
+        user_id = context.cached_user_id(session_token)
+        if user_id:
+            return user_id
+    
+    user_id = get_user_from_session(session_token)
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Invalid or expired session")
+    
+    return user_id
+
+def get_session_token_from_request(session_token: str = None):
+    """Extract session token from request"""
+    return session_token
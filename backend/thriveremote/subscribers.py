@@ -0,0 +1,105 @@
+"""Side effects of domain events: points, achievement counters and notifications"""
+from .achievements import achievement_engine
+from .db import applications_collection
+from .events import (
+    AchievementUnlocked, EasterEggFound, event_bus, JobApplied, JobsRefreshed, PongScoreSubmitted,
+    RelocationExplored, SavingsUpdated, StreakUpdated, TaskCompleted, TaskCreated, TasksImported,
+    TerminalCommandExecuted
+)
+from .notifications import notification_hub, pending_applications_notification
+from .savings import savings_projections
+from .users import log_productivity_action
+
+points = event_bus.subscriber("points")
+achievements = event_bus.subscriber("achievements")
+notifications = event_bus.subscriber("notifications")
+
+# Points
+@points.on(TaskCreated)
+async def award_task_created(event: TaskCreated):
+    await log_productivity_action(event.user_id, "task_created", 5, {"task_title": event.task_title})
+
+@points.on(TasksImported)
+async def award_tasks_imported(event: TasksImported):
+    await log_productivity_action(event.user_id, "tasks_imported", 15, {"count": event.count})
+
+@points.on(TaskCompleted)
+async def award_task_completed(event: TaskCompleted):
+    await log_productivity_action(event.user_id, "task_completed", 20, {"task_title": event.task_title})
+
+@points.on(JobApplied)
+async def award_job_applied(event: JobApplied):
+    await log_productivity_action(event.user_id, "job_application", 15, {
+        "job_title": event.job_title,
+        "company": event.company
+    })
+
+@points.on(JobsRefreshed)
+async def award_jobs_refreshed(event: JobsRefreshed):
+    await log_productivity_action(event.user_id, "refresh_jobs", 5, {"jobs_count": event.jobs_count})
+
+@points.on(PongScoreSubmitted)
+async def award_pong_high_score(event: PongScoreSubmitted):
+    if event.score > event.previous_high:
+        await log_productivity_action(event.user_id, "pong_high_score", 15, {"score": event.score})
+
+@points.on(TerminalCommandExecuted)
+async def award_terminal_command(event: TerminalCommandExecuted):
+    await log_productivity_action(event.user_id, "terminal_command", 2, {"command": event.command})
+
+@points.on(EasterEggFound)
+async def award_easter_egg(event: EasterEggFound):
+    points_earned = 50 if event.kind == "konami" else 10
+    await log_productivity_action(event.user_id, "easter_egg", points_earned, {"type": event.kind})
+
+@points.on(SavingsUpdated)
+async def award_savings_update(event: SavingsUpdated):
+    await log_productivity_action(event.user_id, "savings_update", 10, {"amount": event.amount})
+    # Projections read this log; one computed since update_savings dropped the cache lacks the new entry
+    savings_projections.pop(event.user_id, None)
+
+@points.on(AchievementUnlocked)
+async def award_achievement_bonus(event: AchievementUnlocked):
+    await log_productivity_action(event.user_id, "achievement_unlocked", 50, {"achievement_id": event.achievement_id})
+
+# Counters and the achievement rules that watch them
+@achievements.on(TaskCompleted)
+async def count_task_completed(event: TaskCompleted):
+    if not event.previously_completed:
+        await achievement_engine.increment(event.user_id, "tasks_completed")
+
+@achievements.on(JobApplied)
+async def count_job_application(event: JobApplied):
+    await achievement_engine.increment(event.user_id, "applications_submitted")
+
+@achievements.on(TerminalCommandExecuted)
+async def count_terminal_command(event: TerminalCommandExecuted):
+    await achievement_engine.increment(event.user_id, "commands_executed")
+
+@achievements.on(EasterEggFound)
+async def count_easter_egg(event: EasterEggFound):
+    await achievement_engine.increment(event.user_id, "easter_eggs_found")
+
+@achievements.on(RelocationExplored)
+async def count_relocation_view(event: RelocationExplored):
+    await achievement_engine.increment(event.user_id, "relocation_views")
+
+@achievements.on(PongScoreSubmitted)
+async def check_pong_score(event: PongScoreSubmitted):
+    if event.score > event.previous_high:
+        await achievement_engine.observe(event.user_id, "pong_high_score", event.score)
+
+@achievements.on(SavingsUpdated)
+async def check_savings_progress(event: SavingsUpdated):
+    await achievement_engine.observe(event.user_id, "savings_progress", (event.amount / event.savings_goal) * 100)
+
+@achievements.on(StreakUpdated)
+async def check_streak(event: StreakUpdated):
+    await achievement_engine.observe(event.user_id, "daily_streak", event.daily_streak)
+
+# Notifications
+@notifications.on(JobApplied)
+async def notify_pending_applications(event: JobApplied):
+    if notification_hub.has_subscribers(event.user_id):
+        pending_apps = applications_collection.count_documents({"user_id": event.user_id, "status": "applied"})
+        notification_hub.notify(event.user_id, pending_applications_notification(pending_apps))
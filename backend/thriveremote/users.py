@@ -0,0 +1,127 @@
+"""User records, activity tracking and productivity points"""
+from typing import Dict, Optional
+from datetime import datetime, timedelta
+import uuid
+
+from .achievements import initialize_achievements
+from .caching import resource_versions
+from .context import request_context
+from .db import productivity_logs_collection, users_collection
+from .events import event_bus, StreakUpdated
+from .leaderboards import leaderboards
+from .notifications import notification_hub, productivity_notification, streak_notification
+
+PRODUCTIVITY_MILESTONE = 100
+STREAK_MILESTONE = 7
+
+# Initialize default user if not exists
+async def get_or_create_user(user_id: str, projection: Optional[Dict[str, int]] = None) -> Dict:
+    context = request_context.get()
+    if context is not None:
+        cached = context.cached_user(user_id)
+        if cached is not None:
+            # Loaded (and activity recorded) once for the whole batch
+            return cached
+    
+    user = users_collection.find_one({"user_id": user_id}, projection)
+    if user is None:
+        user_data = {
+            "user_id": user_id,
+            "username": f"User_{user_id[-6:]}",
+            "created_date": datetime.now().isoformat(),
+            "last_active": datetime.now().isoformat(),
+            "total_sessions": 1,
+            "productivity_score": 0,
+            "daily_streak": 1,
+            "last_streak_date": datetime.now().date().isoformat(),
+            "savings_goal": 5000.0,
+            "current_savings": 0.0,
+            "settings": {},
+            "achievements_unlocked": 0,
+            "pong_high_score": 0,
+            "commands_executed": 0,
+            "easter_eggs_found": 0,
+            "tasks_completed": 0,
+            "applications_submitted": 0,
+            "relocation_views": 0
+        }
+        users_collection.insert_one(user_data)
+        
+        # Initialize default achievements
+        await initialize_achievements(user_id)
+        
+        user = user_data
+    else:
+        # Update last active and check streak
+        await update_user_activity(user_id)
+    
+    return user
+
+async def update_user_activity(user_id: str):
+    """Update user activity and daily streak"""
+    now = datetime.now()
+    today = now.date().isoformat()
+    
+    user = users_collection.find_one({"user_id": user_id})
+    if user:
+        last_streak_date = user.get("last_streak_date")
+        daily_streak = user.get("daily_streak", 0)
+        
+        if last_streak_date != today:
+            yesterday = (now - timedelta(days=1)).date().isoformat()
+            if last_streak_date == yesterday:
+                # Continue streak
+                daily_streak += 1
+            else:
+                # Reset streak
+                daily_streak = 1
+            
+            users_collection.update_one(
+                {"user_id": user_id},
+                {
+                    "$set": {
+                        "last_active": now.isoformat(),
+                        "daily_streak": daily_streak,
+                        "last_streak_date": today
+                    },
+                    "$inc": {"total_sessions": 1}
+                }
+            )
+            resource_versions.bump(user_id, "stats", "notifications")
+            leaderboards.set_score("daily_streak", user_id, daily_streak)
+            
+            notification_hub.publish(user_id, "stats", {"daily_streak": daily_streak})
+            if daily_streak >= STREAK_MILESTONE:
+                notification_hub.notify(user_id, streak_notification(daily_streak))
+            await event_bus.publish(StreakUpdated(user_id=user_id, daily_streak=daily_streak))
+
+async def log_productivity_action(user_id: str, action: str, points: int, metadata: Dict = {}):
+    """Log user productivity action and award points"""
+    log_entry = {
+        "id": str(uuid.uuid4()),
+        "user_id": user_id,
+        "action": action,
+        "timestamp": datetime.now().isoformat(),
+        "points": points,
+        "metadata": metadata
+    }
+    productivity_logs_collection.insert_one(log_entry)
+    
+    # Update user productivity score, reading it back for the leaderboard
+    from pymongo import ReturnDocument
+    user = users_collection.find_one_and_update(
+        {"user_id": user_id},
+        {"$inc": {"productivity_score": points}},
+        projection={"_id": 0, "productivity_score": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    if user:
+        productivity = user.get("productivity_score", 0)
+        leaderboards.set_score("productivity_score", user_id, productivity)
+        if notification_hub.has_subscribers(user_id):
+            notification_hub.publish(user_id, "stats", {
+                "productivity_score": productivity, "points": points, "action": action
+            })
+            if productivity - points < PRODUCTIVITY_MILESTONE <= productivity:
+                notification_hub.notify(user_id, productivity_notification(productivity))
+    resource_versions.bump(user_id, "stats", "notifications")
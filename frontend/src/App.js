@@ -332,25 +332,37 @@ const App = () => {
 
     const fetchData = async () => {
       try {
-        const [jobsRes, appsRes, savingsRes, tasksRes, statsRes, achievementsRes, notificationsRes] = await Promise.all([
-          fetch(`${BACKEND_URL}/api/jobs?session_token=${sessionToken}`),
-          fetch(`${BACKEND_URL}/api/applications?session_token=${sessionToken}`),
-          fetch(`${BACKEND_URL}/api/savings?session_token=${sessionToken}`),
-          fetch(`${BACKEND_URL}/api/tasks?session_token=${sessionToken}`),
-          fetch(`${BACKEND_URL}/api/dashboard/stats?session_token=${sessionToken}`),
-          fetch(`${BACKEND_URL}/api/achievements?session_token=${sessionToken}`),
-          fetch(`${BACKEND_URL}/api/realtime/notifications?session_token=${sessionToken}`)
-        ]);
-
-        if (jobsRes.ok) setJobs((await jobsRes.json()).jobs);
-        if (appsRes.ok) setApplications((await appsRes.json()).applications);
-        if (savingsRes.ok) setSavings(await savingsRes.json());
-        if (tasksRes.ok) setTasks((await tasksRes.json()).tasks);
-        if (statsRes.ok) setDashboardStats(await statsRes.json());
-        if (achievementsRes.ok) setAchievements((await achievementsRes.json()).achievements);
-        if (notificationsRes.ok) {
-          const notificationData = await notificationsRes.json();
-          setNotifications(prev => [...prev, ...notificationData.notifications]);
+        // One /api/batch call: a single session lookup and user load for all startup data
+        const response = await fetch(`${BACKEND_URL}/api/batch?session_token=${sessionToken}`, {
+          method: 'POST',
+          headers: { 'Content-Type': 'application/json' },
+          body: JSON.stringify({
+            requests: [
+              { id: 'jobs', path: '/api/jobs' },
+              { id: 'applications', path: '/api/applications' },
+              { id: 'savings', path: '/api/savings' },
+              { id: 'tasks', path: '/api/tasks' },
+              { id: 'stats', path: '/api/dashboard/stats' },
+              { id: 'achievements', path: '/api/achievements' },
+              { id: 'notifications', path: '/api/realtime/notifications' }
+            ]
+          })
+        });
+        if (!response.ok) return;
+
+        const results = {};
+        for (const result of (await response.json()).responses) {
+          if (result.status === 200) results[result.id] = result.body;
+        }
+
+        if (results.jobs) setJobs(results.jobs.jobs);
+        if (results.applications) setApplications(results.applications.applications);
+        if (results.savings) setSavings(results.savings);
+        if (results.tasks) setTasks(results.tasks.tasks);
+        if (results.stats) setDashboardStats(results.stats);
+        if (results.achievements) setAchievements(results.achievements.achievements);
+        if (results.notifications) {
+          setNotifications(prev => [...prev, ...results.notifications.notifications]);
         }
       } catch (error) {
         console.error('Error fetching data:', error);
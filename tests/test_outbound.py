@@ -0,0 +1,137 @@
+"""OutboundHTTP retries and circuit breaking against a local stub server"""
+import asyncio
+import os
+import sys
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from thriveremote.outbound import CircuitBreaker, CircuitOpenError, OutboundHTTP
+
+RESET_TIMEOUT = 0.2
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits += 1
+            status = server.statuses.pop(0) if server.statuses else 200
+        if server.delay:
+            time.sleep(server.delay)
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_POST = do_GET
+
+    def log_message(self, format, *args):
+        pass
+
+class OutboundHTTPTest(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+        cls.server.lock = threading.Lock()
+        cls.url = f"http://127.0.0.1:{cls.server.server_address[1]}/jobs"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    async def asyncSetUp(self):
+        self.server.hits = 0
+        self.server.statuses = []
+        self.server.delay = 0
+        self.http = OutboundHTTP()
+        self.http.backoff_base = 0
+        self.breaker = self.http.breakers["127.0.0.1"] = CircuitBreaker(reset_timeout=RESET_TIMEOUT)
+
+    async def asyncTearDown(self):
+        await self.http.close()
+
+    async def open_breaker(self):
+        self.server.statuses = [500] * 5
+        for _ in range(5):
+            response = await self.http.get(self.url, retries=0)
+            self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.breaker.state, "open")
+
+    async def test_retries_503(self):
+        self.server.statuses = [503]
+        response = await self.http.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.hits, 2)
+        self.assertEqual(self.http.metrics["127.0.0.1"]["retries"], 1)
+        self.assertEqual(self.breaker.state, "closed")
+
+    async def test_returns_last_response_when_retries_run_out(self):
+        self.server.statuses = [503] * 3
+        response = await self.http.get(self.url, retries=2)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.hits, 3)
+
+    async def test_does_not_retry_post(self):
+        self.server.statuses = [503]
+        response = await self.http.request("POST", self.url)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.hits, 1)
+
+    async def test_opens_after_five_failures(self):
+        self.server.statuses = [500] * 4
+        for _ in range(4):
+            await self.http.get(self.url, retries=0)
+        self.assertEqual(self.breaker.state, "closed")
+        self.server.statuses = [500]
+        await self.http.get(self.url, retries=0)
+        self.assertEqual(self.breaker.state, "open")
+
+    async def test_open_breaker_raises_without_calling(self):
+        await self.open_breaker()
+        hits = self.server.hits
+        with self.assertRaises(CircuitOpenError):
+            await self.http.get(self.url)
+        self.assertEqual(self.server.hits, hits)
+        self.assertEqual(self.http.metrics["127.0.0.1"]["short_circuited"], 1)
+
+    async def test_recovers_through_half_open(self):
+        await self.open_breaker()
+        await asyncio.sleep(RESET_TIMEOUT)
+        response = await self.http.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.breaker.state, "closed")
+        self.assertEqual(self.breaker.failures, 0)
+
+    async def test_failed_probe_reopens(self):
+        await self.open_breaker()
+        await asyncio.sleep(RESET_TIMEOUT)
+        self.server.statuses = [500]
+        response = await self.http.get(self.url, retries=0)
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(self.breaker.state, "open")
+        with self.assertRaises(CircuitOpenError):
+            await self.http.get(self.url)
+
+    async def test_cancelled_probe_does_not_stick_half_open(self):
+        await self.open_breaker()
+        await asyncio.sleep(RESET_TIMEOUT)
+        self.server.delay = 0.5
+        with self.assertRaises(asyncio.TimeoutError):
+            await asyncio.wait_for(self.http.get(self.url), 0.05)
+        self.assertEqual(self.breaker.state, "open")
+        self.server.delay = 0
+        await asyncio.sleep(RESET_TIMEOUT)
+        response = await self.http.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.breaker.state, "closed")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""Savings rate samples behind the Monte Carlo projection"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+try:
+    import numpy
+except ImportError:  # numpy is only needed once projections are used
+    numpy = None
+
+def update(timestamp: str, amount: float):
+    return {"timestamp": timestamp, "metadata": {"amount": amount}}
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class SavingsRateSamplesTest(unittest.TestCase):
+    def rates(self, history):
+        from thriveremote.projection import savings_rate_samples
+
+        return savings_rate_samples(history).tolist()
+
+    def test_burst_of_updates_is_one_month(self):
+        history = [
+            update("2026-01-31T09:00:00", 1000),
+            update("2026-02-27T09:00:00", 1200),
+            update("2026-02-27T09:01:00", 1250),
+            update("2026-02-27T09:02:00", 1300),
+        ]
+        self.assertEqual(self.rates(history), [300.0])
+
+    def test_gap_is_spread_over_the_months(self):
+        history = [update("2025-11-15T09:00:00", 1000), update("2026-02-03T09:00:00", 1600)]
+        self.assertEqual(self.rates(history), [200.0])
+
+    def test_single_month_has_no_samples(self):
+        history = [update("2026-03-01T09:00:00", 1000), update("2026-03-20T09:00:00", 1400)]
+        self.assertEqual(self.rates(history), [])
+
+    def test_skips_malformed_entries(self):
+        history = [
+            update("2026-01-10T09:00:00", 500),
+            {"timestamp": "2026-02-10T09:00:00", "metadata": {}},
+            update("not a date", 900),
+            update("2026-02-12T09:00:00", 650),
+        ]
+        self.assertEqual(self.rates(history), [150.0])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""/api/relocate/nearby against an in-memory Mongo and a stubbed Relocate Me host"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+try:
+    import mongomock
+except ImportError:  # mongomock is a test-only dependency
+    mongomock = None
+
+class StubResponse:
+    def raise_for_status(self):
+        pass
+
+class StubHTTP:
+    async def get(self, url, **kwargs):
+        return StubResponse()
+
+@unittest.skipUnless(mongomock, "mongomock is not installed")
+class RelocateNearbyTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        import pymongo
+        from fastapi.testclient import TestClient
+
+        cls.real_client = pymongo.MongoClient
+        pymongo.MongoClient = mongomock.MongoClient
+        from thriveremote import db
+        from thriveremote.app import create_app
+        from thriveremote.relocation import relocate_service, relocate_store
+
+        db.close_client()
+        relocate_service.http = StubHTTP()
+        cls.store = relocate_store
+        cls.client = TestClient(create_app(["auth", "relocate"]))
+        cls.client.post("/api/auth/register", json={"username": "nearby", "password": "secret123"})
+        login = cls.client.post("/api/auth/login", json={"username": "nearby", "password": "secret123"})
+        cls.session_token = login.json()["session_token"]
+
+    @classmethod
+    def tearDownClass(cls):
+        import pymongo
+        from thriveremote import db
+
+        db.close_client()
+        pymongo.MongoClient = cls.real_client
+
+    def nearby_ids(self, property_id: str):
+        response = self.client.get("/api/relocate/nearby", params={
+            "session_token": self.session_token, "property_id": property_id, "radius_km": 50
+        })
+        self.assertEqual(response.status_code, 200)
+        return [prop["id"] for prop in response.json()["properties_within_radius"]]
+
+    def test_excludes_origin_property(self):
+        ids = self.nearby_ids("prop_002")
+        self.assertNotIn("prop_002", ids)
+        self.assertEqual(ids, ["prop_003", "prop_001"])
+
+    def test_excludes_origin_property_after_store_ttl(self):
+        before = self.nearby_ids("prop_002")
+        # Expire the store's memory cache so properties are reloaded from Mongo as new objects
+        for data_type in list(self.store._loaded_at):
+            self.store._loaded_at[data_type] = float("-inf")
+        after = self.nearby_ids("prop_002")
+        self.assertNotIn("prop_002", after)
+        self.assertEqual(after, before)
+
+if __name__ == "__main__":
+    unittest.main()